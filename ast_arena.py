@@ -0,0 +1,212 @@
+from __future__ import annotations
+from array import array
+from types import FunctionType, MethodType
+from typing import Any
+
+from ast_nodes import Program
+from ast_serialization import ANNOTATION_FIELDS, NODE_CLASSES, NODE_FIELDS
+
+# Flat representation of a program, for very large inputs. Instead of one python object per node, the nodes live in
+# parallel arrays (kind, lineno, lexpos and the offset of their fields), and refer to their children by index.
+#
+# Every field of a node (apart from its position) takes one 32 bits slot in 'slots', where the 2 low bits are a tag:
+#   - NODE_SLOT:     the rest is the index of the child node
+#   - LIST_SLOT:     the rest is the index of a list, whose items are slots in 'list_items'
+#   - CONSTANT_SLOT: the rest is the index of a value (str, int, float, bool) in 'constants'
+#   - NONE_SLOT
+#
+# NodeView is the lightweight API over the arena: it behaves like the node it stands for (isinstance, attribute
+# access, methods), so MySemantics can walk a flat program without being aware of it. Each access gives a new view
+# and lists returned by a view are copies: to change a list field, assign a new list to it. The optimization passes
+# of MyCompiler keep nodes by id and copy them, so the compiler rebuilds the object tree (to_node) before them.
+
+NODE_SLOT = 0
+LIST_SLOT = 1
+CONSTANT_SLOT = 2
+NONE_SLOT = 3
+
+POSITION_FIELDS = {"lineno", "lexpos"}
+
+_CLASS_KINDS = {cls: kind for kind, cls in enumerate(NODE_CLASSES)}
+_SLOT_FIELDS = {cls: tuple(name for name in NODE_FIELDS[cls] if name not in POSITION_FIELDS) for cls in NODE_CLASSES}
+_SLOT_POSITIONS = {cls: {name: i for i, name in enumerate(_SLOT_FIELDS[cls])} for cls in NODE_CLASSES}
+
+
+class ASTArena:
+    def __init__(self) -> None:
+        self.kinds = array('B')
+        self.linenos = array('i')
+        self.lexposes = array('i')
+        self.field_offsets = array('I')
+
+        self.slots = array('I')
+        self.list_offsets = array('I')
+        self.list_lengths = array('I')
+        self.list_items = array('I')
+
+        self.constants: list[Any] = []
+        self._constant_indexes: dict[tuple[type, Any], int] = {}
+
+        # Annotations added by the semantic analysis, only present for the nodes that have them
+        self.annotations: dict[str, dict[int, Any]] = {name: {} for name in ANNOTATION_FIELDS}
+
+    @staticmethod
+    def from_program(program: Program) -> NodeView:
+        arena = ASTArena()
+        root_slot = arena.add(program)
+        return NodeView(arena, root_slot >> 2)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def add(self, value: Any) -> int:
+        if value is None:
+            return NONE_SLOT
+
+        if isinstance(value, NodeView) and value.arena is self:
+            return value.index << 2 | NODE_SLOT
+
+        if isinstance(value, list):
+            item_slots = [self.add(item) for item in value]
+            list_index = len(self.list_offsets)
+            self.list_offsets.append(len(self.list_items))
+            self.list_lengths.append(len(item_slots))
+            self.list_items.extend(item_slots)
+            return list_index << 2 | LIST_SLOT
+
+        cls = value.__class__
+        if cls not in _CLASS_KINDS:
+            key = (cls, value)
+            constant_index = self._constant_indexes.get(key)
+            if constant_index is None:
+                constant_index = self._constant_indexes[key] = len(self.constants)
+                self.constants.append(value)
+            return constant_index << 2 | CONSTANT_SLOT
+
+        # The children are added first, so that the fields of a node are contiguous in 'slots'
+        field_slots = [self.add(getattr(value, name)) for name in _SLOT_FIELDS[cls]]
+
+        index = len(self.kinds)
+        self.kinds.append(_CLASS_KINDS[cls])
+        self.linenos.append(getattr(value, "lineno", -1))
+        self.lexposes.append(getattr(value, "lexpos", -1))
+        self.field_offsets.append(len(self.slots))
+        self.slots.extend(field_slots)
+
+        for name in ANNOTATION_FIELDS:
+            annotation = getattr(value, name, None)
+            if annotation is not None:
+                self.annotations[name][index] = annotation
+
+        return index << 2 | NODE_SLOT
+
+    def read_slot(self, slot: int) -> Any:
+        tag = slot & 3
+        if tag == NODE_SLOT:
+            return NodeView(self, slot >> 2)
+        if tag == CONSTANT_SLOT:
+            return self.constants[slot >> 2]
+        if tag == LIST_SLOT:
+            list_index = slot >> 2
+            start = self.list_offsets[list_index]
+            return [self.read_slot(item) for item in self.list_items[start: start + self.list_lengths[list_index]]]
+        return None
+
+    def to_node(self, index: int) -> Any:
+        # Rebuilds the object tree under the given node
+        cls = NODE_CLASSES[self.kinds[index]]
+        node = object.__new__(cls)
+        node_dict = node.__dict__
+        offset = self.field_offsets[index]
+
+        for i, name in enumerate(_SLOT_FIELDS[cls]):
+            node_dict[name] = self._slot_to_node(self.slots[offset + i])
+        if "lineno" in NODE_FIELDS[cls]:
+            node_dict["lineno"] = self.linenos[index]
+            node_dict["lexpos"] = self.lexposes[index]
+        for name in ANNOTATION_FIELDS:
+            if name in cls.__dataclass_fields__:
+                node_dict[name] = self.annotations[name].get(index)
+
+        return node
+
+    def _slot_to_node(self, slot: int) -> Any:
+        if slot & 3 == NODE_SLOT:
+            return self.to_node(slot >> 2)
+        if slot & 3 == LIST_SLOT:
+            list_index = slot >> 2
+            start = self.list_offsets[list_index]
+            return [self._slot_to_node(item) for item in self.list_items[start: start + self.list_lengths[list_index]]]
+        return self.read_slot(slot)
+
+
+class NodeView:
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: ASTArena, index: int) -> None:
+        object.__setattr__(self, "arena", arena)
+        object.__setattr__(self, "index", index)
+
+    # Makes isinstance checks against the node classes work on views
+    @property
+    def __class__(self):
+        return NODE_CLASSES[self.arena.kinds[self.index]]
+
+    @property
+    def lineno(self) -> int:
+        return self.arena.linenos[self.index]
+
+    @property
+    def lexpos(self) -> int:
+        return self.arena.lexposes[self.index]
+
+    def __getattr__(self, name: str) -> Any:
+        arena = self.arena
+        index = self.index
+        cls = NODE_CLASSES[arena.kinds[index]]
+
+        position = _SLOT_POSITIONS[cls].get(name)
+        if position is not None:
+            return arena.read_slot(arena.slots[arena.field_offsets[index] + position])
+
+        if name in ANNOTATION_FIELDS and name in cls.__dataclass_fields__:
+            return arena.annotations[name].get(index)
+
+        attribute = getattr(cls, name)
+        if isinstance(attribute, FunctionType):
+            return MethodType(attribute, self)
+        return attribute
+
+    def __setattr__(self, name: str, value: Any):
+        arena = self.arena
+        index = self.index
+        cls = NODE_CLASSES[arena.kinds[index]]
+
+        if name in ANNOTATION_FIELDS and name in cls.__dataclass_fields__:
+            if value is None:
+                arena.annotations[name].pop(index, None)
+            else:
+                arena.annotations[name][index] = value
+            return
+
+        position = _SLOT_POSITIONS[cls].get(name)
+        if position is None:
+            raise AttributeError(f"'{cls.__name__}' node has no field '{name}'")
+        arena.slots[arena.field_offsets[index] + position] = arena.add(value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NodeView):
+            return self.arena is other.arena and self.index == other.index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __str__(self) -> str:
+        return self.__class__.__str__(self)
+
+    def __repr__(self) -> str:
+        return self.__class__.__repr__(self)
+
+    def to_node(self) -> Any:
+        return self.arena.to_node(self.index)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import KW_ONLY, InitVar, dataclass, field
-from typing import Any, Optional, Tuple
+from dataclasses import KW_ONLY, InitVar, dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from program_variables import Symbol
 
 
 @dataclass(kw_only=True)
@@ -37,26 +40,53 @@ class Expression(TrackPosition):
     expr_type: Optional[VariableType] = field(init=False, default=None)
 
     
+# Literals keep their original spelling in 'value' for the error messages, and their typed value, parsed once by the parser
 @dataclass
 class LitInt(Expression):
     value: str
+    int_value: int
 
 @dataclass
 class LitFloat(Expression):
     value: str
+    float_value: float
 
 @dataclass
 class LitChar(Expression):
     value: str
+    char_value: Optional[str]
 
 @dataclass
 class LitBool(Expression):
     value: str
+    bool_value: bool
+
+
+# Small integer literals created by the compiler (and not parsed) have no position, so a single node is shared for each
+# value, by every place of the trees where the passes put it. A LitInt is therefore never changed in place, and no pass
+# identifies a place of the tree by the id of a literal (the replacements of common_subexpressions are operations and
+# table accesses, the keys of loop_invariants.expression_key use the value of literals).
+SMALL_LIT_INT_RANGE = range(-16, 257)
+_small_lit_ints: dict[int, LitInt] = {}
+
+def make_lit_int(value: int) -> LitInt:
+    if value in SMALL_LIT_INT_RANGE and value in _small_lit_ints:
+        return _small_lit_ints[value]
+
+    lit_int = LitInt(str(value), value)
+    lit_int.expr_type = BaseType("entier")
+
+    if value in SMALL_LIT_INT_RANGE:
+        _small_lit_ints[value] = lit_int
+    return lit_int
 
 @dataclass
 class ID(Expression):
     value: str
 
+    # The variable this identifier refers to, resolved once during the semantic analysis
+    binding: Optional[Symbol] = field(init=False, default=None, repr=False, compare=False)
+
     def __post_init__(self, s: Optional[TrackPosition], p: Optional[Any]):
         self.is_assignable = True
         return super().__post_init__(s, p)
@@ -122,14 +152,14 @@ class TableRange:
         return f"{self.start.value}..{self.end.value if self.end is not None else ''}"
 
     def is_equivalent_to(self, other: TableRange) -> bool:
-        if int(self.start.value) != int(other.start.value):
+        if self.start.int_value != other.start.int_value:
             return False
         
         # Yes this is weird, but it works. First I check if both ends are None, in which case we know they are equivalent. 
         if self.end is None or other.end is None:
             return True
 
-        return int(self.end.value) == int(other.end.value)
+        return self.end.int_value == other.end.int_value
 
 
 
@@ -236,6 +266,14 @@ class TantQueStatement(Statement):
     condition: Expression
     statements: list[Statement]
 
+@dataclass
+class TableInitializationStatement(Statement):
+    # Consecutive elements of a table set to constants, starting at the given indexes. Built from a run of
+    # assignments by the table initialization pass, never by the parser.
+    table: ID
+    indexes: list[Expression]
+    values: list[Expression]
+
 @dataclass
 class SiStatement(Statement):
     conditional_blocks: list[ConditionalBlock]
@@ -250,4 +288,23 @@ class ConditionalBlock:
 @dataclass
 class CustomTypeDefinition:
     name: ID
-    attributes: list[VariableDeclaration]
\ No newline at end of file
+    attributes: list[VariableDeclaration]
+
+def iter_child_nodes(node: Any):
+    # The nodes directly under the given one, without the annotations added by the semantic analysis
+    for f in fields(node):
+        if f.name in ("expr_type", "binding"):
+            continue
+
+        value = getattr(node, f.name)
+        if isinstance(value, list):
+            for item in value:
+                if hasattr(item, "__dataclass_fields__"):
+                    yield item
+        elif hasattr(value, "__dataclass_fields__"):
+            yield value
+
+def walk(node: Any):
+    yield node
+    for child in iter_child_nodes(node):
+        yield from walk(child)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+import gc
+import struct
+from dataclasses import fields
+from typing import Any
+
+from ast_nodes import *
+
+# Compact binary format for parsed programs, used to cache them on disk or to send them to another process.
+#
+# Layout:  MAGIC | version (u16) | string table | root value
+#   - the string table is a varint count followed by each string, as a varint length and its utf-8 bytes
+#   - a value starts with a one byte tag: None, False, True, int (zigzag varint), float (8 bytes),
+#     string (varint index in the string table), list (varint length then the items), or a node
+#   - a node's tag is NODE_TAG + the index of its class in NODE_CLASSES, followed by the values of its fields,
+#     positions included, in declaration order
+#
+# Only the parsed tree is encoded: the annotations added by the semantic analysis (expression types and
+# identifier bindings) are left out and have to be computed again after decoding.
+
+MAGIC = b"NF04"
+VERSION = 1
+
+NONE_TAG = 0
+FALSE_TAG = 1
+TRUE_TAG = 2
+INT_TAG = 3
+FLOAT_TAG = 4
+STR_TAG = 5
+LIST_TAG = 6
+NODE_TAG = 16
+
+# The index of a class in this list is part of the format: new classes must be added at the end, and the
+# version bumped if a class or one of its fields is removed or changed.
+NODE_CLASSES: list[type] = [
+    Program, MainAlgorithm, SubAlgorithm, CustomTypeDefinition, VariableDeclaration,
+    BaseType, PtrType, TableType, TableRange,
+    AssignmentStatement, ExpressionStatement, FunctionStatement, PourStatement, TantQueStatement, SiStatement, ConditionalBlock,
+    ID, LitInt, LitFloat, LitChar, LitBool, Operator,
+    SubExpression, AttributeExpression, TableExpression, FunctionExpression,
+    UnaryPlus, UnaryMinus, UnaryDereference, UnaryPointer, UnaryNot,
+    BinaryPlus, BinaryMinus, BinaryTimes, BinaryDivide, BinaryModulo, BinaryEq, BinaryAnd, BinaryOr, BinaryLT, BinaryGT, BinaryLTE, BinaryGTE,
+    TableInitializationStatement,
+]
+
+ANNOTATION_FIELDS = {"expr_type", "binding"}
+
+_CLASS_TAGS = {cls: NODE_TAG + i for i, cls in enumerate(NODE_CLASSES)}
+NODE_FIELDS = {cls: tuple(f.name for f in fields(cls) if f.name not in ANNOTATION_FIELDS) for cls in NODE_CLASSES}
+_CLASS_ANNOTATIONS = {cls: tuple(f.name for f in fields(cls) if f.name in ANNOTATION_FIELDS) for cls in NODE_CLASSES}
+
+_DOUBLE = struct.Struct("<d")
+_VERSION = struct.Struct("<H")
+
+
+class ASTEncoder:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.body = bytearray()
+
+    def encode(self, root: Any) -> bytes:
+        self.write_value(root)
+
+        header = bytearray(MAGIC)
+        header += _VERSION.pack(VERSION)
+        self.write_varint(header, len(self.strings))
+        for string in self.strings:
+            encoded = string.encode("utf-8")
+            self.write_varint(header, len(encoded))
+            header += encoded
+
+        return bytes(header + self.body)
+
+    @staticmethod
+    def write_varint(buffer: bytearray, value: int):
+        while value > 0x7f:
+            buffer.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def write_value(self, value: Any):
+        body = self.body
+
+        # bool is checked before int, as it's a subclass of it
+        if value is None:
+            body.append(NONE_TAG)
+        elif value is True:
+            body.append(TRUE_TAG)
+        elif value is False:
+            body.append(FALSE_TAG)
+        elif isinstance(value, str):
+            body.append(STR_TAG)
+            index = self.strings.setdefault(value, len(self.strings))
+            self.write_varint(body, index)
+        elif isinstance(value, int):
+            body.append(INT_TAG)
+            self.write_varint(body, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            body.append(FLOAT_TAG)
+            body += _DOUBLE.pack(value)
+        elif isinstance(value, list):
+            body.append(LIST_TAG)
+            self.write_varint(body, len(value))
+            for item in value:
+                self.write_value(item)
+        else:
+            cls = type(value)
+            if cls not in _CLASS_TAGS:
+                raise TypeError(f"Can't serialize object of type '{cls.__name__}'")
+
+            body.append(_CLASS_TAGS[cls])
+            node_dict = value.__dict__
+            for field_name in NODE_FIELDS[cls]:
+                self.write_value(node_dict[field_name])
+
+
+class ASTDecoder:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+        self.strings: list[str] = []
+
+    def decode(self) -> Any:
+        if self.data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a serialized NF04 program")
+        self.pos = len(MAGIC)
+
+        version, = _VERSION.unpack_from(self.data, self.pos)
+        self.pos += _VERSION.size
+        if version != VERSION:
+            raise ValueError(f"Unsupported serialization version {version} (expected {VERSION})")
+
+        nb_strings = self.read_varint()
+        for _ in range(nb_strings):
+            length = self.read_varint()
+            self.strings.append(self.data[self.pos: self.pos + length].decode("utf-8"))
+            self.pos += length
+
+        # Decoding only creates new acyclic objects, so there is nothing for the garbage collector to find while it runs.
+        # Pausing it avoids repeatedly scanning the growing tree, which otherwise dominates the decoding time.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.read_value()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def read_varint(self) -> int:
+        data = self.data
+        result = 0
+        shift = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_value(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+
+        if tag >= NODE_TAG:
+            cls = NODE_CLASSES[tag - NODE_TAG]
+
+            # The nodes are rebuilt without calling their constructor, as all their fields are already known
+            node = object.__new__(cls)
+            node_dict = node.__dict__
+            for field_name in NODE_FIELDS[cls]:
+                node_dict[field_name] = self.read_value()
+            for field_name in _CLASS_ANNOTATIONS[cls]:
+                node_dict[field_name] = None
+            return node
+
+        if tag == STR_TAG:
+            return self.strings[self.read_varint()]
+        if tag == LIST_TAG:
+            return [self.read_value() for _ in range(self.read_varint())]
+        if tag == INT_TAG:
+            value = self.read_varint()
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        if tag == NONE_TAG:
+            return None
+        if tag == TRUE_TAG:
+            return True
+        if tag == FALSE_TAG:
+            return False
+        if tag == FLOAT_TAG:
+            value, = _DOUBLE.unpack_from(self.data, self.pos)
+            self.pos += _DOUBLE.size
+            return value
+
+        raise ValueError(f"Invalid tag {tag} at position {self.pos - 1}")
+
+
+def encode_program(program: Program) -> bytes:
+    return ASTEncoder().encode(program)
+
+def decode_program(data: bytes) -> Program:
+    program = ASTDecoder(data).decode()
+    if not isinstance(program, Program):
+        raise ValueError("Serialized data doesn't contain a program")
+    return program
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Any, Optional, cast
+
+from ast_nodes import *
+from data_flow import get_written_symbols
+from program_variables import AlgorithmVariables, ProgramVariables
+from value_ranges import UNKNOWN, ValueRangeAnalysis
+
+# A dimension of a table access: the id of the TableExpression (or TableInitializationStatement), and the position of the index
+IndexKey = tuple[int, int]
+
+
+def find_safe_indexes(program: Program, program_variables: ProgramVariables) -> set[IndexKey]:
+    # The indexes of the table accesses that are always within the range of their dimension, whose check can be
+    # left out of the generated code
+    algorithms: list[tuple[list[Statement], AlgorithmVariables]] = [(program.main_algorithm.statements, program_variables.main_algorithm_variables)]
+    for s_algo in program.sub_algorithms_list:
+        algorithms.append((s_algo.statements, program_variables.sub_algorithm_variables[s_algo.name.value]))
+
+    safe_indexes: set[IndexKey] = set()
+    for statements, algo_variables in algorithms:
+        analysis = SafeIndexAnalysis(statements, algo_variables)
+        analysis.run()
+        safe_indexes |= analysis.safe_indexes
+
+    return safe_indexes
+
+
+class SafeIndexAnalysis:
+    # Bounds the value of each index with the intervals of the value range analysis, which hold anywhere in the
+    # algorithm (once the variables are assigned). Inside a pour loop that doesn't write its variable, the variable is known to be between the start
+    # and the last value before the end, which is tighter than its interval (that covers the value after the loop).
+
+    def __init__(self, statements: list[Statement], algo_variables: AlgorithmVariables) -> None:
+        self.statements = statements
+        self.value_ranges = ValueRangeAnalysis(statements, algo_variables)
+        self.safe_indexes: set[IndexKey] = set()
+
+    def run(self):
+        self.value_ranges.run()
+        self.visit_statements(self.statements)
+
+    def visit_statements(self, statements: list[Statement]):
+        for statement in statements:
+            if isinstance(statement, PourStatement):
+                self.visit_expressions([statement.start, statement.end])
+                self.visit_loop(statement)
+            elif isinstance(statement, TantQueStatement):
+                self.visit_expressions([statement.condition])
+                self.visit_statements(statement.statements)
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    self.visit_expressions([conditional_block.condition])
+                    self.visit_statements(conditional_block.statements)
+                self.visit_statements(statement.default_block)
+            else:
+                self.visit_expressions([statement])
+
+    def visit_loop(self, loop: PourStatement):
+        iterator = loop.variable.binding
+        ranges = self.value_ranges.ranges
+        if iterator is None or ranges.get(iterator) in (None, UNKNOWN) or iterator in get_written_symbols(loop.statements):
+            self.visit_statements(loop.statements)
+            return
+
+        start = self.value_ranges.get_range(loop.start)
+        end = self.value_ranges.get_range(loop.end)
+        if not isinstance(start, tuple) or not isinstance(end, tuple):
+            self.visit_statements(loop.statements)
+            return
+
+        step = loop.step.int_value if loop.step is not None else 1
+        previous_range = ranges[iterator]
+        ranges[iterator] = (start[0], end[1] - 1) if step > 0 else (end[0] + 1, start[1])
+        self.visit_statements(loop.statements)
+        ranges[iterator] = previous_range
+
+    def visit_expressions(self, nodes: list[Any]):
+        for node in nodes:
+            for child in walk(node):
+                if isinstance(child, TableExpression):
+                    self.check_access(child, cast(Optional[TableType], child.table_expression.expr_type), child.indexes)
+                elif isinstance(child, TableInitializationStatement):
+                    self.check_access(child, cast(Optional[TableType], child.table.expr_type), child.indexes)
+
+    def check_access(self, access: TableExpression | TableInitializationStatement, table_type: Optional[TableType], indexes: list[Expression]):
+        if not isinstance(table_type, TableType):
+            return
+        for k, (table_range, index) in enumerate(zip(table_type.ranges, indexes)):
+            if table_range.end is None:
+                continue
+            index_range = self.value_ranges.get_range(index)
+            if isinstance(index_range, tuple) and table_range.start.int_value <= index_range[0] and index_range[1] < table_range.end.int_value:
+                self.safe_indexes.add((id(access), k))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from ast_nodes import FunctionExpression, FunctionStatement, PourStatement, Program, SiStatement, Statement, TableType, TantQueStatement, walk
+from data_flow import get_written_symbols, type_contains_pointer, writes_through_pointer
+from program_variables import ProgramVariables
+
+
+class CallGraph:
+    def __init__(self, program: Program) -> None:
+        self.sub_algorithms = {s_algo.name.value: s_algo for s_algo in program.sub_algorithms_list}
+
+        # The names of the sub-algorithms called by each sub-algorithm
+        self.calls: dict[str, set[str]] = {}
+        for name, s_algo in self.sub_algorithms.items():
+            self.calls[name] = set()
+            for statement in s_algo.statements:
+                for node in walk(statement):
+                    if isinstance(node, (FunctionStatement, FunctionExpression)):
+                        self.calls[name].add(node.name.value)
+
+        self.recursive: set[str] = {name for name in self.sub_algorithms if self.calls_itself(name)}
+
+    def calls_itself(self, name: str) -> bool:
+        to_visit = list(self.calls[name])
+        visited: set[str] = set()
+        while to_visit:
+            called = to_visit.pop()
+            if called == name:
+                return True
+            if called in visited or called not in self.calls:
+                continue
+            visited.add(called)
+            to_visit += self.calls[called]
+
+        return False
+
+    def is_recursive(self, name: str) -> bool:
+        return name in self.recursive
+
+
+def count_statements(statements: list[Statement]) -> int:
+    count = 0
+    for statement in statements:
+        count += 1
+        if isinstance(statement, (PourStatement, TantQueStatement)):
+            count += count_statements(statement.statements)
+        elif isinstance(statement, SiStatement):
+            for conditional_block in statement.conditional_blocks:
+                count += count_statements(conditional_block.statements)
+            count += count_statements(statement.default_block)
+
+    return count
+
+
+def find_pure_sub_algorithms(call_graph: CallGraph, program_variables: ProgramVariables) -> set[str]:
+    # A pure sub-algorithm only changes its outputs, and they only depend on the values of its inputs: it doesn't
+    # write to its table inputs or through a pointer, has no input containing a pointer, and only calls pure
+    # sub-algorithms. Two calls with the same arguments, with nothing written in between, give the same results.
+    custom_types = {custom_type.name.value: custom_type for custom_type in program_variables.custom_types}
+
+    pure: set[str] = set()
+    for name, s_algo in call_graph.sub_algorithms.items():
+        symbols = program_variables.sub_algorithm_variables[name].symbols
+        written = get_written_symbols(s_algo.statements)
+
+        if writes_through_pointer(s_algo.statements):
+            continue
+        if any(type_contains_pointer(input.type, custom_types) for input in s_algo.inputs):
+            continue
+        if any(isinstance(input.type, TableType) and symbols[input.name.value] in written for input in s_algo.inputs):
+            continue
+        pure.add(name)
+
+    # Calling an impure sub-algorithm makes the caller impure, which can make its own callers impure
+    changed = True
+    while changed:
+        changed = False
+        for name in list(pure):
+            if any(called not in pure for called in call_graph.calls[name]):
+                pure.discard(name)
+                changed = True
+
+    return pure
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from typing import Optional, Union
+
+from ast_nodes import BaseType, Expression, FunctionExpression, FunctionStatement, Program, TableType, VariableType, walk
+from call_graph import CallGraph
+from data_flow import get_root_symbol, get_written_symbols, type_contains_pointer, writes_through_pointer
+from program_variables import INPUT_KIND, VARIABLE_KIND, ProgramVariables, Symbol
+
+Call = Union[FunctionStatement, FunctionExpression]
+
+
+class CallingConvention:
+    # Decides how the parameters of each sub-algorithm are passed in C, beyond what its signature implies:
+    #   - 'pointer_inputs': article inputs that are never modified by the sub-algorithm, passed as 'const T *'
+    #     instead of being copied on each call, when every call site gives a variable that can't change during the call
+    #   - 'restrict_parameters': table parameters that can't share memory with another parameter the
+    #     sub-algorithm writes to, at any of its call sites, and can be marked 'restrict'
+
+    def __init__(self, program: Program, program_variables: ProgramVariables, call_graph: CallGraph, struct_inputs_by_pointer: bool, restrict_tables: bool) -> None:
+        self.program_variables = program_variables
+        self.call_graph = call_graph
+        self.custom_types = {custom_type.name.value: custom_type for custom_type in program_variables.custom_types}
+
+        # The calls found in each algorithm, the main algorithm being None
+        self.call_sites: list[tuple[Optional[str], Call]] = []
+        for caller, statements in [(None, program.main_algorithm.statements)] + [(name, s_algo.statements) for name, s_algo in call_graph.sub_algorithms.items()]:
+            for statement in statements:
+                for node in walk(statement):
+                    if isinstance(node, (FunctionStatement, FunctionExpression)):
+                        self.call_sites.append((caller, node))
+
+        self.written_symbols = {name: get_written_symbols(s_algo.statements) for name, s_algo in call_graph.sub_algorithms.items()}
+        self.writes_through_pointer = {name: writes_through_pointer(s_algo.statements) for name, s_algo in call_graph.sub_algorithms.items()}
+
+        self.restrict_parameters: dict[str, set[str]] = {name: set() for name in call_graph.sub_algorithms}
+        self.pointer_inputs: dict[str, set[str]] = {name: set() for name in call_graph.sub_algorithms}
+
+        if struct_inputs_by_pointer:
+            for name, s_algo in call_graph.sub_algorithms.items():
+                symbols = program_variables.sub_algorithm_variables[name].symbols
+                for input in s_algo.inputs:
+                    if self.is_struct(input.type) and symbols[input.name.value] not in self.written_symbols[name]:
+                        self.pointer_inputs[name].add(input.name.value)
+
+        if restrict_tables:
+            self.find_restrict_parameters()
+
+        # Removing a pointer input only removes constraints on the 'restrict' parameters, so they stay valid
+        if struct_inputs_by_pointer:
+            self.find_pointer_inputs()
+
+    def is_struct(self, var_type: VariableType) -> bool:
+        return isinstance(var_type, BaseType) and var_type.value in self.custom_types
+
+    def contains_pointer(self, var_type: VariableType) -> bool:
+        return type_contains_pointer(var_type, self.custom_types)
+
+    def is_pointer_input(self, s_algo_name: str, input_name: str) -> bool:
+        return input_name in self.pointer_inputs[s_algo_name]
+
+    def is_restrict(self, s_algo_name: str, parameter_name: str) -> bool:
+        return parameter_name in self.restrict_parameters[s_algo_name]
+
+
+    def get_referenced_arguments(self, call: Call) -> list[tuple[str, Expression, bool]]:
+        # The arguments of a call that the C function receives by address, with the name of their parameter and
+        # whether the sub-algorithm may write through it
+        s_algo = self.call_graph.sub_algorithms[call.name.value]
+        signature = self.program_variables.sub_algorithm_signatures[call.name.value]
+        written = self.written_symbols[s_algo.name.value]
+        symbols = self.program_variables.sub_algorithm_variables[s_algo.name.value].symbols
+
+        arguments = []
+        for argument, input in zip(call.inputs, s_algo.inputs):
+            if isinstance(input.type, TableType):
+                arguments.append((input.name.value, argument, symbols[input.name.value] in written))
+            elif self.is_pointer_input(s_algo.name.value, input.name.value):
+                arguments.append((input.name.value, argument, False))
+
+        if isinstance(call, FunctionStatement) and not signature.output_as_return:
+            for argument, output in zip(call.outputs, s_algo.outputs):
+                arguments.append((output.name.value, argument, True))
+
+        return arguments
+
+    def is_distinct_object(self, caller: Optional[str], symbol: Optional[Symbol]) -> bool:
+        # Whether a variable of the caller is an object that no other parameter of the caller can refer to
+        if symbol is None:
+            return False
+        if symbol.kind == VARIABLE_KIND or caller is None:
+            return True
+        if isinstance(symbol.type, TableType):
+            return self.is_restrict(caller, symbol.name)
+        if symbol.kind == INPUT_KIND:
+            # Copied on call, or only passed by address when no other parameter can refer to it
+            return True
+        # A single output is a local variable of the C function, the others are pointers
+        return self.program_variables.sub_algorithm_signatures[caller].output_as_return
+
+    def can_reference_argument(self, caller: Optional[str], call: Call, input_index: int) -> bool:
+        # Whether the article given to an input can be passed by address without the sub-algorithm seeing it change
+        # while it writes to its other parameters
+        s_algo = self.call_graph.sub_algorithms[call.name.value]
+        if any(self.contains_pointer(input.type) for input in s_algo.inputs) or self.writes_through_pointer[s_algo.name.value]:
+            return False
+
+        argument = call.inputs[input_index]
+        root = get_root_symbol(argument)
+        if not self.is_distinct_object(caller, root):
+            return False
+
+        for _, other_argument, is_written in self.get_referenced_arguments(call):
+            if is_written and get_root_symbol(other_argument) is root:
+                return False
+
+        return True
+
+    def find_pointer_inputs(self):
+        # An article input is only passed by pointer if it can be at every call site
+        for caller, call in self.call_sites:
+            callee = call.name.value
+            for i, input in enumerate(self.call_graph.sub_algorithms[callee].inputs):
+                if self.is_pointer_input(callee, input.name.value) and not self.can_reference_argument(caller, call, i):
+                    self.pointer_inputs[callee].discard(input.name.value)
+
+    def find_restrict_parameters(self):
+        for name, s_algo in self.call_graph.sub_algorithms.items():
+            if any(self.contains_pointer(input.type) for input in s_algo.inputs):
+                continue
+            for parameter in s_algo.inputs + s_algo.outputs:
+                if isinstance(parameter.type, TableType):
+                    self.restrict_parameters[name].add(parameter.name.value)
+
+        # Each parameter is assumed restrict until a call site contradicts it. As a caller's parameter is only a
+        # distinct object if it is restrict itself, this is repeated until nothing changes.
+        changed = True
+        while changed:
+            changed = False
+            for caller, call in self.call_sites:
+                callee = call.name.value
+                arguments = self.get_referenced_arguments(call)
+                for parameter_name, argument, is_written in arguments:
+                    if parameter_name not in self.restrict_parameters[callee]:
+                        continue
+
+                    root = get_root_symbol(argument)
+                    valid = self.is_distinct_object(caller, root)
+                    for other_name, other_argument, other_is_written in arguments:
+                        if other_name != parameter_name and get_root_symbol(other_argument) is root and (is_written or other_is_written):
+                            valid = False
+
+                    if not valid:
+                        self.restrict_parameters[callee].discard(parameter_name)
+                        changed = True
@@ -0,0 +1,230 @@
+from __future__ import annotations
+from dataclasses import fields
+from typing import Any, Optional, cast
+
+from ast_nodes import *
+from data_flow import get_written_symbols, writes_through_pointer
+from loop_invariants import expression_key, new_id, new_temporary
+from program_variables import AlgorithmVariables, ProgramVariables, Symbol
+
+ADDRESS_KIND = "address"
+INDEX_KIND = "index"
+
+
+def is_pure_index(expression: Expression) -> bool:
+    # Arithmetic on variables and literals, which can't fail and only changes when one of the variables is written
+    for node in walk(expression):
+        if isinstance(node, (BinaryDivide, BinaryModulo)):
+            if not (isinstance(node.right, LitInt) and node.right.int_value != 0):
+                return False
+        elif isinstance(node, (UnaryPointer, UnaryDereference)):
+            return False
+        elif not isinstance(node, (ID, LitInt, LitChar, LitBool, BinaryOperation, UnaryOperation, SubExpression, Operator)):
+            return False
+    return True
+
+def get_variables(expression: Expression) -> set[Symbol]:
+    return {node.binding for node in walk(expression) if isinstance(node, ID) and node.binding is not None}
+
+def replace_expressions(node: Any, replacements: dict[int, Expression]) -> Any:
+    # Puts the replacement of each node found in the dict (by id) in its place, and returns the new node
+    if id(node) in replacements:
+        return replacements[id(node)]
+
+    for f in fields(node):
+        if f.name in ("expr_type", "binding"):
+            continue
+        value = getattr(node, f.name)
+        if isinstance(value, list):
+            setattr(node, f.name, [replace_expressions(item, replacements) if hasattr(item, "__dataclass_fields__") else item for item in value])
+        elif hasattr(value, "__dataclass_fields__"):
+            setattr(node, f.name, replace_expressions(value, replacements))
+    return node
+
+
+class Candidate:
+    # An element address or index computed several times with the same value: the statement computing it first,
+    # the occurrences (with the table access each index occurrence belongs to), and the variables it is computed from
+    def __init__(self, kind: str, statement: Statement, dependencies: set[Symbol]) -> None:
+        self.kind = kind
+        self.statement = statement
+        self.dependencies = dependencies
+        self.occurrences: list[tuple[Expression, Optional[TableExpression]]] = []
+
+
+class CommonSubexpressionPass:
+    # Computes once the addresses of table elements (tab[i + 1]) and the index expressions (i + 1) that are used
+    # several times with the same value. The address is kept in a pointer (_adr0 = &tab[i + 1]) through which the
+    # element is then read and written, and the index in an entier.
+    # A value stays available after the statement computing it, and in the blocks nested after it, until one of the
+    # variables it is computed from may be written: assigned, given as output, changed by a loop, or, for every value,
+    # written through a pointer or by a sub-algorithm that isn't pure.
+    # It runs after the analyses of the calling convention, which would otherwise see the writes through the pointers.
+
+    def __init__(self, program_variables: ProgramVariables, pure_sub_algorithms: set[str], excluded_tables: set[Symbol]) -> None:
+        self.program_variables = program_variables
+        self.pure_sub_algorithms = pure_sub_algorithms
+        # Tables whose elements aren't stored as entiers of the declared type (one table per field, or a smaller integer type)
+        self.excluded_tables = excluded_tables
+        self.nb_addresses = 0
+        self.nb_indexes = 0
+        self.nb_removed_computations = 0
+
+        self.candidates: list[Candidate] = []
+
+    def run(self, program: Program):
+        main_algorithm = program.main_algorithm
+        self.run_on_algorithm(main_algorithm, self.program_variables.main_algorithm_variables)
+        for s_algo in program.sub_algorithms_list:
+            self.run_on_algorithm(s_algo, self.program_variables.sub_algorithm_variables[s_algo.name.value])
+
+    def run_on_algorithm(self, algorithm: MainAlgorithm | SubAlgorithm, algo_variables: AlgorithmVariables):
+        self.candidates = []
+        self.find_candidates(algorithm.statements, {})
+
+        variable_declarations = list(algorithm.variable_declarations)
+        replacements: dict[int, Expression] = {}
+        insertions: dict[int, list[Statement]] = {}
+
+        # The addresses first, as the first access to an element becomes the initialization of its pointer
+        addresses = [candidate for candidate in self.candidates if candidate.kind == ADDRESS_KIND and len(candidate.occurrences) >= 2]
+        replaced_accesses: set[int] = set()
+        for candidate in addresses:
+            replaced_accesses.update(id(occurrence) for occurrence, _ in candidate.occurrences[1:])
+
+        # An index is still computed if its table access isn't replaced, or is the initialization of a pointer
+        for candidate in self.candidates:
+            if candidate.kind != INDEX_KIND:
+                continue
+            occurrences = [occurrence for occurrence, access in candidate.occurrences if id(access) not in replaced_accesses]
+            if len(occurrences) < 2:
+                continue
+
+            first_occurrence = occurrences[0]
+            temporary = new_temporary(algo_variables, variable_declarations, "_idx", cast(VariableType, first_occurrence.expr_type), first_occurrence)
+            insertions.setdefault(id(candidate.statement), []).append(AssignmentStatement(temporary, first_occurrence, s=first_occurrence))
+            for occurrence in occurrences:
+                replacements[id(occurrence)] = new_id(temporary)
+            self.nb_indexes += 1
+            self.nb_removed_computations += len(occurrences) - 1
+
+        for candidate in addresses:
+            first_access = cast(TableExpression, candidate.occurrences[0][0])
+            element_type = cast(VariableType, first_access.expr_type)
+            temporary = new_temporary(algo_variables, variable_declarations, "_adr", PtrType(element_type), first_access)
+
+            first_access.indexes = [replace_expressions(index, replacements) for index in first_access.indexes]
+            address = UnaryPointer(first_access, Operator("&", s=first_access), s=first_access)
+            address.expr_type = temporary.expr_type
+            insertions.setdefault(id(candidate.statement), []).append(AssignmentStatement(temporary, address, s=first_access))
+
+            for occurrence, _ in candidate.occurrences:
+                dereference = UnaryDereference(new_id(temporary), Operator("^", s=occurrence), s=occurrence)
+                dereference.expr_type = element_type
+                element = SubExpression(dereference, s=occurrence)
+                element.expr_type = element_type
+                replacements[id(occurrence)] = element
+            self.nb_addresses += 1
+            self.nb_removed_computations += len(candidate.occurrences) - 1
+
+        if replacements:
+            algorithm.statements = self.rewrite_statements(algorithm.statements, replacements, insertions)
+        algorithm.variable_declarations = variable_declarations
+
+    def rewrite_statements(self, statements: list[Statement], replacements: dict[int, Expression], insertions: dict[int, list[Statement]]) -> list[Statement]:
+        result: list[Statement] = []
+        for statement in statements:
+            result += insertions.get(id(statement), [])
+
+            # The nested blocks are rewritten apart, as the inserted assignments must keep their expressions
+            if isinstance(statement, (PourStatement, TantQueStatement)):
+                statement.statements = self.rewrite_statements(statement.statements, replacements, insertions)
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    conditional_block.condition = replace_expressions(conditional_block.condition, replacements)
+                    conditional_block.statements = self.rewrite_statements(conditional_block.statements, replacements, insertions)
+                statement.default_block = self.rewrite_statements(statement.default_block, replacements, insertions)
+            else:
+                statement = replace_expressions(statement, replacements)
+
+            result.append(statement)
+
+        return result
+
+
+    def find_candidates(self, statements: list[Statement], available: dict[Any, Candidate]):
+        # Records the occurrences of the values, given those available before the statements
+        for statement in statements:
+            for expression in self.get_evaluated_expressions(statement):
+                self.find_in_expression(expression, statement, available)
+
+            # The nested blocks start with what is available after the statement's own expressions
+            if isinstance(statement, SiStatement):
+                block_available = dict(available)
+                for i, conditional_block in enumerate(statement.conditional_blocks):
+                    if i > 0 and any(isinstance(node, FunctionExpression) for node in walk(conditional_block.condition)):
+                        block_available = {}
+                    self.find_candidates(conditional_block.statements, dict(block_available))
+                self.find_candidates(statement.default_block, dict(block_available))
+            elif isinstance(statement, (PourStatement, TantQueStatement)):
+                self.find_candidates(statement.statements, self.still_available(available, statement))
+
+            available = self.still_available(available, statement)
+
+    def get_evaluated_expressions(self, statement: Statement) -> list[Expression]:
+        # The expressions of a statement evaluated once, when it runs (not the repeated conditions of loops)
+        if isinstance(statement, AssignmentStatement):
+            return [statement.left, statement.right]
+        if isinstance(statement, FunctionStatement):
+            return statement.inputs + cast(list[Expression], statement.outputs)
+        if isinstance(statement, SiStatement):
+            return [statement.conditional_blocks[0].condition]
+        return []
+
+    def still_available(self, available: dict[Any, Candidate], statement: Statement) -> dict[Any, Candidate]:
+        # What is available after the statement, or in a loop's block, where the values may have been changed by a previous iteration
+        if writes_through_pointer([statement]):
+            return {}
+        if any(isinstance(node, (FunctionStatement, FunctionExpression)) and node.name.value not in self.pure_sub_algorithms for node in walk(statement)):
+            return {}
+
+        written = get_written_symbols([statement])
+        return {key: candidate for key, candidate in available.items() if not candidate.dependencies & written}
+
+    def find_in_expression(self, expression: Expression, statement: Statement, available: dict[Any, Candidate]):
+        for node in walk(expression):
+            if not isinstance(node, TableExpression):
+                continue
+
+            if self.is_address_candidate(node):
+                self.add_occurrence(ADDRESS_KIND, node, None, statement, available)
+
+            for index in node.indexes:
+                if isinstance(index, BinaryOperation) and is_pure_index(index) and get_variables(index):
+                    self.add_occurrence(INDEX_KIND, index, node, statement, available)
+
+    def is_address_candidate(self, expression: TableExpression) -> bool:
+        # A whole element of a table variable, at indexes computed from variables
+        table = expression.table_expression
+        if not isinstance(table, ID) or table.binding is None or table.binding in self.excluded_tables:
+            return False
+
+        table_type = table.binding.type
+        if not isinstance(table_type, TableType) or len(expression.indexes) != len(table_type.ranges) or isinstance(table_type.type, TableType):
+            return False
+
+        return all(is_pure_index(index) for index in expression.indexes) and any(get_variables(index) for index in expression.indexes)
+
+    def add_occurrence(self, kind: str, expression: Expression, access: Optional[TableExpression], statement: Statement, available: dict[Any, Candidate]):
+        key = (kind, expression_key(expression))
+        if key not in available:
+            # An address only depends on the indexes, writing to the element doesn't move it
+            if isinstance(expression, TableExpression):
+                dependencies = set().union(*(get_variables(index) for index in expression.indexes))
+            else:
+                dependencies = get_variables(expression)
+            candidate = Candidate(kind, statement, dependencies)
+            available[key] = candidate
+            self.candidates.append(candidate)
+
+        available[key].occurrences.append((expression, access))
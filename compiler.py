@@ -1,9 +1,30 @@
-from typing import Optional, Tuple, cast
-from ast_nodes import ID, AssignmentStatement, AttributeExpression, BaseType, BinaryOperation, CustomTypeDefinition, Expression, FunctionExpression, FunctionStatement, LitBool, LitChar, LitFloat, LitInt, MainAlgorithm, PourStatement, Program, PtrType, SiStatement, Statement, SubAlgorithm, SubExpression, TableExpression, TableRange, TableType, TantQueStatement, UnaryOperation, VariableDeclaration, VariableType
+import hashlib
+from collections import OrderedDict
+from types import CodeType
+from typing import Any, Optional, Tuple, cast
+from ast_arena import NodeView
+from ast_nodes import ID, AssignmentStatement, AttributeExpression, BaseType, BinaryOperation, CustomTypeDefinition, Expression, FunctionExpression, FunctionStatement, LitBool, LitChar, LitFloat, LitInt, MainAlgorithm, Operator, PourStatement, Program, PtrType, SiStatement, Statement, SubAlgorithm, SubExpression, TableExpression, TableInitializationStatement, TableRange, TableType, TantQueStatement, UnaryOperation, VariableDeclaration, VariableType, walk
+from bounds_checks import IndexKey, find_safe_indexes
+from call_graph import CallGraph, count_statements, find_pure_sub_algorithms
+from calling_convention import CallingConvention
+from common_subexpressions import CommonSubexpressionPass
+from compiler_options import CompilerOptions
+from constant_folding import ConstantFoldingPass
+from data_flow import get_written_symbols
 from lexer import MyLexer
+from loop_interchange import LoopInterchangePass
+from loop_unrolling import LoopUnrollingPass
+from loop_invariants import LoopInvariantHoistingPass
+from parallel_loops import ParallelLoop, find_parallel_loops, find_vectorizable_loops, mentions
 from parser import MyParser
-from program_variables import ProgramVariables
+from program_variables import INPUT_KIND, OUTPUT_KIND, AlgorithmVariables, ProgramVariables, SubAlgorithmSignature, Symbol
+from python_backend import PythonCodeGenerator
 from semantics import MySemantics
+from struct_layout import StructLayout, get_type_layout
+from struct_of_arrays import find_struct_of_arrays_tables
+from table_initialization import TableInitializationPass, get_flat_index
+from tail_calls import find_tail_calls, get_self_call, is_parameter
+from value_ranges import COMPACT_TYPE_SIZES, find_compact_tables
 
 class MyCompiler:
 
@@ -14,15 +35,110 @@ class MyCompiler:
         "booléen"  : "bool"
     }
 
-    def __init__(self, lexer: Optional[MyLexer] = None, parser: Optional[MyParser] = None, debug = False) -> None:
+    C_OPERATOR_EQUIV = {
+        "="  : "==",
+        "et" : "&&",
+        "ou" : "||",
+        "non": "!",
+        "^"  : "*",
+    }
+
+    # Gives back the index, or stops the program when it is out of the range of its dimension (end excluded)
+    BOUNDS_CHECK_FUNCTION = """static inline int _verifier_indice(int indice, int debut, int fin, int ligne) {
+  if (indice < debut || indice >= fin) {
+    dprintf(2, "Ligne %d : l'indice %d est hors des bornes %d..%d du tableau\\n", ligne, indice, debut, fin);
+    exit(1);
+  }
+  return indice;
+}
+"""
+
+    # Allocates a large table on the heap, or stops the program with the NF04 line of its declaration when there isn't
+    # enough memory left
+    ALLOCATION_FUNCTION = """static inline void *_allouer_tableau(size_t taille, int ligne) {
+  void *tableau = malloc(taille);
+  if (tableau == NULL) {
+    dprintf(2, "Ligne %d : mémoire insuffisante pour allouer un tableau de %zu octets\\n", ligne, taille);
+    exit(1);
+  }
+  return tableau;
+}
+"""
+
+    # The functions of the C library the generated code calls. Only these are declared: the headers declaring them
+    # would also declare the rest of the library, which clashes with the sub-algorithms of the same names (div, abs...)
+    LIBRARY_DECLARATIONS = {
+        "malloc" : "void *malloc(size_t size);",
+        "free"   : "void free(void *pointer);",
+        "memcpy" : "void *memcpy(void *destination, const void *source, size_t size);",
+        "exit"   : "void exit(int status);",
+        # Writes to the error output (file descriptor 2), without the FILE of stdio.h
+        "dprintf": "int dprintf(int fd, const char *format, ...);",
+    }
+
+    # The python code objects of the programs already compiled, with the report of their compilation, by hash of
+    # their source and by options. Beyond PYTHON_CODE_CACHE_SIZE programs, the least recently used one is dropped.
+    PYTHON_CODE_CACHE_SIZE = 64
+    _python_code_cache: OrderedDict[tuple[str, bool], tuple[CodeType, dict[str, Any]]] = OrderedDict()
+
+    def __init__(self, lexer: Optional[MyLexer] = None, parser: Optional[MyParser] = None, debug = False, options: Optional[CompilerOptions] = None) -> None:
         if parser is None:
             if lexer is None: lexer = MyLexer()
             parser = MyParser(lexer, debug=debug)
 
         self.parser = parser
+        self.options = options if options is not None else CompilerOptions()
 
         self.program_variables: ProgramVariables
         self._requires_bool = False
+        self._library_functions: set[str] = set()
+        self._requires_stdint = False
+        self._requires_bounds_check = False
+        self._requires_allocation = False
+        self._nb_table_initializations = 0
+
+        # What the optional passes did, by pass name
+        self.report: dict[str, Any] = {}
+
+        # The sub-algorithm being generated (None for the main algorithm), and the names of its parameters that are pointers
+        self._current_s_algo: Optional[str] = None
+        self._pointer_outputs: set[str] = set()
+        self._pointer_inputs: set[str] = set()
+
+        # While generating an inlined sub-algorithm, what each of its variables is replaced by
+        self._inlined_symbols: dict[Symbol, str] = {}
+        # and the sizes of the open dimensions of its table parameters, which the call would pass
+        self._inlined_table_sizes: dict[Symbol, list[str]] = {}
+
+        # Tables of articles stored as one table per field
+        self._struct_of_arrays_tables: set[Symbol] = set()
+
+        # Tables with a non-zero lower bound, indexed through a pointer shifted by that bound
+        self._rebased_tables: set[Symbol] = set()
+
+        # Tables of entiers whose values fit in a smaller integer type, with the C type of their elements
+        self._compact_tables: dict[Symbol, str] = {}
+
+        # Size and alignment of the article types, and the tables allocated on the heap by the function being generated
+        self._type_layouts: dict[str, tuple[int, int]] = {}
+        self._allocated_tables: list[str] = []
+
+        self._pure_sub_algorithms: set[str] = set()
+
+        # The table indexes whose bounds check is left out, as they are always within the range of their dimension
+        self._safe_indexes: set[IndexKey] = set()
+        self._nb_bounds_checks = 0
+        self._nb_eliminated_bounds_checks = 0
+
+        # The calls of each sub-algorithm to itself generated as a jump to its start (by id of the statement)
+        self._tail_calls: dict[str, set[int]] = {}
+
+        # The pour loops run by several threads (by id), and whether the code being generated is inside one
+        self._parallel_loops: dict[int, ParallelLoop] = {}
+        self._in_parallel_loop = False
+
+        # The innermost pour loops whose iterations can be computed together by SIMD instructions (by id)
+        self._vectorizable_loops: set[int] = set()
 
     def compile(self, source_code) -> Tuple[str, list]:
         # Add an extra line return if there isn't one at the end
@@ -40,22 +156,180 @@ class MyCompiler:
         if errors is not None:
             return "", errors
 
-        
+        # The passes keep nodes by id and copy them, which the views of a flat program don't support: they work on
+        # the object tree, rebuilt with the annotations of the semantic analysis
+        if isinstance(program, NodeView):
+            program = program.to_node()
+
         self.program_variables = cast(ProgramVariables, program_variables)
         self.program = program
+        self.report = {}
+        self._nb_table_initializations = 0
+
+        if self.options.constant_folding:
+            constant_folding = ConstantFoldingPass()
+            constant_folding.run(program)
+            self.report["constant_folding"] = constant_folding.nb_removed_nodes
+
+        if self.options.table_initialization_threshold is not None:
+            table_initialization = TableInitializationPass(self.options.table_initialization_threshold)
+            table_initialization.run(program)
+            self.report["table_initialization"] = table_initialization.nb_coalesced_stores
+
+        self.call_graph = CallGraph(program)
+        self._pure_sub_algorithms = find_pure_sub_algorithms(self.call_graph, self.program_variables)
+        # Before the hoisting of invariants, which puts statements between nested loops
+        if self.options.interchange_loops:
+            distinct_parameters = CallingConvention(program, self.program_variables, self.call_graph, False, True).restrict_parameters
+            loop_interchange = LoopInterchangePass(self._pure_sub_algorithms, distinct_parameters)
+            loop_interchange.run(program)
+            self.report["loop_interchange"] = loop_interchange.interchanged_nests
+
+        # After the interchange, which needs the loops, and before the hoisting of invariants out of the unrolled loops
+        if self.options.full_unroll_threshold is not None or self.options.unroll_factor is not None:
+            loop_unrolling = LoopUnrollingPass(self.options.full_unroll_threshold, self.options.unroll_factor)
+            loop_unrolling.run(program)
+            self.report["loop_unrolling"] = {"full": loop_unrolling.nb_full_unrolls, "partial": loop_unrolling.nb_partial_unrolls}
+
+        if self.options.hoist_loop_invariants:
+            loop_invariants = LoopInvariantHoistingPass(self.program_variables, self._pure_sub_algorithms)
+            loop_invariants.run(program)
+            self.report["loop_invariants"] = {"bounds": loop_invariants.nb_hoisted_bounds, "expressions": loop_invariants.nb_hoisted_expressions}
+
+        self._struct_of_arrays_tables = set()
+        if self.options.struct_of_arrays:
+            self._struct_of_arrays_tables = find_struct_of_arrays_tables(program, self.program_variables)
+            self.report["struct_of_arrays"] = sorted(symbol.name for symbol in self._struct_of_arrays_tables)
+
+        self._rebased_tables = set()
+        if self.options.rebase_tables:
+            self._rebased_tables = self.find_rebased_tables()
+            self.report["rebased_tables"] = sorted(symbol.name for symbol in self._rebased_tables)
+
+        self._compact_tables = {}
+        if self.options.compact_tables:
+            self._compact_tables = find_compact_tables(program, self.program_variables)
+            self.report["compact_tables"] = {symbol.name: type_name for symbol, type_name in sorted(self._compact_tables.items(), key=lambda item: item[0].name)}
+
+        # The vectorized loops need to know that the table parameters don't share memory, as the C compiler does
+        restrict_tables = self.options.restrict_tables or self.options.vectorize_loops
+        self.calling_convention = CallingConvention(program, self.program_variables, self.call_graph, self.options.struct_inputs_by_pointer, restrict_tables)
+
+        # Before the passes adding pointers, which would hide the accesses to the tables
+        self._parallel_loops = {}
+        self._vectorizable_loops = set()
+        if self.options.parallelize_loops or self.options.vectorize_loops:
+            calling_convention = self.calling_convention
+            if not restrict_tables:
+                calling_convention = CallingConvention(program, self.program_variables, self.call_graph, False, True)
+            if self.options.parallelize_loops:
+                self._parallel_loops = find_parallel_loops(program, self._pure_sub_algorithms, calling_convention.restrict_parameters)
+                self.report["parallel_loops"] = len(self._parallel_loops)
+            if self.options.vectorize_loops:
+                self._vectorizable_loops = find_vectorizable_loops(program, self._pure_sub_algorithms, calling_convention.restrict_parameters)
+                self.report["vectorizable_loops"] = len(self._vectorizable_loops)
+
+        self._tail_calls = {}
+        if self.options.eliminate_tail_calls:
+            self._tail_calls = find_tail_calls(program, self.program_variables, self.calling_convention.pointer_inputs)
+            self.report["tail_calls"] = {name: len(calls) for name, calls in sorted(self._tail_calls.items())}
+
+        # Before the passes adding pointers and temporaries, which would hide the values of the indexes
+        self._safe_indexes = set()
+        if self.options.check_bounds:
+            self._safe_indexes = find_safe_indexes(program, self.program_variables)
+
+        if self.options.eliminate_common_subexpressions:
+            common_subexpressions = CommonSubexpressionPass(self.program_variables, self._pure_sub_algorithms, self._struct_of_arrays_tables | set(self._compact_tables))
+            common_subexpressions.run(program)
+            self.report["common_subexpressions"] = {"addresses": common_subexpressions.nb_addresses, "indexes": common_subexpressions.nb_indexes, "removed": common_subexpressions.nb_removed_computations}
+
+        self._nb_bounds_checks = 0
+        self._nb_eliminated_bounds_checks = 0
         code = self.generate_code()
+        if self.options.check_bounds:
+            self.report["bounds_checks"] = {"checked": self._nb_bounds_checks, "eliminated": self._nb_eliminated_bounds_checks}
 
         return code, []
 
+    def compile_to_python(self, source_code) -> Tuple[Optional[CodeType], list]:
+        # The program as python bytecode, run in the interpreter with python_backend.run_code instead of going through C
+        if source_code[-1] != "\n":
+            source_code += "\n"
+
+        cache_key = (hashlib.sha256(source_code.encode()).hexdigest(), self.options.numpy_tables)
+        if cache_key in self._python_code_cache:
+            self._python_code_cache.move_to_end(cache_key)
+            code, report = self._python_code_cache[cache_key]
+            self.report = dict(report)
+            return code, []
+
+        program = self.parser.parse(source_code)
+        if self.parser.syntax_errors:
+            return None, self.parser.syntax_errors
+
+        semantics = MySemantics(self.parser)
+        program_variables, errors = semantics.verify_program_and_get_variables_or_errors(program)
+        if errors is not None:
+            return None, errors
+
+        if isinstance(program, NodeView):
+            program = program.to_node()
+
+        generator = PythonCodeGenerator(program, cast(ProgramVariables, program_variables), self.options.numpy_tables)
+        code = compile(generator.generate_module(), "<algorithme>", "exec")
+        self.report = {}
+        if self.options.numpy_tables:
+            self.report["vectorized_loops"] = generator.nb_vectorized_loops
+        self._python_code_cache[cache_key] = (code, dict(self.report))
+        if len(self._python_code_cache) > self.PYTHON_CODE_CACHE_SIZE:
+            self._python_code_cache.popitem(last=False)
+        return code, []
+
     def generate_code(self) -> str:
         result = ""
-        result += self.custom_types_to_str(self.program.main_algorithm.type_definitions) + "\n"
+        self.struct_layout: Optional[StructLayout] = None
+        if self.options.reorder_struct_fields:
+            self.struct_layout = StructLayout(self.program_variables.custom_types)
+            self.report["struct_layout"] = self.struct_layout.get_size_savings()
+            self._type_layouts = self.struct_layout.layouts
+        else:
+            self._type_layouts = StructLayout(self.program_variables.custom_types).original_layouts
+
+        result += self.custom_types_to_str(self.program_variables.custom_types) + "\n"
+
+        # Prototypes, as the sub-algorithms are defined after the main algorithm
+        for s_algo in self.program.sub_algorithms_list:
+            result += self.s_algo_header_to_str(s_algo) + ";\n"
+        if self.program.sub_algorithms_list:
+            result += "\n"
+
         result += self.main_algo_to_str(self.program.main_algorithm)
         for s_algo in self.program.sub_algorithms_list:
-            result += self.s_algo_to_str(s_algo)
-        
+            result += "\n" + self.s_algo_to_str(s_algo)
+
+        if self._requires_bounds_check:
+            self._library_functions |= {"exit", "dprintf"}
+            result = self.BOUNDS_CHECK_FUNCTION + "\n" + result
+
+        if self._requires_allocation:
+            self._library_functions |= {"malloc", "exit", "dprintf"}
+            result = self.ALLOCATION_FUNCTION + "\n" + result
+
+        if self._library_functions:
+            declarations = [declaration for name, declaration in self.LIBRARY_DECLARATIONS.items() if name in self._library_functions]
+            result = "\n".join(declarations) + "\n" + result
+
+        headers = []
+        if self._requires_stdint:
+            headers.append("stdint.h")
+        if self._library_functions:
+            # For size_t
+            headers.append("stddef.h")
         if self._requires_bool:
-            result = "#include <stdbool.h>\n\n" + result
+            headers.append("stdbool.h")
+        if headers:
+            result = "".join(f"#include <{header}>\n" for header in headers) + "\n" + result
             
         return result
 
@@ -66,8 +340,12 @@ class MyCompiler:
     def custom_type_to_str(self, custom_type: CustomTypeDefinition) -> str:
         result = ""
         type_name = custom_type.name.value
+        attributes = custom_type.attributes
+        if self.struct_layout is not None:
+            attributes = self.struct_layout.attributes[type_name]
+
         result += f"typedef struct {{ \n"
-        result += self.indent_str(self.variable_declarations_list_to_str(custom_type.attributes)) + "\n"
+        result += self.indent_str(self.variable_declarations_list_to_str(attributes)) + "\n"
         result += f"}} {type_name};\n"
 
         return result
@@ -76,10 +354,22 @@ class MyCompiler:
         result = ""
         result += "void main() { \n"
 
-        var_str = self.variable_declarations_list_to_str(main_algo.variable_declarations)
-        var_str = self.indent_str(var_str)
-
-        statements_str = self.statement_list_to_str(main_algo.statements)
+        # The tables initialized before anything else are initialized in their declaration
+        statements = main_algo.statements
+        initializers: dict[str, str] = {}
+        while statements and self.is_declaration_initializer(statements[0], initializers):
+            initialization = cast(TableInitializationStatement, statements[0])
+            initializers[initialization.table.value] = self.table_initializer_to_str(initialization)
+            statements = statements[1:]
+
+        variable_declarations = self.local_declarations(main_algo.variable_declarations, self.program_variables.main_algorithm_variables)
+        var_strs = []
+        for var_decl in variable_declarations:
+            end = f" = {initializers[var_decl.name.value]};" if var_decl.name.value in initializers else ";"
+            var_strs += self.local_declaration_to_strs(var_decl, self.program_variables.main_algorithm_variables, end)
+        var_str = self.indent_str("\n".join(var_strs))
+
+        statements_str = self.statement_list_to_str(statements)
         statements_str = self.indent_str(statements_str)
 
         result += var_str + "\n\n" 
@@ -90,47 +380,84 @@ class MyCompiler:
         return result
 
 
-    def s_algo_to_str(self, s_algo: SubAlgorithm) -> str:
-        result = ""
+    def s_algo_header_to_str(self, s_algo: SubAlgorithm) -> str:
+        s_algo_name = s_algo.name.value
+        signature = self.program_variables.sub_algorithm_signatures[s_algo_name]
         parameters = []
-        for input in s_algo.inputs:
-            i = 0
-            parameters.append(self.variable_declaration_to_str(input, end=""))
-            if isinstance(input.type, TableType):
-                for range in input.type.ranges:
-                    if range.end is None:
-                        parameters.append(f"int _{input.name.value}_{i}")
-                        i += 1
-        
-        output_as_return = False
-
-        # Only add outputs to the parameters if there are more than one, or if the output a table
-        if len(s_algo.outputs) > 1 or isinstance(s_algo.outputs[0].type, TableType):
-            for output in s_algo.outputs:
-                i = 0
-                if isinstance(output.type, TableType):
-                    parameters.append(self.variable_declaration_to_str(output, end=""))
-                    for range in output.type.ranges:
-                        if range.end is None:
-                            parameters.append(f"int _{output.name.value}_{i}")
-                            i += 1
-                else:
-                    output_as_pointer = VariableDeclaration(output.name, PtrType(output.type))
-                    parameters.append(self.variable_declaration_to_str(output_as_pointer))
-        else:
-            output_as_return = True
 
-        s_algo_name = s_algo.name.value
+        # The sizes of the open-ended dimensions of a table come before it, as they are used in its declaration
+        for input, open_dimensions in zip(s_algo.inputs, signature.input_open_dimensions):
+            for i in range(len(open_dimensions)):
+                parameters.append(f"int _{input.name.value}_{i}")
 
-        if output_as_return:
-            output_type = s_algo.outputs[0].type
-            return_type_str = self.return_type_to_str(output_type)
+            if self.calling_convention.is_pointer_input(s_algo_name, input.name.value):
+                input_as_pointer = VariableDeclaration(input.name, PtrType(input.type))
+                parameters.append("const " + self.variable_declaration_to_str(input_as_pointer, end=""))
+            else:
+                restrict = self.calling_convention.is_restrict(s_algo_name, input.name.value)
+                parameters.append(self.parameter_declaration_to_str(s_algo_name, input, restrict))
+
+        # Outputs are only added to the parameters if there are more than one, or if the output is a table
+        for output, open_dimensions, as_pointer in zip(s_algo.outputs, signature.output_open_dimensions, signature.outputs_as_pointer):
+            if as_pointer:
+                output_as_pointer = VariableDeclaration(output.name, PtrType(output.type))
+                parameters.append(self.variable_declaration_to_str(output_as_pointer, end=""))
+            elif not signature.output_as_return:
+                for i in range(len(open_dimensions)):
+                    parameters.append(f"int _{output.name.value}_{i}")
+                restrict = self.calling_convention.is_restrict(s_algo_name, output.name.value)
+                parameters.append(self.parameter_declaration_to_str(s_algo_name, output, restrict))
+
+        if signature.output_as_return:
+            return_type_str = self.return_type_to_str(signature.output_types[0])
         else:
             return_type_str = "void"
 
-        result += f"{return_type_str} {s_algo_name} ({', '.join(parameters)}){{"
+        return f"{return_type_str} {s_algo_name} ({', '.join(parameters)})"
 
-        
+    def s_algo_to_str(self, s_algo: SubAlgorithm) -> str:
+        result = ""
+        signature = self.program_variables.sub_algorithm_signatures[s_algo.name.value]
+
+        self._current_s_algo = s_algo.name.value
+        self._pointer_outputs = {output.name.value for output, as_pointer in zip(s_algo.outputs, signature.outputs_as_pointer) if as_pointer}
+        self._pointer_inputs = self.calling_convention.pointer_inputs[s_algo.name.value]
+
+        # The returned output is a local variable of the C function
+        algo_variables = self.program_variables.sub_algorithm_variables[s_algo.name.value]
+        variable_declarations = self.local_declarations(s_algo.variable_declarations, algo_variables)
+        if signature.output_as_return:
+            variable_declarations.append(s_algo.outputs[0])
+
+        # The rebased table parameters are received as their storage
+        self._allocated_tables = []
+        var_strs = []
+        for parameter in s_algo.inputs + s_algo.outputs:
+            if algo_variables.symbols[parameter.name.value] in self._rebased_tables:
+                var_strs.append(self.rebased_pointer_declaration_to_str(parameter.name.value, cast(TableType, parameter.type)))
+        for var_decl in variable_declarations:
+            var_strs += self.local_declaration_to_strs(var_decl, algo_variables)
+        var_str = self.indent_str("\n".join(var_strs))
+
+        statements_str = self.statement_list_to_str(s_algo.statements)
+        statements_str = self.indent_str(statements_str)
+
+        result += self.s_algo_header_to_str(s_algo) + " { \n"
+        result += var_str + "\n\n"
+        if s_algo.name.value in self._tail_calls:
+            result += "_debut:\n"
+        result += statements_str + "\n"
+        if self._allocated_tables:
+            result += self.indent_str("\n".join(f"free({name});" for name in self._allocated_tables)) + "\n"
+
+        if signature.output_as_return:
+            result += f"  return {s_algo.outputs[0].name.value};\n"
+
+        result += "}\n"
+
+        self._current_s_algo = None
+        self._pointer_outputs = set()
+        self._pointer_inputs = set()
 
         return result
 
@@ -138,6 +465,9 @@ class MyCompiler:
         return "\n".join([self.statement_to_str(statement) for statement in statements])
 
     def statement_to_str(self, statement: Statement) -> str:
+        if self._current_s_algo in self._tail_calls and id(statement) in self._tail_calls[self._current_s_algo]:
+            return self.tail_call_to_str(statement)
+
         if isinstance(statement, AssignmentStatement):
             left_str = self.expression_to_str(statement.left)
             right_str = self.expression_to_str(statement.right)
@@ -158,7 +488,7 @@ class MyCompiler:
                 block_str = self.statement_list_to_str(conditional.statements)
                 block_str = self.indent_str(block_str)
 
-                result += f"elif ({condition_str}) {{ \n{block_str}\n}} "
+                result += f"else if ({condition_str}) {{ \n{block_str}\n}} "
 
             if len(statement.default_block) != 0:
                 default_block_str = self.statement_list_to_str(statement.default_block)
@@ -170,8 +500,8 @@ class MyCompiler:
         if isinstance(statement, PourStatement):
             result = ""
             
-            step = int(statement.step.value) if statement.step is not None else 1
-            iter_var = statement.variable.value
+            step = statement.step.int_value if statement.step is not None else 1
+            iter_var = self.expression_to_str(statement.variable)
             start_expr = statement.start
             end_expr = statement.end
 
@@ -180,14 +510,21 @@ class MyCompiler:
 
             # Infinite loop if step = 0, but that's the programmer's fault xD
             if step >= 0:
-                for_header = f"for (int {iter_var} = {start_str}; {iter_var} < {end_str}; {iter_var} += {step})"
+                for_header = f"for ({iter_var} = {start_str}; {iter_var} < {end_str}; {iter_var} += {step})"
             else:
-                for_header = f"for (int {iter_var} = {start_str}; {iter_var} > {end_str}; {iter_var} -= {-step})"
+                for_header = f"for ({iter_var} = {start_str}; {iter_var} > {end_str}; {iter_var} -= {-step})"
             
+            pragma_str = self.parallel_pragma_to_str(statement)
+            previous_in_parallel_loop = self._in_parallel_loop
+            if pragma_str:
+                self._in_parallel_loop = True
+            elif id(statement) in self._vectorizable_loops:
+                pragma_str = "#pragma GCC ivdep\n"
             block_str = self.statement_list_to_str(statement.statements)
             block_str = self.indent_str(block_str)
+            self._in_parallel_loop = previous_in_parallel_loop
 
-            return f"{for_header} {{\n{block_str}\n}}"
+            return f"{pragma_str}{for_header} {{\n{block_str}\n}}"
 
         if isinstance(statement, TantQueStatement):
             condition_str = self.expression_to_str(statement.condition)
@@ -195,43 +532,40 @@ class MyCompiler:
 
             return f"while ({condition_str}) {{\n{block_str}\n}}"
 
+        if isinstance(statement, TableInitializationStatement):
+            # The values are copied from a constant table
+            self._library_functions.add("memcpy")
+            table_type = cast(TableType, statement.table.binding.type)
+            element_type_str = self.element_type_to_str(statement.table.binding)
+            constant_name = f"_{statement.table.value}_init{self._nb_table_initializations}"
+            self._nb_table_initializations += 1
+
+            destination_str = self.expression_to_str(statement.table) + self.table_indexes_to_str(table_type, statement.indexes, access=statement)
+            constant_str = f"static const {element_type_str} {constant_name}[{len(statement.values)}] = {self.table_initializer_to_str(statement)};"
+            copy_str = f"memcpy(&{destination_str}, {constant_name}, sizeof({constant_name}));"
+            block_str = self.indent_str(f"{constant_str}\n{copy_str}")
+            return f"{{\n{block_str}\n}}"
+
         if isinstance(statement, FunctionStatement):
             function_name = statement.name.value
-            s_algo = self.program_variables.sub_algorithms[function_name]
-            inputs = statement.inputs
-            outputs = statement.outputs
-            expected_inputs = s_algo.inputs
-            expected_outputs = s_algo.outputs
+            signature = self.program_variables.sub_algorithm_signatures[function_name]
 
-            arguments = ""
+            if self.can_inline_function_statement(statement):
+                return self.inlined_function_statement_to_str(statement)
 
-            input_strs = []
-            for input, exp_input in zip(inputs, expected_inputs):
-                input_strs.append(self.expression_to_str(input))
-                input_type = input.expr_type
-                if isinstance(input_type, TableType):
-                    exp_input_type = cast(TableType, exp_input.type)
-                    for range, exp_range in zip(input_type.ranges, exp_input_type.ranges):
-                        if exp_range.end is None:
-                            start = int(range.start.value)
-                            end = int(cast(LitInt, range.end).value)
-                            input_strs.append(str(end - start))
-                
+            input_strs = self.call_inputs_to_strs(statement.inputs, signature)
 
-            output_strs = []
-            for output, exp_output in zip(outputs, expected_outputs):
-                output_type = output.expr_type
-                if isinstance(output_type, TableType):
-                    exp_output_type = cast(TableType, exp_output.type)
-                    output_strs.append(self.expression_to_str(output))
-                    for range, exp_range in zip(output_type.ranges, exp_output_type.ranges):
-                        if exp_range.end is None:
-                            start = int(range.start.value)
-                            end = int(cast(LitInt, range.end).value)
-                            output_strs.append(str(end - start))
+            if signature.output_as_return:
+                output_str = self.expression_to_str(statement.outputs[0])
+                return f"{output_str} = {function_name}({', '.join(input_strs)});"
 
-                else:
+            output_strs = []
+            for output, open_dimensions, as_pointer in zip(statement.outputs, signature.output_open_dimensions, signature.outputs_as_pointer):
+                if as_pointer:
                     output_strs.append(f"&{self.expression_to_str(output)}")
+                else:
+                    output_strs += self.table_sizes_to_strs(cast(TableType, output.expr_type), open_dimensions)
+                    output_strs.append(self.expression_to_str(output))
 
             arguments = ", ".join(input_strs + output_strs)
 
@@ -243,41 +577,192 @@ class MyCompiler:
 
 
 
+    def tail_call_to_str(self, statement: Statement) -> str:
+        # The inputs take the values of the arguments, all computed before the first input changes, and the function
+        # starts again. The outputs are already those of the call.
+        s_algo = self.program_variables.sub_algorithms[cast(str, self._current_s_algo)]
+        symbols = self.program_variables.sub_algorithm_variables[s_algo.name.value].symbols
+        inputs, _ = cast(tuple[list[Expression], list[Expression]], get_self_call(statement, s_algo))
+
+        changed = [(input_decl, input) for input, input_decl in zip(inputs, s_algo.inputs) if not is_parameter(input, symbols[input_decl.name.value])]
+        # An input read by the argument of another one keeps its value in a temporary until the others are computed
+        read_by_others = [any(mentions(other, symbols[input_decl.name.value]) for other_decl, other in changed if other_decl is not input_decl)
+                          for input_decl, _ in changed]
+        lines = []
+        for (input_decl, input), is_read in zip(changed, read_by_others):
+            if is_read:
+                next_decl = VariableDeclaration(ID(f"_{input_decl.name.value}_next"), input_decl.type)
+                lines.append(self.variable_declaration_to_str(next_decl, end=f" = {self.expression_to_str(input)};"))
+        for (input_decl, input), is_read in zip(changed, read_by_others):
+            if not is_read:
+                lines.append(f"{input_decl.name.value} = {self.expression_to_str(input)};")
+        for (input_decl, _), is_read in zip(changed, read_by_others):
+            if is_read:
+                lines.append(f"{input_decl.name.value} = _{input_decl.name.value}_next;")
+        lines.append("goto _debut;")
+        if not any(read_by_others):
+            return "\n".join(lines)
+        block_str = self.indent_str("\n".join(lines))
+        return f"{{\n{block_str}\n}}"
+
+    def parallel_pragma_to_str(self, statement: PourStatement) -> str:
+        parallel_loop = self._parallel_loops.get(id(statement))
+        if parallel_loop is None or self._in_parallel_loop:
+            return ""
+
+        # The scalars added by later passes in the loop are temporaries, assigned before being used (the tables whose
+        # elements are now accessed through a pointer are still shared)
+        written = get_written_symbols(statement.statements, self._pure_sub_algorithms) - parallel_loop.written
+        temporaries = {symbol for symbol in written if not isinstance(symbol.type, TableType)}
+        iterator = cast(Symbol, statement.variable.binding)
+
+        # The private variables start with their value before the loop, which they keep if it doesn't run
+        clauses = []
+        for clause, symbols in (("firstprivate", parallel_loop.private), ("lastprivate", {iterator} | parallel_loop.private), ("private", temporaries)):
+            if symbols:
+                clauses.append(f"{clause}({', '.join(sorted(self.symbol_to_str(symbol) for symbol in symbols))})")
+        for operator in sorted(set(parallel_loop.reductions.values())):
+            names = sorted(self.symbol_to_str(symbol) for symbol, symbol_operator in parallel_loop.reductions.items() if symbol_operator == operator)
+            clauses.append(f"reduction({operator}: {', '.join(names)})")
+
+        # A variable written through a pointer parameter, or an output of an inlined sub-algorithm, isn't a C variable
+        names = [self.symbol_to_str(symbol) for symbol in {iterator} | parallel_loop.private | temporaries | set(parallel_loop.reductions)]
+        if not all(name.isidentifier() for name in names):
+            return ""
+
+        # The loop variable isn't assigned by OpenMP when there is no iteration, where C would assign the start.
+        # 'GCC ivdep' can't be combined with an OpenMP loop, which gets the 'simd' construct instead.
+        start_str = self.expression_to_str(statement.start)
+        construct = "parallel for simd" if id(statement) in self._vectorizable_loops else "parallel for"
+        return f"{self.symbol_to_str(iterator)} = {start_str};\n#pragma omp {construct} {' '.join(clauses)}\n"
+
+    def symbol_to_str(self, symbol: Symbol) -> str:
+        variable = ID(symbol.name)
+        variable.binding = symbol
+        return self.expression_to_str(variable)
+
+    def is_declaration_initializer(self, statement: Statement, initializers: dict[str, str]) -> bool:
+        if not isinstance(statement, TableInitializationStatement) or statement.table.value in initializers:
+            return False
+
+        # The initializer lists the values from the first element, other elements being set to 0
+        table_type = cast(TableType, statement.table.binding.type)
+        return get_flat_index(table_type, statement.indexes) == 0
+
+    def table_initializer_to_str(self, statement: TableInitializationStatement) -> str:
+        return "{" + ", ".join(self.expression_to_str(value) for value in statement.values) + "}"
+
+    def call_inputs_to_strs(self, inputs: list[Expression], signature: SubAlgorithmSignature) -> list[str]:
+        input_strs = []
+        s_algo = self.program_variables.sub_algorithms[signature.name]
+        for input, input_decl, open_dimensions in zip(inputs, s_algo.inputs, signature.input_open_dimensions):
+            if open_dimensions:
+                input_strs += self.table_sizes_to_strs(cast(TableType, input.expr_type), open_dimensions)
+
+            if self.calling_convention.is_pointer_input(signature.name, input_decl.name.value):
+                # An article received by pointer is passed on as is
+                if self.is_pointer_input_id(input):
+                    input_strs.append(input.value)
+                else:
+                    input_strs.append(f"&{self.expression_to_str(input)}")
+            else:
+                input_strs.append(self.expression_to_str(input))
+
+        return input_strs
+
+    def table_sizes_to_strs(self, table_type: TableType, dimensions: list[int]) -> list[str]:
+        # The size of each of the given dimensions of a table, passed along with it to a sub-algorithm
+        sizes = []
+        for dimension in dimensions:
+            range = table_type.ranges[dimension]
+            start = range.start.int_value
+            end = cast(LitInt, range.end).int_value
+            sizes.append(str(end - start))
+
+        return sizes
+
+    def table_indexes_to_str(self, table_type: TableType, indexes: list[Expression], rebased=False, access: Optional[TableExpression | TableInitializationStatement] = None) -> str:
+        # The access is given to check its indexes against the bounds
+        result = ""
+        for k, (range, index_expr) in enumerate(zip(table_type.ranges, indexes)):
+            index_str = self.expression_to_str(index_expr)
+            if access is not None and self.options.check_bounds:
+                index_str = self.checked_index_to_str(index_str, table_type, k, access)
+            if range.start.int_value == 0 or rebased:
+                result += f"[{index_str}]"
+            else:
+                result += f"[{index_str} - {range.start.int_value}]"
+
+        return result
+
+    def checked_index_to_str(self, index_str: str, table_type: TableType, dimension: int, access: TableExpression | TableInitializationStatement) -> str:
+        if (id(access), dimension) in self._safe_indexes:
+            self._nb_eliminated_bounds_checks += 1
+            return index_str
+
+        # The end of an open dimension is known from the size passed with the table parameter
+        table_range = table_type.ranges[dimension]
+        if table_range.end is not None:
+            end_str = str(table_range.end.int_value)
+        else:
+            table = access.table if isinstance(access, TableInitializationStatement) else access.table_expression
+            if not isinstance(table, ID) or table.binding is None:
+                return index_str
+            nb_open_dimensions = sum(1 for previous_range in table_type.ranges[:dimension] if previous_range.end is None)
+            if table.binding in self._inlined_table_sizes:
+                size_str = self._inlined_table_sizes[table.binding][nb_open_dimensions]
+            elif table.binding in self._inlined_symbols or table.binding.kind not in (INPUT_KIND, OUTPUT_KIND):
+                return index_str
+            else:
+                size_str = f"_{table.binding.name}_{nb_open_dimensions}"
+            end_str = f"{table_range.start.int_value} + {size_str}"
+
+        self._requires_bounds_check = True
+        self._nb_bounds_checks += 1
+        return f"_verifier_indice({index_str}, {table_range.start.int_value}, {end_str}, {access.lineno})"
+
     def get_nb_table_elements(self, table_type: TableType) -> int:
         size = 1
         for range in table_type.ranges:
             assert range.end is not None
-            size *= (int(range.end.value) - int(range.start.value))
+            size *= (range.end.int_value - range.start.int_value)
         return size 
 
 
     def expression_to_str(self, expression: Expression) -> str:
         if isinstance(expression, ID):
+            symbol = expression.binding
+            if symbol is not None:
+                if symbol in self._inlined_symbols:
+                    return self._inlined_symbols[symbol]
+                if symbol.kind == OUTPUT_KIND and symbol.name in self._pointer_outputs:
+                    return f"(*{symbol.name})"
+                if symbol.kind == INPUT_KIND and symbol.name in self._pointer_inputs:
+                    return f"(*{symbol.name})"
+                # The table as a whole (given to a sub-algorithm, or pointed to) is its storage, which starts at 0
+                if symbol in self._rebased_tables:
+                    return self.storage_name(symbol.name)
             return expression.value
         if isinstance(expression, LitInt):
-            return expression.value
+            return str(expression.int_value)
         if isinstance(expression, LitFloat):
             return expression.value
         if isinstance(expression, LitChar):
-            return f'{expression.value}'
+            # The escape sequences of NF04 are the same as in C
+            return f"'{expression.value}'"
         if isinstance(expression, LitBool):
             self._requires_bool = True
-            v = expression.value.lower()
-            return "true" if v == "Vrai" else "false"
+            return "true" if expression.bool_value else "false"
 
         if isinstance(expression, BinaryOperation):
             left_str = self.expression_to_str(expression.left)
             right_str = self.expression_to_str(expression.right)
-            operator_str = expression.operator.operator
+            operator_str = self.operator_to_str(expression.operator)
             return f"{left_str} {operator_str} {right_str}"
 
         if isinstance(expression, UnaryOperation):
             expr_str = self.expression_to_str(expression.expression)
-            operator_str = expression.operator.operator 
-            if operator_str == "non":
-                operator_str = "!"
-            elif operator_str == "^":
-                operator_str = "*"
+            operator_str = self.operator_to_str(expression.operator)
             return f"{operator_str}{expr_str}"
 
         if isinstance(expression, SubExpression):
@@ -288,43 +773,42 @@ class MyCompiler:
             result = ""
             table_expression = expression.table_expression
             table_indexes = expression.indexes
+            table_expression_type = cast(TableType, table_expression.expr_type)
+
+            if self.is_rebased_table_id(table_expression):
+                return cast(ID, table_expression).value + self.table_indexes_to_str(table_expression_type, table_indexes, rebased=True, access=expression)
+
             table_expression_str = self.expression_to_str(table_expression)
             result += table_expression_str
-
-            table_expression_type = cast(TableType, table_expression.expr_type)
-            for range, index_expr in zip(table_expression_type.ranges, table_indexes):
-                index_str = self.expression_to_str(index_expr)
-                if int(range.start.value) == 0:
-                    result += f"[{index_str}]"
-                else:
-                    result += f"[{index_str} - {range.start.value}]"
-                
+            result += self.table_indexes_to_str(table_expression_type, table_indexes, access=expression)
             return result
 
         if isinstance(expression, AttributeExpression):
             main_expr = expression.expression
             attribute = expression.attribute
+
+            # tab[i].champ is stored in tab__champ[i]
+            if isinstance(main_expr, TableExpression) and isinstance(main_expr.table_expression, ID):
+                symbol = main_expr.table_expression.binding
+                if symbol in self._struct_of_arrays_tables:
+                    table_name = self._inlined_symbols.get(symbol, symbol.name)
+                    return f"{table_name}__{attribute.value}" + self.table_indexes_to_str(symbol.type, main_expr.indexes, access=main_expr)
+
+            if self.is_pointer_input_id(main_expr):
+                return f"{cast(ID, main_expr).value}->{attribute.value}"
             main_expr_str = self.expression_to_str(main_expr)
-            return f"{main_expr_str}.{attribute.value}"            
+            return f"{main_expr_str}.{attribute.value}"
 
 
         if isinstance(expression, FunctionExpression):
             result = ""
             function_name = expression.name.value
-            inputs = expression.inputs
-            expected_inputs = self.program_variables.sub_algorithms[function_name].inputs
+            signature = self.program_variables.sub_algorithm_signatures[function_name]
 
-            input_strs = []
-            for input, exp_input in zip(inputs, expected_inputs):
-                input_strs.append(self.expression_to_str(input))
-                input_type = input.expr_type
-                if isinstance(input_type, TableType):
-                    exp_input_type = cast(TableType, exp_input.type)
-                    for range, exp_range in zip(input_type.ranges, exp_input_type.ranges):
-                        if exp_range.end is None:
-                            start = int(range.start.value)
-                            end = int(cast(LitInt, range.end).value)
-                            input_strs.append(str(end - start))
+            if self.can_inline_function_expression(expression):
+                return self.inlined_function_expression_to_str(expression)
+
+            input_strs = self.call_inputs_to_strs(expression.inputs, signature)
 
             result += f"{function_name}("
             result += ", ".join(input_strs)
@@ -334,23 +818,345 @@ class MyCompiler:
         raise Exception("")
 
 
+    def is_rebased_table_id(self, expression: Expression) -> bool:
+        if not isinstance(expression, ID) or expression.binding is None or expression.binding in self._inlined_symbols:
+            return False
+        return expression.binding in self._rebased_tables
+
+    def is_pointer_input_id(self, expression: Expression) -> bool:
+        if not isinstance(expression, ID) or expression.binding is None or expression.binding in self._inlined_symbols:
+            return False
+        return expression.binding.kind == INPUT_KIND and expression.binding.name in self._pointer_inputs
+
+    def operator_to_str(self, operator: Operator) -> str:
+        operator_str = operator.operator.lower()
+        return self.C_OPERATOR_EQUIV.get(operator_str, operator_str)
+
+
+    def can_inline(self, function_name: str) -> bool:
+        threshold = self.options.inline_threshold
+        if threshold is None or self.call_graph.is_recursive(function_name):
+            return False
+
+        s_algo = self.program_variables.sub_algorithms[function_name]
+        return count_statements(s_algo.statements) <= threshold
+
+    def can_inline_function_statement(self, statement: FunctionStatement) -> bool:
+        if not self.can_inline(statement.name.value):
+            return False
+
+        # The outputs are written directly, so they must be evaluated without side effects
+        if any(isinstance(node, FunctionExpression) for output in statement.outputs for node in walk(output)):
+            return False
+
+        # The address of an output is taken before the body, which the C type of a table doesn't allow
+        if not all(isinstance(output, ID) or not isinstance(output.expr_type, TableType) for output in statement.outputs):
+            return False
+
+        signature = self.program_variables.sub_algorithm_signatures[statement.name.value]
+        return self.open_dimension_sizes_are_known(statement.inputs, signature.input_open_dimensions) and \
+            self.open_dimension_sizes_are_known(statement.outputs, signature.output_open_dimensions)
+
+    def can_inline_function_expression(self, expression: FunctionExpression) -> bool:
+        function_name = expression.name.value
+        if not self.can_inline(function_name):
+            return False
+
+        # Only sub-algorithms that directly assign an expression of their inputs to their output can become an expression
+        s_algo = self.program_variables.sub_algorithms[function_name]
+        if len(s_algo.statements) != 1 or not isinstance(s_algo.statements[0], AssignmentStatement):
+            return False
+
+        signature = self.program_variables.sub_algorithm_signatures[function_name]
+        if not self.open_dimension_sizes_are_known(expression.inputs, signature.input_open_dimensions):
+            return False
+
+        assignment = s_algo.statements[0]
+        if not isinstance(assignment.left, ID) or cast(Symbol, assignment.left.binding).kind != OUTPUT_KIND:
+            return False
+
+        input_names = {input.name.value for input in s_algo.inputs}
+        uses: dict[str, int] = {}
+        for node in walk(assignment.right):
+            if isinstance(node, ID) and node.binding is not None:
+                if node.binding.kind != INPUT_KIND or node.binding.name not in input_names:
+                    return False
+                uses[node.binding.name] = uses.get(node.binding.name, 0) + 1
+
+        # An input whose expression calls a sub-algorithm can't be evaluated more than once
+        for input_expression, input_decl in zip(expression.inputs, s_algo.inputs):
+            calls = any(isinstance(node, FunctionExpression) for node in walk(input_expression))
+            if calls and uses.get(input_decl.name.value, 0) > 1:
+                return False
+
+        return True
+
+    def open_dimension_sizes_are_known(self, arguments: list[Expression], open_dimensions_list: list[list[int]]) -> bool:
+        # The bounds checks of an inlined table parameter with open dimensions need their sizes at the call site
+        if not self.options.check_bounds:
+            return True
+        return all(cast(TableType, argument.expr_type).ranges[dimension].end is not None
+                   for argument, open_dimensions in zip(arguments, open_dimensions_list) for dimension in open_dimensions)
+
+    def inlined_table_sizes(self, function_name: str, arguments: list[Expression], declarations: list[VariableDeclaration], open_dimensions_list: list[list[int]]) -> dict[Symbol, list[str]]:
+        symbols = self.program_variables.sub_algorithm_variables[function_name].symbols
+        sizes = {}
+        for argument, declaration, open_dimensions in zip(arguments, declarations, open_dimensions_list):
+            if open_dimensions and self.options.check_bounds:
+                sizes[symbols[declaration.name.value]] = self.table_sizes_to_strs(cast(TableType, argument.expr_type), open_dimensions)
+        return sizes
+
+    def needs_cast(self, to_type: VariableType) -> bool:
+        # The values of base types, which a call converts even from the same NF04 type: a réel computed in double
+        # (with a literal) is passed and returned as a float
+        return isinstance(to_type, BaseType) and to_type.value in self.C_TYPE_EQUIV
+
+    def inlined_function_expression_to_str(self, expression: FunctionExpression) -> str:
+        function_name = expression.name.value
+        s_algo = self.program_variables.sub_algorithms[function_name]
+        symbols = self.program_variables.sub_algorithm_variables[function_name].symbols
+        assignment = cast(AssignmentStatement, s_algo.statements[0])
+
+        inlined_symbols = {}
+        for input_expression, input_decl in zip(expression.inputs, s_algo.inputs):
+            input_str = f"({self.expression_to_str(input_expression)})"
+            # The implicit conversion of the argument done by a call has to be done explicitly
+            if self.needs_cast(input_decl.type):
+                input_str = f"(({self.return_type_to_str(input_decl.type)}){input_str})"
+            inlined_symbols[symbols[input_decl.name.value]] = input_str
+
+        signature = self.program_variables.sub_algorithm_signatures[function_name]
+        table_sizes = self.inlined_table_sizes(function_name, expression.inputs, s_algo.inputs, signature.input_open_dimensions)
+
+        previous_inlined_symbols, previous_table_sizes = self._inlined_symbols, self._inlined_table_sizes
+        self._inlined_symbols = {**previous_inlined_symbols, **inlined_symbols}
+        self._inlined_table_sizes = {**previous_table_sizes, **table_sizes}
+        result = f"({self.expression_to_str(assignment.right)})"
+        self._inlined_symbols, self._inlined_table_sizes = previous_inlined_symbols, previous_table_sizes
+
+        output_type = s_algo.outputs[0].type
+        if self.needs_cast(output_type):
+            result = f"(({self.return_type_to_str(output_type)}){result})"
+
+        return result
+
+    def inlined_function_statement_to_str(self, statement: FunctionStatement) -> str:
+        function_name = statement.name.value
+        s_algo = self.program_variables.sub_algorithms[function_name]
+        symbols = self.program_variables.sub_algorithm_variables[function_name].symbols
+
+        inlined_symbols = {}
+        declarations = []
+        # The large local tables are always allocated on the heap, as a static table would be shared by the calls
+        frees = []
+
+        # Inputs are copied like parameters would be, except tables which are passed by reference anyway
+        for input_expression, input_decl in zip(statement.inputs, s_algo.inputs):
+            input_str = self.expression_to_str(input_expression)
+            input_name = input_decl.name.value
+            if isinstance(input_decl.type, TableType):
+                inlined_symbols[symbols[input_name]] = input_str
+            else:
+                local_name = f"_{function_name}_{input_name}"
+                local_decl = VariableDeclaration(ID(local_name), input_decl.type)
+                declarations.append(f"{self.variable_declaration_to_str(local_decl, end='')} = {input_str};")
+                inlined_symbols[symbols[input_name]] = local_name
+
+        # Outputs are written directly into the expressions they are given, except a returned output which is only
+        # assigned at the end, like the C function would
+        assignments = []
+        signature = self.program_variables.sub_algorithm_signatures[function_name]
+        for output_expression, output_decl in zip(statement.outputs, s_algo.outputs):
+            output_str = self.expression_to_str(output_expression)
+            if signature.output_as_return:
+                local_name = f"_{function_name}_{output_decl.name.value}"
+                declarations.append(self.variable_declaration_to_str(VariableDeclaration(ID(local_name), output_decl.type)))
+                assignments.append(f"{output_str} = {local_name};")
+                output_str = local_name
+            elif not isinstance(output_expression, ID):
+                # The address is taken before the body, like the call would: writing an output can change the indexes
+                # of the next ones
+                local_name = f"_{function_name}_{output_decl.name.value}"
+                declarations.append(f"{self.return_type_to_str(output_decl.type)} *{local_name} = &{output_str};")
+                output_str = f"(*{local_name})"
+            inlined_symbols[symbols[output_decl.name.value]] = output_str
+
+        for var_decl in s_algo.variable_declarations:
+            local_name = f"_{function_name}_{var_decl.name.value}"
+            symbol = symbols[var_decl.name.value]
+            if symbol in self._struct_of_arrays_tables:
+                local_decls = self.struct_of_arrays_declarations(local_name, cast(TableType, var_decl.type))
+            else:
+                local_decls = [VariableDeclaration(ID(local_name), var_decl.type)]
+            element_type_str = self.element_type_to_str(symbol) if symbol in self._compact_tables else None
+            for local_decl in local_decls:
+                if self.is_large_table(local_decl.type, element_type_str):
+                    declarations.append(self.allocated_table_declaration_to_str(local_decl, element_type_str))
+                    frees.append(f"free({local_decl.name.value});")
+                else:
+                    declarations.append(self.variable_declaration_to_str(local_decl, element_type_str=element_type_str))
+            inlined_symbols[symbol] = local_name
+
+        table_sizes = self.inlined_table_sizes(function_name, statement.inputs, s_algo.inputs, signature.input_open_dimensions)
+        table_sizes |= self.inlined_table_sizes(function_name, statement.outputs, s_algo.outputs, signature.output_open_dimensions)
+
+        previous_inlined_symbols, previous_table_sizes = self._inlined_symbols, self._inlined_table_sizes
+        self._inlined_symbols = {**previous_inlined_symbols, **inlined_symbols}
+        self._inlined_table_sizes = {**previous_table_sizes, **table_sizes}
+        block_str = self.statement_list_to_str(s_algo.statements)
+        self._inlined_symbols, self._inlined_table_sizes = previous_inlined_symbols, previous_table_sizes
+
+        block_str = "\n".join(declarations + [block_str] + assignments + frees)
+        return f"{{ // {function_name}\n{self.indent_str(block_str)}\n}}"
+
+
+    def local_declarations(self, var_decl_list: list[VariableDeclaration], algo_variables: AlgorithmVariables) -> list[VariableDeclaration]:
+        result = []
+        for var_decl in var_decl_list:
+            if algo_variables.symbols[var_decl.name.value] in self._struct_of_arrays_tables:
+                result += self.struct_of_arrays_declarations(var_decl.name.value, cast(TableType, var_decl.type))
+            else:
+                result.append(var_decl)
+
+        return result
+
+    def struct_of_arrays_declarations(self, table_name: str, table_type: TableType) -> list[VariableDeclaration]:
+        # One table per field of the article, indexed by the indexes of the original table first
+        type_name = cast(BaseType, table_type.type).value
+        custom_type = next(custom_type for custom_type in self.program_variables.custom_types if custom_type.name.value == type_name)
+
+        declarations = []
+        for attribute in custom_type.attributes:
+            if isinstance(attribute.type, TableType):
+                field_table_type = TableType(table_type.ranges + attribute.type.ranges, attribute.type.type, s=table_type)
+            else:
+                field_table_type = TableType(table_type.ranges, attribute.type, s=table_type)
+            declarations.append(VariableDeclaration(ID(f"{table_name}__{attribute.name.value}"), field_table_type))
+
+        return declarations
+
+    def find_rebased_tables(self) -> set[Symbol]:
+        # The tables with a non-zero lower bound whose dimensions, except the first, have a known size
+        algorithms = [self.program_variables.main_algorithm_variables, *self.program_variables.sub_algorithm_variables.values()]
+
+        tables = set()
+        for algo_variables in algorithms:
+            for symbol in algo_variables.symbols.values():
+                if not isinstance(symbol.type, TableType) or symbol in self._struct_of_arrays_tables:
+                    continue
+                ranges = symbol.type.ranges
+                if all(table_range.start.int_value == 0 for table_range in ranges):
+                    continue
+                if any(table_range.end is None for table_range in ranges[1:]):
+                    continue
+                tables.add(symbol)
+
+        return tables
+
+    def element_type_to_str(self, table: Symbol) -> str:
+        if table in self._compact_tables:
+            self._requires_stdint = True
+            return self._compact_tables[table]
+        return self.return_type_to_str(cast(TableType, table.type).type)
+
+    @staticmethod
+    def storage_name(table_name: str) -> str:
+        return f"_{table_name}_storage"
+
+    def local_declaration_to_strs(self, var_decl: VariableDeclaration, algo_variables: AlgorithmVariables, end=";") -> list[str]:
+        # The tables of a struct of arrays have no symbol of their own
+        symbol = algo_variables.symbols.get(var_decl.name.value)
+        element_type_str = self.element_type_to_str(symbol) if symbol in self._compact_tables else None
+        if symbol not in self._rebased_tables:
+            return [self.table_storage_declaration_to_str(var_decl, end=end, element_type_str=element_type_str)]
+
+        table_name = var_decl.name.value
+        storage_decl = VariableDeclaration(ID(self.storage_name(table_name)), var_decl.type)
+        return [self.table_storage_declaration_to_str(storage_decl, end=end, table_name=table_name, element_type_str=element_type_str),
+                self.rebased_pointer_declaration_to_str(table_name, cast(TableType, var_decl.type), element_type_str)]
+
+    def table_storage_declaration_to_str(self, var_decl: VariableDeclaration, end=";", table_name: Optional[str] = None, element_type_str: Optional[str] = None) -> str:
+        # Tables too large for the stack are static in the main algorithm, and allocated on the heap in the
+        # sub-algorithms, which can be recursive (they are freed at the end of the function)
+        if not self.is_large_table(var_decl.type, element_type_str):
+            return self.variable_declaration_to_str(var_decl, end=end, table_name=table_name, element_type_str=element_type_str)
+        if self._current_s_algo is None:
+            return "static " + self.variable_declaration_to_str(var_decl, end=end, table_name=table_name, element_type_str=element_type_str)
+
+        self._allocated_tables.append(var_decl.name.value)
+        return self.allocated_table_declaration_to_str(var_decl, element_type_str)
+
+    def is_large_table(self, var_type: VariableType, element_type_str: Optional[str]) -> bool:
+        threshold = self.options.large_table_threshold
+        if threshold is None or not isinstance(var_type, TableType) or any(table_range.end is None for table_range in var_type.ranges):
+            return False
+
+        if element_type_str in COMPACT_TYPE_SIZES:
+            size = self.get_nb_table_elements(var_type) * COMPACT_TYPE_SIZES[element_type_str]
+        else:
+            size = get_type_layout(var_type, self._type_layouts)[0]
+        return size > threshold
+
+    def allocated_table_declaration_to_str(self, var_decl: VariableDeclaration, element_type_str: Optional[str]) -> str:
+        # A pointer to the first row of the table, which is indexed the same way
+        table_type = cast(TableType, var_decl.type)
+        rows_type = TableType(table_type.ranges[1:], table_type.type) if len(table_type.ranges) > 1 else table_type.type
+        pointer_decl = VariableDeclaration(var_decl.name, PtrType(rows_type))
+
+        self._requires_allocation = True
+        self._library_functions.add("free")
+        table_type_str = self.variable_declaration_to_str(VariableDeclaration(ID(""), table_type), end="", element_type_str=element_type_str)
+        return self.variable_declaration_to_str(pointer_decl, end=f" = _allouer_tableau(sizeof({table_type_str}), {table_type.lineno});", element_type_str=element_type_str)
+
+    def parameter_declaration_to_str(self, s_algo_name: str, parameter: VariableDeclaration, restrict: bool) -> str:
+        symbol = self.program_variables.sub_algorithm_variables[s_algo_name].symbols[parameter.name.value]
+        if symbol not in self._rebased_tables:
+            return self.variable_declaration_to_str(parameter, end="", restrict=restrict)
+
+        storage_decl = VariableDeclaration(ID(self.storage_name(parameter.name.value)), parameter.type)
+        return self.variable_declaration_to_str(storage_decl, end="", restrict=restrict, table_name=parameter.name.value)
+
+    def rebased_pointer_declaration_to_str(self, table_name: str, table_type: TableType, element_type_str: Optional[str] = None) -> str:
+        # tab[i][j] is at _tab_storage[i - start_i][j - start_j]: the pointer to the rows is shifted back by the offset of
+        # element [start_i][start_j] in the storage, computed in elements so that each dimension can have its own bound
+        ranges = table_type.ranges
+        offset = 0
+        for table_range in ranges:
+            size = cast(LitInt, table_range.end).int_value - table_range.start.int_value if table_range.end is not None else 0
+            offset = offset * size + table_range.start.int_value
+
+        if element_type_str is None:
+            element_type_str = self.return_type_to_str(table_type.type)
+        storage_str = self.storage_name(table_name)
+        offset_str = f"- {offset}" if offset >= 0 else f"+ {-offset}"
+
+        if len(ranges) == 1:
+            return f"{element_type_str} *const {table_name} = {storage_str} {offset_str};"
+
+        rows_str = self.table_ranges_to_str(ranges[1:], table_name)
+        return f"{element_type_str} (*const {table_name}){rows_str} = ({element_type_str} (*){rows_str})(({element_type_str} *){storage_str} {offset_str});"
+
     def variable_declarations_list_to_str(self, var_decl_list: list[VariableDeclaration], end=";", join="\n") -> str:
         return join.join([self.variable_declaration_to_str(var_decl, end=end) for var_decl in var_decl_list])
 
 
 
 
-    def variable_declaration_to_str(self, var_decl: VariableDeclaration, end=";") -> str:
+    def variable_declaration_to_str(self, var_decl: VariableDeclaration, end=";", restrict=False, table_name: Optional[str] = None, element_type_str: Optional[str] = None) -> str:
+        # table_name is the name the sizes of open dimensions are named after, if it isn't the declared one, and
+        # element_type_str the C type of the elements of a table, if it isn't the one of its declared type
         result = "{}"
         var_name = var_decl.name.value
         var_type = var_decl.type
+        if table_name is None:
+            table_name = var_name
 
         previous = ""
 
         curr_var_type = var_type
         while not isinstance(curr_var_type, BaseType):
             if isinstance(curr_var_type, TableType):
-                ranges = self.table_ranges_to_str(curr_var_type.ranges, var_decl.name.value)
+                ranges = self.table_ranges_to_str(curr_var_type.ranges, table_name, restrict and previous == "")
                 if previous == "ptr":
                     result = f"({{}}){ranges}".format(result)
                 else:
@@ -366,7 +1172,7 @@ class MyCompiler:
 
         result = result.format(var_name)
 
-        var_type_name = curr_var_type.value
+        var_type_name = curr_var_type.value if element_type_str is None else element_type_str
         if var_type_name in self.C_TYPE_EQUIV:
             var_type_name = self.C_TYPE_EQUIV[var_type_name]
             if var_type_name == "bool":
@@ -390,7 +1196,7 @@ class MyCompiler:
         raise Exception("")
 
             
-    def table_ranges_to_str(self, table_ranges: list[TableRange], tab_name: str) -> str:
+    def table_ranges_to_str(self, table_ranges: list[TableRange], tab_name: str, restrict=False) -> str:
         result = ""
         i = 0
         for t_r in table_ranges:
@@ -398,10 +1204,14 @@ class MyCompiler:
                 result += f"[_{tab_name}_{i}]"
                 i += 1
             else:
-                if int(t_r.start.value) == 0:
-                    result += f"[{int(t_r.end.value)}]"
+                if t_r.start.int_value == 0:
+                    result += f"[{t_r.end.int_value}]"
                 else:
-                    result += f"[{int(t_r.end.value)} - {int(t_r.start.value)}]"
+                    result += f"[{t_r.end.int_value} - {t_r.start.int_value}]"
+
+        # A table parameter is a pointer to its first element, which 'restrict' qualifies when put in the first brackets
+        if restrict:
+            result = "[restrict " + result[1:]
 
         return result
 
@@ -420,5 +1230,8 @@ if __name__ == "__main__":
         print(error)
         print()
 
+    for pass_name, pass_report in compiler.report.items():
+        print(f"{pass_name}: {pass_report}")
+
     with open("output.c", 'w') as fp:
         fp.write(result)
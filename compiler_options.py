@@ -0,0 +1,66 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class CompilerOptions:
+    # Non-recursive sub-algorithms with at most this many statements are inlined at their call sites (None to disable)
+    inline_threshold: Optional[int] = None
+
+    # Article inputs that are never modified are passed as 'const T *' instead of being copied on each call
+    struct_inputs_by_pointer: bool = False
+
+    # Table parameters proven not to share memory with the other parameters of a sub-algorithm are marked 'restrict'
+    restrict_tables: bool = False
+
+    # The fields of the article types are reordered by decreasing alignment, to leave as little padding as possible
+    reorder_struct_fields: bool = False
+
+    # Local tables of articles only accessed one field at a time are stored as one table per field
+    struct_of_arrays: bool = False
+
+    # Runs of at least this many assignments of literals to consecutive table elements become a single initialization (None to disable)
+    table_initialization_threshold: Optional[int] = None
+
+    # Operations on literals are computed at compile time, and the statements made useless by a constant condition removed
+    constant_folding: bool = False
+
+    # Bounds of pour loops and operations of loop bodies that don't change while the loop runs are computed once before it
+    hoist_loop_invariants: bool = False
+
+    # Table element addresses and index expressions used several times with the same value are computed once
+    eliminate_common_subexpressions: bool = False
+
+    # Tables with a non-zero lower bound are indexed through a pointer shifted by it, instead of subtracting it on each access
+    rebase_tables: bool = False
+
+    # Pour loops whose iterations are independent are run by several threads, with '#pragma omp parallel for'
+    parallelize_loops: bool = False
+
+    # Innermost pour loops whose iterations don't share written table elements are marked '#pragma GCC ivdep' for the C compiler to vectorize, and table parameters 'restrict'
+    vectorize_loops: bool = False
+
+    # Perfectly nested pour loops are swapped when the inner one goes through tables along an earlier dimension than the outer one
+    interchange_loops: bool = False
+
+    # Pour loops with literal bounds are replaced by copies of their body when these make at most this many statements (None to disable)
+    full_unroll_threshold: Optional[int] = None
+
+    # The other innermost pour loops with literal bounds run this many copies of their body per iteration (None to disable)
+    unroll_factor: Optional[int] = None
+
+    # The calls of a sub-algorithm to itself that end it jump back to the start of the C function with the new inputs
+    eliminate_tail_calls: bool = False
+
+    # Each table index is checked against the range of its dimension, stopping the program with the NF04 line when it is out of it, unless it provably can't be
+    check_bounds: bool = False
+
+    # Local tables of entiers whose values provably fit in int8_t or int16_t are stored with that type (int when unsure), so no value is ever truncated
+    compact_tables: bool = False
+
+    # Local tables larger than this many bytes are static in the main algorithm and allocated with malloc in sub-algorithms, instead of on the stack (None keeps them all on the stack)
+    large_table_threshold: Optional[int] = None
+
+    # The programs run in python (compile_to_python) store their tables of base types in NumPy arrays, and run the element-wise pour loops as array operations
+    numpy_tables: bool = False
@@ -0,0 +1,302 @@
+from __future__ import annotations
+import math
+from typing import Optional
+
+from ast_nodes import *
+
+INT_MIN = -2**31
+INT_MAX = 2**31 - 1
+
+LITERAL_TYPES = (LitInt, LitFloat, LitChar, LitBool)
+
+
+def count_nodes(node: Any) -> int:
+    return sum(1 for _ in walk(node))
+
+def make_lit_float(value: float, s: TrackPosition) -> LitFloat:
+    literal = LitFloat(repr(value), value, s=s)
+    literal.expr_type = BaseType("réel")
+    return literal
+
+def make_lit_bool(value: bool, s: TrackPosition) -> LitBool:
+    literal = LitBool("vrai" if value else "faux", value, s=s)
+    literal.expr_type = BaseType("booléen")
+    return literal
+
+def get_number(literal: Expression) -> Optional[int | float]:
+    if isinstance(literal, LitInt):
+        return literal.int_value
+    if isinstance(literal, LitFloat):
+        return literal.float_value
+    return None
+
+def c_divide(left: int, right: int) -> int:
+    # C integer division truncates towards 0, where python's floors
+    quotient = abs(left) // abs(right)
+    return quotient if (left < 0) == (right < 0) else -quotient
+
+
+class ConstantFoldingPass:
+    # Computes the operations on literals at compile time, with the semantics of the generated C (truncating integer
+    # division, remainder with the sign of the dividend, no folding of a division by zero or of an integer overflow).
+    # Chains of entier additions and subtractions are reassociated so that their literals are summed (tab[i+1-1]
+    # becomes tab[i]), and the statements made useless by a constant condition are removed.
+
+    def __init__(self) -> None:
+        self.nb_removed_nodes = 0
+
+    def run(self, program: Program):
+        nb_nodes = count_nodes(program)
+
+        program.main_algorithm.statements = self.fold_statements(program.main_algorithm.statements)
+        for s_algo in program.sub_algorithms_list:
+            s_algo.statements = self.fold_statements(s_algo.statements)
+
+        self.nb_removed_nodes = nb_nodes - count_nodes(program)
+
+    def fold_statements(self, statements: list[Statement]) -> list[Statement]:
+        result = []
+        for statement in statements:
+            result += self.fold_statement(statement)
+        return result
+
+    def fold_statement(self, statement: Statement) -> list[Statement]:
+        # The statements replacing the given one
+        if isinstance(statement, AssignmentStatement):
+            statement.left = self.fold_expression(statement.left)
+            statement.right = self.fold_expression(statement.right)
+            return [statement]
+
+        if isinstance(statement, FunctionStatement):
+            statement.inputs = [self.fold_expression(input) for input in statement.inputs]
+            statement.outputs = [self.fold_expression(output) for output in statement.outputs]
+            return [statement]
+
+        if isinstance(statement, SiStatement):
+            conditional_blocks = []
+            default_block = statement.default_block
+            for conditional_block in statement.conditional_blocks:
+                condition = self.fold_expression(conditional_block.condition)
+                if isinstance(condition, LitBool):
+                    if not condition.bool_value:
+                        continue
+                    # The following blocks can't be reached
+                    default_block = conditional_block.statements
+                    break
+                conditional_block.condition = condition
+                conditional_block.statements = self.fold_statements(conditional_block.statements)
+                conditional_blocks.append(conditional_block)
+
+            default_block = self.fold_statements(default_block)
+            if not conditional_blocks:
+                return default_block
+
+            statement.conditional_blocks = conditional_blocks
+            statement.default_block = default_block
+            return [statement]
+
+        if isinstance(statement, TantQueStatement):
+            statement.condition = self.fold_expression(statement.condition)
+            if isinstance(statement.condition, LitBool) and not statement.condition.bool_value:
+                return []
+            statement.statements = self.fold_statements(statement.statements)
+            return [statement]
+
+        if isinstance(statement, PourStatement):
+            statement.start = self.fold_expression(statement.start)
+            statement.end = self.fold_expression(statement.end)
+
+            start = get_number(statement.start)
+            end = get_number(statement.end)
+            step = statement.step.int_value if statement.step is not None else 1
+            if start is not None and end is not None and step != 0:
+                if (step > 0 and start >= end) or (step < 0 and start <= end):
+                    # The loop variable is still set to the start, as the C loop would do
+                    return [AssignmentStatement(statement.variable, statement.start, s=statement)]
+
+            statement.statements = self.fold_statements(statement.statements)
+            return [statement]
+
+        return [statement]
+
+
+    def fold_expression(self, expression: Expression) -> Expression:
+        if isinstance(expression, SubExpression):
+            expression.expression = self.fold_expression(expression.expression)
+            if isinstance(expression.expression, LITERAL_TYPES):
+                return expression.expression
+            return expression
+
+        if isinstance(expression, UnaryOperation):
+            expression.expression = self.fold_expression(expression.expression)
+            return self.fold_unary_operation(expression)
+
+        if isinstance(expression, BinaryOperation):
+            expression.left = self.fold_expression(expression.left)
+            expression.right = self.fold_expression(expression.right)
+            folded = self.fold_binary_operation(expression)
+            if folded is not expression:
+                return folded
+            if isinstance(expression, (BinaryPlus, BinaryMinus)) and self.is_entier(expression):
+                return self.reassociate(expression)
+            return expression
+
+        if isinstance(expression, TableExpression):
+            expression.table_expression = self.fold_expression(expression.table_expression)
+            expression.indexes = [self.fold_expression(index) for index in expression.indexes]
+            return expression
+
+        if isinstance(expression, AttributeExpression):
+            expression.expression = self.fold_expression(expression.expression)
+            return expression
+
+        if isinstance(expression, FunctionExpression):
+            expression.inputs = [self.fold_expression(input) for input in expression.inputs]
+            return expression
+
+        return expression
+
+    @staticmethod
+    def is_entier(expression: Expression) -> bool:
+        return isinstance(expression.expr_type, BaseType) and expression.expr_type.value == "entier"
+
+    def fold_unary_operation(self, expression: UnaryOperation) -> Expression:
+        operand = expression.expression
+
+        if isinstance(expression, UnaryPlus) and isinstance(operand, (LitInt, LitFloat)):
+            return operand
+
+        if isinstance(expression, UnaryMinus):
+            if isinstance(operand, LitInt) and -operand.int_value <= INT_MAX:
+                return make_lit_int(-operand.int_value)
+            if isinstance(operand, LitFloat):
+                return make_lit_float(-operand.float_value, expression)
+
+        if isinstance(expression, UnaryNot) and isinstance(operand, LitBool):
+            return make_lit_bool(not operand.bool_value, expression)
+
+        return expression
+
+    def fold_binary_operation(self, expression: BinaryOperation) -> Expression:
+        left = expression.left
+        right = expression.right
+
+        if isinstance(left, LitBool) and isinstance(right, LitBool):
+            if isinstance(expression, BinaryAnd):
+                return make_lit_bool(left.bool_value and right.bool_value, expression)
+            if isinstance(expression, BinaryOr):
+                return make_lit_bool(left.bool_value or right.bool_value, expression)
+            if isinstance(expression, BinaryEq):
+                return make_lit_bool(left.bool_value == right.bool_value, expression)
+            return expression
+
+        if isinstance(left, LitChar) and isinstance(right, LitChar):
+            if left.char_value is None or right.char_value is None:
+                return expression
+            comparison = self.compare(expression, ord(left.char_value), ord(right.char_value))
+            return make_lit_bool(comparison, expression) if comparison is not None else expression
+
+        left_value = get_number(left)
+        right_value = get_number(right)
+        if left_value is None or right_value is None:
+            return expression
+
+        comparison = self.compare(expression, left_value, right_value)
+        if comparison is not None:
+            return make_lit_bool(comparison, expression)
+
+        if isinstance(left, LitInt) and isinstance(right, LitInt):
+            result = self.compute_entier(expression, left.int_value, right.int_value)
+            if result is None or not INT_MIN <= result <= INT_MAX:
+                return expression
+            return make_lit_int(result)
+
+        result = self.compute_reel(expression, left_value, right_value)
+        if result is None or not math.isfinite(result):
+            return expression
+        return make_lit_float(result, expression)
+
+    @staticmethod
+    def compare(expression: BinaryOperation, left: int | float, right: int | float) -> Optional[bool]:
+        if isinstance(expression, BinaryEq):
+            return left == right
+        if isinstance(expression, BinaryLT):
+            return left < right
+        if isinstance(expression, BinaryGT):
+            return left > right
+        if isinstance(expression, BinaryLTE):
+            return left <= right
+        if isinstance(expression, BinaryGTE):
+            return left >= right
+        return None
+
+    @staticmethod
+    def compute_entier(expression: BinaryOperation, left: int, right: int) -> Optional[int]:
+        if isinstance(expression, BinaryPlus):
+            return left + right
+        if isinstance(expression, BinaryMinus):
+            return left - right
+        if isinstance(expression, BinaryTimes):
+            return left * right
+        if isinstance(expression, BinaryDivide) and right != 0:
+            return c_divide(left, right)
+        if isinstance(expression, BinaryModulo) and right != 0:
+            return left - right * c_divide(left, right)
+        return None
+
+    @staticmethod
+    def compute_reel(expression: BinaryOperation, left: float, right: float) -> Optional[float]:
+        if isinstance(expression, BinaryPlus):
+            return left + right
+        if isinstance(expression, BinaryMinus):
+            return left - right
+        if isinstance(expression, BinaryTimes):
+            return left * right
+        if isinstance(expression, BinaryDivide) and right != 0:
+            return left / right
+        return None
+
+
+    def reassociate(self, expression: BinaryOperation) -> Expression:
+        # Splits the chain into its terms and their sign, with the literals summed apart
+        terms: list[tuple[bool, Expression]] = []
+        constant = 0
+        nb_literals = 0
+
+        def add_terms(term: Expression, positive: bool):
+            nonlocal constant, nb_literals
+            if isinstance(term, (BinaryPlus, BinaryMinus)) and self.is_entier(term):
+                add_terms(term.left, positive)
+                add_terms(term.right, positive if isinstance(term, BinaryPlus) else not positive)
+            elif isinstance(term, SubExpression) and isinstance(term.expression, (BinaryPlus, BinaryMinus)) and self.is_entier(term.expression):
+                add_terms(term.expression, positive)
+            elif isinstance(term, LitInt):
+                constant += term.int_value if positive else -term.int_value
+                nb_literals += 1
+            else:
+                terms.append((positive, term))
+
+        add_terms(expression, True)
+
+        # Only rebuilt when literals disappear, and when the first term can stay first without a unary minus
+        if (nb_literals < 2 and not (nb_literals == 1 and constant == 0)) or not terms or not terms[0][0]:
+            return expression
+        if not -INT_MAX <= constant <= INT_MAX:
+            return expression
+
+        result = terms[0][1]
+        for positive, term in terms[1:]:
+            result = self.make_additive(result, term, positive, expression)
+        if constant != 0:
+            result = self.make_additive(result, make_lit_int(abs(constant)), constant > 0, expression)
+
+        return result
+
+    @staticmethod
+    def make_additive(left: Expression, right: Expression, positive: bool, s: TrackPosition) -> BinaryOperation:
+        if positive:
+            result: BinaryOperation = BinaryPlus(left, right, Operator("+", s=s), s=s)
+        else:
+            result = BinaryMinus(left, right, Operator("-", s=s), s=s)
+        result.expr_type = BaseType("entier")
+        return result
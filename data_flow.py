@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Optional
+
+from ast_nodes import ID, AssignmentStatement, AttributeExpression, BaseType, CustomTypeDefinition, Expression, FunctionExpression, FunctionStatement, PourStatement, PtrType, Statement, SubExpression, TableExpression, TableInitializationStatement, TableType, UnaryPointer, VariableType, walk
+from program_variables import Symbol
+
+
+def get_root_id(expression: Expression) -> Optional[ID]:
+    # The variable whose memory an expression designates (tab for tab[i].champ), or None if it can't be known
+    while True:
+        if isinstance(expression, ID):
+            return expression
+        if isinstance(expression, TableExpression):
+            expression = expression.table_expression
+        elif isinstance(expression, (AttributeExpression, SubExpression)):
+            expression = expression.expression
+        else:
+            return None
+
+def get_root_symbol(expression: Expression) -> Optional[Symbol]:
+    root = get_root_id(expression)
+    return root.binding if root is not None else None
+
+
+def get_written_symbols(statements: list[Statement], pure_sub_algorithms: Optional[set[str]] = None) -> set[Symbol]:
+    # The variables that the statements may modify, entirely or in part. Tables given to a sub-algorithm are passed
+    # by reference, so they are counted as modified (unless the sub-algorithm is known to be pure), as well as the
+    # variables whose address is taken.
+    written: set[Symbol] = set()
+
+    def add_root(expression: Expression):
+        symbol = get_root_symbol(expression)
+        if symbol is not None:
+            written.add(symbol)
+
+    for statement in statements:
+        for node in walk(statement):
+            if isinstance(node, AssignmentStatement):
+                add_root(node.left)
+            elif isinstance(node, FunctionStatement):
+                for output in node.outputs:
+                    add_root(output)
+            elif isinstance(node, PourStatement):
+                add_root(node.variable)
+            elif isinstance(node, TableInitializationStatement):
+                add_root(node.table)
+            elif isinstance(node, UnaryPointer):
+                add_root(node.expression)
+
+            if isinstance(node, (FunctionStatement, FunctionExpression)):
+                if pure_sub_algorithms is not None and node.name.value in pure_sub_algorithms:
+                    continue
+                for input in node.inputs:
+                    if isinstance(input.expr_type, TableType):
+                        add_root(input)
+
+    return written
+
+def writes_through_pointer(statements: list[Statement]) -> bool:
+    # Whether the statements assign to memory designated by a pointer, which could be any variable
+    for statement in statements:
+        for node in walk(statement):
+            if isinstance(node, AssignmentStatement):
+                targets = [node.left]
+            elif isinstance(node, FunctionStatement):
+                targets = node.outputs
+            else:
+                continue
+
+            # Assignable expressions that don't end in a variable go through a dereference
+            if any(get_root_id(target) is None for target in targets):
+                return True
+
+    return False
+
+def type_contains_pointer(var_type: VariableType, custom_types: dict[str, CustomTypeDefinition]) -> bool:
+    if isinstance(var_type, PtrType):
+        return True
+    if isinstance(var_type, TableType):
+        return type_contains_pointer(var_type.type, custom_types)
+    if isinstance(var_type, BaseType) and var_type.value in custom_types:
+        return any(type_contains_pointer(attribute.type, custom_types) for attribute in custom_types[var_type.value].attributes)
+    return False
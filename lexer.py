@@ -65,6 +65,14 @@ class MyLexer:
 
     literals = "+-*/(){}[]=:,;.&^%!<>"
 
+    # The escape sequences allowed in a character literal, and the character they stand for
+    char_escapes = {
+        'n' : "\n",
+        '0' : "\0",
+        "'" : "'",
+        '\\': "\\",
+    }
+
     def __init__(self, debug = False):
         self.lexer = lex.lex(module=self, debug=debug)
         self._has_reached_eof = False
@@ -0,0 +1,172 @@
+from __future__ import annotations
+from typing import Any, Optional
+
+from ast_nodes import *
+from data_flow import get_written_symbols, writes_through_pointer
+from loop_invariants import expression_key
+from parallel_loops import get_scalar_reduction, is_defined_first, is_iterator_index, mentions
+from program_variables import VARIABLE_KIND, Symbol
+
+
+def get_last_dimension(indexes: list[Expression], symbol: Symbol) -> int:
+    # The last dimension (the fastest varying in memory) whose index depends on the variable, -1 if none does
+    result = -1
+    for k, index in enumerate(indexes):
+        if mentions(index, symbol):
+            result = k
+    return result
+
+def has_positive_trip_count(loop: PourStatement) -> bool:
+    if not isinstance(loop.start, LitInt) or not isinstance(loop.end, LitInt):
+        return False
+    step = loop.step.int_value if loop.step is not None else 1
+    return loop.start.int_value < loop.end.int_value if step > 0 else loop.start.int_value > loop.end.int_value
+
+
+class LoopInterchangePass:
+    # Swaps two perfectly nested pour loops (the outer one containing only the inner one) when the inner loop walks
+    # through the tables along a dimension before the one of the outer loop. Tables are stored in row-major order
+    # (tab[i][j] is next to tab[i][j + 1]), so the inner loop should go along the last dimension.
+    # The order of the iterations can only change when no iteration uses what another one writes: each written
+    # table is always accessed at the same element, with the two loop variables in two of its dimensions, and each
+    # written scalar is assigned before being read, or only accumulates an entier sum or product. The loop variables
+    # end with other values when one of the loops doesn't run, so they mustn't be used after the nest, unless both
+    # loops have literal bounds.
+
+    def __init__(self, pure_sub_algorithms: set[str], distinct_parameters: dict[str, set[str]]) -> None:
+        self.pure_sub_algorithms = pure_sub_algorithms
+        self.distinct_parameters = distinct_parameters
+        self.interchanged_nests: list[str] = []
+
+    def run(self, program: Program):
+        main_algorithm = program.main_algorithm
+        self.interchange_in_statements(main_algorithm.statements, main_algorithm.name.value, set(), [])
+        for s_algo in program.sub_algorithms_list:
+            name = s_algo.name.value
+            self.interchange_in_statements(s_algo.statements, name, self.distinct_parameters[name], [])
+
+    def interchange_in_statements(self, statements: list[Statement], algorithm_name: str, distinct_parameters: set[str], following: Optional[list[Statement]]):
+        # The following statements are those run after these ones, None inside a loop, where they run before as well
+        for k, statement in enumerate(statements):
+            rest = statements[k + 1:] + following if following is not None else None
+
+            if isinstance(statement, PourStatement):
+                if self.should_interchange(statement, distinct_parameters, rest):
+                    inner_loop = statement.statements[0]
+                    assert isinstance(inner_loop, PourStatement)
+                    self.interchanged_nests.append(f"{algorithm_name}:{statement.variable.lineno}")
+                    statement.variable, inner_loop.variable = inner_loop.variable, statement.variable
+                    statement.start, inner_loop.start = inner_loop.start, statement.start
+                    statement.end, inner_loop.end = inner_loop.end, statement.end
+                    statement.step, inner_loop.step = inner_loop.step, statement.step
+                self.interchange_in_statements(statement.statements, algorithm_name, distinct_parameters, None)
+            elif isinstance(statement, TantQueStatement):
+                self.interchange_in_statements(statement.statements, algorithm_name, distinct_parameters, None)
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    self.interchange_in_statements(conditional_block.statements, algorithm_name, distinct_parameters, rest)
+                self.interchange_in_statements(statement.default_block, algorithm_name, distinct_parameters, rest)
+
+    def should_interchange(self, outer_loop: PourStatement, distinct_parameters: set[str], following: Optional[list[Statement]]) -> bool:
+        if len(outer_loop.statements) != 1 or not isinstance(outer_loop.statements[0], PourStatement):
+            return False
+        inner_loop = outer_loop.statements[0]
+        outer_iterator = outer_loop.variable.binding
+        inner_iterator = inner_loop.variable.binding
+        if outer_iterator is None or inner_iterator is None or outer_iterator is inner_iterator:
+            return False
+
+        body = inner_loop.statements
+        nodes = [node for statement in body for node in walk(statement)]
+        if self.get_stride_balance(nodes, outer_iterator, inner_iterator) <= 0:
+            return False
+
+        # Pointers could designate anything, and sub-algorithms with side effects could write anything
+        if writes_through_pointer(body) or any(isinstance(node, (UnaryPointer, UnaryDereference)) for node in nodes):
+            return False
+        if any(isinstance(node, (FunctionStatement, FunctionExpression)) and node.name.value not in self.pure_sub_algorithms for node in nodes):
+            return False
+
+        # The bounds are evaluated once per loop after the interchange, so they must give the same values in any order
+        written = get_written_symbols(body, self.pure_sub_algorithms)
+        if outer_iterator in written or inner_iterator in written:
+            return False
+        for bound in (outer_loop.start, outer_loop.end, inner_loop.start, inner_loop.end):
+            for node in walk(bound):
+                if isinstance(node, FunctionExpression) or (isinstance(node, ID) and node.binding in written | {outer_iterator, inner_iterator}):
+                    return False
+        if any(loop.step is not None and loop.step.int_value == 0 for loop in (outer_loop, inner_loop)):
+            return False
+
+        if not self.tables_are_separated(nodes, written, outer_iterator, inner_iterator):
+            return False
+        for symbol in written:
+            if isinstance(symbol.type, TableType):
+                # A table parameter could be the same table as another one, read at other elements
+                if symbol.kind != VARIABLE_KIND and symbol.name not in distinct_parameters:
+                    return False
+            elif not is_defined_first(body, symbol) and get_scalar_reduction(body, symbol) is None:
+                return False
+
+        if all(has_positive_trip_count(loop) for loop in (outer_loop, inner_loop)):
+            return True
+        return self.is_unused(outer_iterator, following) and self.is_unused(inner_iterator, following)
+
+    @staticmethod
+    def get_stride_balance(nodes: list[Any], outer_iterator: Symbol, inner_iterator: Symbol) -> int:
+        # The number of table accesses where the inner loop goes along an earlier dimension than the outer loop, minus
+        # those where it already goes along a later one
+        balance = 0
+        for node in nodes:
+            if not isinstance(node, TableExpression) or not isinstance(node.table_expression, ID):
+                continue
+            outer_dimension = get_last_dimension(node.indexes, outer_iterator)
+            inner_dimension = get_last_dimension(node.indexes, inner_iterator)
+            if outer_dimension == -1 or inner_dimension == -1:
+                continue
+            if inner_dimension < outer_dimension:
+                balance += 1
+            elif inner_dimension > outer_dimension:
+                balance -= 1
+        return balance
+
+    @staticmethod
+    def tables_are_separated(nodes: list[Any], written: set[Symbol], outer_iterator: Symbol, inner_iterator: Symbol) -> bool:
+        # Each iteration of the nest only accesses its own elements of the written tables
+        accesses: dict[Symbol, list[list[Expression]]] = {}
+        table_roots: set[int] = set()
+        for node in nodes:
+            if isinstance(node, TableExpression) and isinstance(node.table_expression, ID) and node.table_expression.binding in written:
+                accesses.setdefault(node.table_expression.binding, []).append(node.indexes)
+                table_roots.add(id(node.table_expression))
+            elif isinstance(node, TableInitializationStatement) and node.table.binding in written:
+                accesses.setdefault(node.table.binding, []).append(node.indexes)
+                table_roots.add(id(node.table))
+
+        for node in nodes:
+            # The whole table, given to a sub-algorithm or assigned
+            if isinstance(node, ID) and node.binding in written and isinstance(node.binding.type, TableType) and id(node) not in table_roots:
+                return False
+
+        for symbol in written:
+            if not isinstance(symbol.type, TableType):
+                continue
+            if symbol not in accesses:
+                return False
+
+            indexes = accesses[symbol][0]
+            if any([expression_key(index) for index in other_indexes] != [expression_key(index) for index in indexes] for other_indexes in accesses[symbol]):
+                return False
+            outer_dimensions = {k for k, index in enumerate(indexes) if is_iterator_index(index, outer_iterator)}
+            inner_dimensions = {k for k, index in enumerate(indexes) if is_iterator_index(index, inner_iterator)}
+            if not outer_dimensions or not inner_dimensions:
+                return False
+
+        return True
+
+    @staticmethod
+    def is_unused(symbol: Symbol, following: Optional[list[Statement]]) -> bool:
+        # Whether the value of a local variable is never read by the statements run after the nest
+        if following is None or symbol.kind != VARIABLE_KIND:
+            return False
+        return is_defined_first(following, symbol) or not any(mentions(statement, symbol) for statement in following)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+from typing import Any, cast
+
+from ast_nodes import *
+from data_flow import get_root_symbol, get_written_symbols, writes_through_pointer
+from program_variables import VARIABLE_KIND, AlgorithmVariables, ProgramVariables, Symbol
+
+Loop = PourStatement | TantQueStatement
+
+
+def expression_key(expression: Expression) -> Any:
+    # Identifies expressions computing the same thing, whatever their position in the source
+    if isinstance(expression, ID):
+        return ("id", id(expression.binding) if expression.binding is not None else expression.value)
+    if isinstance(expression, (LitInt, LitFloat, LitChar, LitBool)):
+        return (type(expression).__name__, expression.value)
+    if isinstance(expression, BinaryOperation):
+        return (type(expression).__name__, expression_key(expression.left), expression_key(expression.right))
+    if isinstance(expression, UnaryOperation):
+        return (type(expression).__name__, expression_key(expression.expression))
+    if isinstance(expression, SubExpression):
+        return expression_key(expression.expression)
+    if isinstance(expression, AttributeExpression):
+        return ("attribute", expression_key(expression.expression), expression.attribute.value)
+    if isinstance(expression, TableExpression):
+        return ("table", expression_key(expression.table_expression), tuple(expression_key(index) for index in expression.indexes))
+    if isinstance(expression, FunctionExpression):
+        return ("call", expression.name.value, tuple(expression_key(input) for input in expression.inputs))
+    return ("node", id(expression))
+
+def new_temporary(algo_variables: AlgorithmVariables, variable_declarations: list[VariableDeclaration], prefix: str, var_type: VariableType, s: TrackPosition) -> ID:
+    # Declares a new local variable of the algorithm, named after the prefix and the first free number
+    symbols = algo_variables.symbols
+    i = 0
+    while f"{prefix}{i}" in symbols:
+        i += 1
+    name = f"{prefix}{i}"
+
+    symbol = Symbol(name, var_type, VARIABLE_KIND)
+    symbols[name] = symbol
+    algo_variables.variables[name] = var_type
+    variable_declarations.append(VariableDeclaration(ID(name), var_type))
+
+    temporary = ID(name, s=s)
+    temporary.binding = symbol
+    temporary.expr_type = var_type
+    return temporary
+
+def new_id(temporary: ID) -> ID:
+    # Another use of a temporary. The IDs aren't shared between places of the tree, as the passes replace nodes by id
+    # (only the literals of make_lit_int, which are never changed, are shared)
+    result = ID(temporary.value, s=temporary)
+    result.binding = temporary.binding
+    result.expr_type = temporary.expr_type
+    return result
+
+
+class LoopInvariantHoistingPass:
+    # Computes once, before a loop, what doesn't change while it runs:
+    #   - the end bound of a pour loop, which the C loop would evaluate on each iteration. Calls to pure
+    #     sub-algorithms are allowed, as the bound is evaluated at least once anyway.
+    #   - the operations of the loop body (and of a tant que condition) on variables the loop doesn't write. These
+    #     would be computed even if the loop never runs, so only operations that can't fail are taken: no table
+    #     access, dereference or call, and no integer division by something else than a non-zero literal.
+    #     A réel operation with a literal is computed in double, and is left in place so as not to round it to float.
+    # The values are kept in new local variables, assigned just before the loop.
+
+    SCALAR_TYPES = ("entier", "réel", "caractère", "booléen")
+
+    def __init__(self, program_variables: ProgramVariables, pure_sub_algorithms: set[str]) -> None:
+        self.program_variables = program_variables
+        self.pure_sub_algorithms = pure_sub_algorithms
+        self.nb_hoisted_bounds = 0
+        self.nb_hoisted_expressions = 0
+
+        self.algo_variables: AlgorithmVariables
+        self.variable_declarations: list[VariableDeclaration]
+        self.address_taken: set[Symbol] = set()
+
+    def run(self, program: Program):
+        main_algorithm = program.main_algorithm
+        self.run_on_algorithm(main_algorithm, self.program_variables.main_algorithm_variables)
+        for s_algo in program.sub_algorithms_list:
+            self.run_on_algorithm(s_algo, self.program_variables.sub_algorithm_variables[s_algo.name.value])
+
+    def run_on_algorithm(self, algorithm: MainAlgorithm | SubAlgorithm, algo_variables: AlgorithmVariables):
+        self.algo_variables = algo_variables
+        self.variable_declarations = list(algorithm.variable_declarations)
+
+        # Variables that could be written through a pointer
+        self.address_taken = set()
+        for statement in algorithm.statements:
+            for node in walk(statement):
+                if isinstance(node, UnaryPointer):
+                    symbol = get_root_symbol(node.expression)
+                    if symbol is not None:
+                        self.address_taken.add(symbol)
+
+        algorithm.statements = self.hoist_statements(algorithm.statements)
+        algorithm.variable_declarations = self.variable_declarations
+
+    def hoist_statements(self, statements: list[Statement]) -> list[Statement]:
+        result: list[Statement] = []
+        for statement in statements:
+            if isinstance(statement, (PourStatement, TantQueStatement)):
+                result += self.hoist_loop(statement)
+                statement.statements = self.hoist_statements(statement.statements)
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    conditional_block.statements = self.hoist_statements(conditional_block.statements)
+                statement.default_block = self.hoist_statements(statement.default_block)
+
+            result.append(statement)
+
+        return result
+
+    def hoist_loop(self, loop: Loop) -> list[Statement]:
+        # The assignments of the hoisted values, to put before the loop
+        written = get_written_symbols([loop])
+        if writes_through_pointer([loop]) or self.calls_impure(loop):
+            written |= self.address_taken
+
+        prelude: list[Statement] = []
+
+        if isinstance(loop, PourStatement) and not isinstance(loop.end, (ID, LitInt, LitFloat)):
+            start_has_call = any(isinstance(node, FunctionExpression) for node in walk(loop.start))
+            if not start_has_call and self.is_invariant(loop.end, written, in_body=False) and not self.computed_in_double(loop.end):
+                temporary = new_temporary(self.algo_variables, self.variable_declarations, "_fin", cast(VariableType, loop.end.expr_type), loop)
+                prelude.append(AssignmentStatement(temporary, loop.end, s=loop))
+                loop.end = new_id(temporary)
+                self.nb_hoisted_bounds += 1
+
+        hoisted: dict[Any, ID] = {}
+        if isinstance(loop, TantQueStatement):
+            loop.condition = self.hoist_expression(loop.condition, written, hoisted, prelude)
+        for statement in loop.statements:
+            self.hoist_in_statement(statement, written, hoisted, prelude)
+
+        return prelude
+
+    def calls_impure(self, loop: Loop) -> bool:
+        return any(isinstance(node, (FunctionStatement, FunctionExpression)) and node.name.value not in self.pure_sub_algorithms for node in walk(loop))
+
+    def hoist_in_statement(self, statement: Statement, written: set[Symbol], hoisted: dict[Any, ID], prelude: list[Statement]):
+        def hoist(expression: Expression) -> Expression:
+            return self.hoist_expression(expression, written, hoisted, prelude)
+
+        if isinstance(statement, AssignmentStatement):
+            statement.left = self.hoist_in_assignable(statement.left, written, hoisted, prelude)
+            statement.right = hoist(statement.right)
+        elif isinstance(statement, FunctionStatement):
+            statement.inputs = [hoist(input) for input in statement.inputs]
+        elif isinstance(statement, PourStatement):
+            statement.start = hoist(statement.start)
+            statement.end = hoist(statement.end)
+            for sub_statement in statement.statements:
+                self.hoist_in_statement(sub_statement, written, hoisted, prelude)
+        elif isinstance(statement, TantQueStatement):
+            statement.condition = hoist(statement.condition)
+            for sub_statement in statement.statements:
+                self.hoist_in_statement(sub_statement, written, hoisted, prelude)
+        elif isinstance(statement, SiStatement):
+            for conditional_block in statement.conditional_blocks:
+                conditional_block.condition = hoist(conditional_block.condition)
+                for sub_statement in conditional_block.statements:
+                    self.hoist_in_statement(sub_statement, written, hoisted, prelude)
+            for sub_statement in statement.default_block:
+                self.hoist_in_statement(sub_statement, written, hoisted, prelude)
+
+    def hoist_in_assignable(self, expression: Expression, written: set[Symbol], hoisted: dict[Any, ID], prelude: list[Statement]) -> Expression:
+        # Only the indexes of an assigned expression are values
+        if isinstance(expression, TableExpression):
+            expression.table_expression = self.hoist_in_assignable(expression.table_expression, written, hoisted, prelude)
+            expression.indexes = [self.hoist_expression(index, written, hoisted, prelude) for index in expression.indexes]
+        elif isinstance(expression, (AttributeExpression, SubExpression)):
+            expression.expression = self.hoist_in_assignable(expression.expression, written, hoisted, prelude)
+        return expression
+
+    def hoist_expression(self, expression: Expression, written: set[Symbol], hoisted: dict[Any, ID], prelude: list[Statement]) -> Expression:
+        # Replaces the largest invariant operations of the expression by temporaries
+        if isinstance(expression, (BinaryOperation, UnaryOperation)) and not isinstance(expression, (UnaryPointer, UnaryDereference)):
+            if self.is_scalar(expression) and not self.computed_in_double(expression) and self.is_invariant(expression, written, in_body=True) and self.has_variable(expression):
+                key = expression_key(expression)
+                if key not in hoisted:
+                    temporary = new_temporary(self.algo_variables, self.variable_declarations, "_inv", cast(VariableType, expression.expr_type), expression)
+                    prelude.append(AssignmentStatement(temporary, expression, s=expression))
+                    hoisted[key] = temporary
+                    self.nb_hoisted_expressions += 1
+                return new_id(hoisted[key])
+
+        if isinstance(expression, SubExpression):
+            expression.expression = self.hoist_expression(expression.expression, written, hoisted, prelude)
+            # No parentheses around a temporary
+            return expression.expression if isinstance(expression.expression, ID) else expression
+
+        if isinstance(expression, BinaryOperation):
+            expression.left = self.hoist_expression(expression.left, written, hoisted, prelude)
+            expression.right = self.hoist_expression(expression.right, written, hoisted, prelude)
+        elif isinstance(expression, UnaryOperation) and not isinstance(expression, UnaryPointer):
+            expression.expression = self.hoist_expression(expression.expression, written, hoisted, prelude)
+        elif isinstance(expression, TableExpression):
+            expression.indexes = [self.hoist_expression(index, written, hoisted, prelude) for index in expression.indexes]
+        elif isinstance(expression, FunctionExpression):
+            expression.inputs = [self.hoist_expression(input, written, hoisted, prelude) for input in expression.inputs]
+
+        return expression
+
+    def is_scalar(self, expression: Expression) -> bool:
+        return isinstance(expression.expr_type, BaseType) and expression.expr_type.value in self.SCALAR_TYPES
+
+    @staticmethod
+    def computed_in_double(expression: Expression) -> bool:
+        # C computes a réel operation with a literal in double: a float temporary would round the value in the middle
+        # of the expression
+        is_reel = isinstance(expression.expr_type, BaseType) and expression.expr_type.value == "réel"
+        return is_reel and any(isinstance(node, LitFloat) for node in walk(expression))
+
+    @staticmethod
+    def has_variable(expression: Expression) -> bool:
+        return any(isinstance(node, ID) and node.binding is not None for node in walk(expression))
+
+    def is_invariant(self, expression: Expression, written: set[Symbol], in_body: bool) -> bool:
+        for node in walk(expression):
+            if isinstance(node, ID):
+                if node.binding in written:
+                    return False
+            elif isinstance(node, UnaryDereference):
+                return False
+            elif isinstance(node, FunctionExpression):
+                if in_body or node.name.value not in self.pure_sub_algorithms:
+                    return False
+            elif isinstance(node, TableExpression):
+                if in_body:
+                    return False
+            elif isinstance(node, (BinaryDivide, BinaryModulo)) and in_body:
+                divisor = node.right
+                is_entier = isinstance(divisor.expr_type, BaseType) and divisor.expr_type.value == "entier"
+                if is_entier and not (isinstance(divisor, LitInt) and divisor.int_value != 0):
+                    return False
+
+        return True
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import copy
+from dataclasses import fields
+from typing import Any, Optional, cast
+
+from ast_nodes import *
+from call_graph import count_statements
+from constant_folding import INT_MAX, INT_MIN
+from data_flow import get_root_symbol, get_written_symbols
+from loop_invariants import new_id
+from program_variables import Symbol
+
+
+def get_trip_count(loop: PourStatement) -> Optional[int]:
+    # The number of iterations of a loop with literal bounds, run like the C loop (i < end, or i > end going down)
+    if not isinstance(loop.start, LitInt) or not isinstance(loop.end, LitInt):
+        return None
+    step = loop.step.int_value if loop.step is not None else 1
+    if step == 0:
+        return None
+
+    distance = loop.end.int_value - loop.start.int_value if step > 0 else loop.start.int_value - loop.end.int_value
+    return max(0, (distance + abs(step) - 1) // abs(step))
+
+def copy_replacing(node: Any, symbol: Symbol, make_value) -> Any:
+    # A copy of the node where each use of the variable is replaced by a new value. The annotations of the semantic
+    # analysis are shared with the original nodes.
+    if isinstance(node, ID) and node.binding is symbol:
+        return make_value(node)
+
+    result = copy.copy(node)
+    for f in fields(node):
+        if f.name in ("expr_type", "binding"):
+            continue
+        value = getattr(node, f.name)
+        if isinstance(value, list):
+            setattr(result, f.name, [copy_replacing(item, symbol, make_value) if hasattr(item, "__dataclass_fields__") else item for item in value])
+        elif hasattr(value, "__dataclass_fields__"):
+            setattr(result, f.name, copy_replacing(value, symbol, make_value))
+    return result
+
+
+class LoopUnrollingPass:
+    # Unrolls the pour loops whose bounds are literals, so that the number of iterations is known:
+    #   - fully, when the copies of the body make at most full_unroll_threshold statements. Each copy uses the value
+    #     of the loop variable as a literal.
+    #   - partially for the other innermost loops, which run unroll_factor copies of the body per iteration (using
+    #     i, i + step, i + 2 * step...). The remaining iterations are fully unrolled after the loop.
+    # The loop variable ends with the value the C loop would give it. A loop is only unrolled if its body can't change
+    # the loop variable: it isn't written by the body, and its address is never taken in the algorithm.
+
+    def __init__(self, full_unroll_threshold: Optional[int], unroll_factor: Optional[int]) -> None:
+        self.full_unroll_threshold = full_unroll_threshold
+        self.unroll_factor = unroll_factor
+        self.nb_full_unrolls = 0
+        self.nb_partial_unrolls = 0
+
+        self.address_taken: set[Symbol] = set()
+
+    def run(self, program: Program):
+        for algorithm in [program.main_algorithm] + program.sub_algorithms_list:
+            self.address_taken = set()
+            for statement in algorithm.statements:
+                for node in walk(statement):
+                    if isinstance(node, UnaryPointer):
+                        symbol = get_root_symbol(node.expression)
+                        if symbol is not None:
+                            self.address_taken.add(symbol)
+
+            algorithm.statements = self.unroll_statements(algorithm.statements)
+
+    def unroll_statements(self, statements: list[Statement]) -> list[Statement]:
+        # The inner loops first, so that an outer loop can then be unrolled with the copies of the inner ones
+        result: list[Statement] = []
+        for statement in statements:
+            if isinstance(statement, (PourStatement, TantQueStatement)):
+                statement.statements = self.unroll_statements(statement.statements)
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    conditional_block.statements = self.unroll_statements(conditional_block.statements)
+                statement.default_block = self.unroll_statements(statement.default_block)
+
+            if isinstance(statement, PourStatement):
+                result += self.unroll_loop(statement)
+            else:
+                result.append(statement)
+
+        return result
+
+    def unroll_loop(self, loop: PourStatement) -> list[Statement]:
+        # The statements replacing the loop
+        nb_iterations = get_trip_count(loop)
+        iterator = loop.variable.binding
+        if nb_iterations is None or iterator is None or iterator in self.address_taken:
+            return [loop]
+        if iterator in get_written_symbols(loop.statements):
+            return [loop]
+
+        start = loop.start.int_value
+        step = loop.step.int_value if loop.step is not None else 1
+        final_value = start + nb_iterations * step
+        if not INT_MIN <= final_value <= INT_MAX:
+            return [loop]
+
+        if self.full_unroll_threshold is not None and nb_iterations * count_statements(loop.statements) <= self.full_unroll_threshold:
+            self.nb_full_unrolls += 1
+            return self.copies_with_values(loop, range(nb_iterations)) + [self.final_assignment(loop, final_value)]
+
+        factor = self.unroll_factor
+        if factor is None or factor < 2 or nb_iterations < factor:
+            return [loop]
+        if any(isinstance(node, (PourStatement, TantQueStatement)) for statement in loop.statements for node in walk(statement)):
+            return [loop]
+
+        # The unrolled loop goes as far as a whole number of groups of iterations
+        nb_groups = nb_iterations // factor
+        unrolled_loop = PourStatement(loop.variable, loop.start, make_lit_int(start + nb_groups * factor * step), make_lit_int(factor * step), [], s=loop)
+        for k in range(factor):
+            unrolled_loop.statements += [copy_replacing(statement, iterator, lambda use: self.offset_id(use, k * step)) for statement in loop.statements]
+        self.nb_partial_unrolls += 1
+
+        result: list[Statement] = [unrolled_loop]
+        if nb_iterations % factor != 0:
+            result += self.copies_with_values(loop, range(nb_groups * factor, nb_iterations))
+            result.append(self.final_assignment(loop, final_value))
+        return result
+
+    def copies_with_values(self, loop: PourStatement, iterations: range) -> list[Statement]:
+        iterator = loop.variable.binding
+        start = cast(LitInt, loop.start).int_value
+        step = loop.step.int_value if loop.step is not None else 1
+
+        result: list[Statement] = []
+        for k in iterations:
+            value = start + k * step
+            result += [copy_replacing(statement, iterator, lambda use: self.literal(value, use)) for statement in loop.statements]
+        return result
+
+    def final_assignment(self, loop: PourStatement, final_value: int) -> AssignmentStatement:
+        return AssignmentStatement(new_id(loop.variable), make_lit_int(final_value), s=loop)
+
+    @staticmethod
+    def literal(value: int, s: TrackPosition) -> Expression:
+        # A negative value is put between parentheses, so that -i doesn't become --1
+        if value >= 0:
+            return make_lit_int(value)
+        result = SubExpression(make_lit_int(value), s=s)
+        result.expr_type = BaseType("entier")
+        return result
+
+    @staticmethod
+    def offset_id(use: ID, offset: int) -> Expression:
+        # (i + offset), between parentheses as it takes the place of a single variable
+        if offset == 0:
+            return new_id(use)
+        if offset > 0:
+            addition: BinaryOperation = BinaryPlus(new_id(use), make_lit_int(offset), Operator("+", s=use), s=use)
+        else:
+            addition = BinaryMinus(new_id(use), make_lit_int(-offset), Operator("-", s=use), s=use)
+        addition.expr_type = BaseType("entier")
+        result = SubExpression(addition, s=use)
+        result.expr_type = BaseType("entier")
+        return result
@@ -0,0 +1,246 @@
+from __future__ import annotations
+from typing import Any, Optional
+
+from ast_nodes import *
+from data_flow import get_written_symbols, writes_through_pointer
+from loop_invariants import expression_key
+from program_variables import VARIABLE_KIND, Symbol
+
+
+class ParallelLoop:
+    # How the variables written by a parallel loop are shared between the threads: the scalars assigned before being
+    # read in each iteration get a copy per thread (and keep the value of the last iteration), the sums and products
+    # of entiers are reductions. The written symbols are kept, so that the variables added by later passes are known.
+    def __init__(self, private: set[Symbol], reductions: dict[Symbol, str], written: set[Symbol]) -> None:
+        self.private = private
+        self.reductions = reductions
+        self.written = written
+
+
+def mentions(node: Any, symbol: Symbol) -> bool:
+    return any(isinstance(child, ID) and child.binding is symbol for child in walk(node))
+
+def get_additive_terms(expression: Expression, positive: bool, terms: list[tuple[bool, Expression]]):
+    if isinstance(expression, (BinaryPlus, BinaryMinus)):
+        get_additive_terms(expression.left, positive, terms)
+        get_additive_terms(expression.right, positive if isinstance(expression, BinaryPlus) else not positive, terms)
+    elif isinstance(expression, SubExpression):
+        get_additive_terms(expression.expression, positive, terms)
+    else:
+        terms.append((positive, expression))
+
+def get_factors(expression: Expression, factors: list[Expression]):
+    if isinstance(expression, BinaryTimes):
+        get_factors(expression.left, factors)
+        get_factors(expression.right, factors)
+    elif isinstance(expression, SubExpression):
+        get_factors(expression.expression, factors)
+    else:
+        factors.append(expression)
+
+def get_reduction_operator(statement: Statement, symbol: Symbol) -> Optional[str]:
+    # The OpenMP operator of an assignment s <-- s + a - b or s <-- a * s * b, where the other terms don't read s
+    if not isinstance(statement, AssignmentStatement) or not isinstance(statement.left, ID) or statement.left.binding is not symbol:
+        return None
+
+    terms: list[tuple[bool, Expression]] = []
+    get_additive_terms(statement.right, True, terms)
+    if len(terms) > 1:
+        uses = [(positive, term) for positive, term in terms if mentions(term, symbol)]
+        if len(uses) == 1 and uses[0][0] and isinstance(uses[0][1], ID):
+            return "+"
+        return None
+
+    factors: list[Expression] = []
+    get_factors(statement.right, factors)
+    uses = [factor for factor in factors if mentions(factor, symbol)]
+    if len(factors) > 1 and len(uses) == 1 and isinstance(uses[0], ID):
+        return "*"
+    return None
+
+def is_iterator_index(index: Expression, iterator: Symbol) -> bool:
+    # i, i + c or i - c, which take a different value at each iteration
+    if isinstance(index, ID):
+        return index.binding is iterator
+    if isinstance(index, (BinaryPlus, BinaryMinus)):
+        return isinstance(index.left, ID) and index.left.binding is iterator and isinstance(index.right, LitInt)
+    return False
+
+
+def find_parallel_loops(program: Program, pure_sub_algorithms: set[str], distinct_parameters: dict[str, set[str]]) -> dict[int, ParallelLoop]:
+    # The pour loops whose iterations can run in any order, by id of the statement. Only the outermost ones are
+    # searched, as OpenMP doesn't parallelize the loops inside a parallel one by default. The distinct parameters of
+    # a sub-algorithm are the tables that never share memory with its other parameters.
+    loops: dict[int, ParallelLoop] = {}
+
+    def search(statements: list[Statement], parameters: set[str]):
+        for statement in statements:
+            if isinstance(statement, PourStatement):
+                parallel_loop = analyze_loop(statement, pure_sub_algorithms, parameters)
+                if parallel_loop is not None:
+                    loops[id(statement)] = parallel_loop
+                    continue
+            if isinstance(statement, (PourStatement, TantQueStatement)):
+                search(statement.statements, parameters)
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    search(conditional_block.statements, parameters)
+                search(statement.default_block, parameters)
+
+    search(program.main_algorithm.statements, set())
+    for s_algo in program.sub_algorithms_list:
+        search(s_algo.statements, distinct_parameters[s_algo.name.value])
+
+    return loops
+
+def find_vectorizable_loops(program: Program, pure_sub_algorithms: set[str], distinct_parameters: dict[str, set[str]]) -> set[int]:
+    # The innermost pour loops (by id of the statement) where no iteration accesses the table elements written by
+    # another one, so that several iterations can be computed at once by SIMD instructions. The scalars are left to
+    # the C compiler, which knows how to vectorize the reductions it can reorder.
+    loops: set[int] = set()
+
+    def search(statements: list[Statement], parameters: set[str]):
+        for statement in statements:
+            if isinstance(statement, (PourStatement, TantQueStatement)):
+                if any(isinstance(node, (PourStatement, TantQueStatement)) for sub_statement in statement.statements for node in walk(sub_statement)):
+                    search(statement.statements, parameters)
+                elif isinstance(statement, PourStatement) and has_independent_accesses(statement, pure_sub_algorithms, parameters):
+                    loops.add(id(statement))
+            elif isinstance(statement, SiStatement):
+                for conditional_block in statement.conditional_blocks:
+                    search(conditional_block.statements, parameters)
+                search(statement.default_block, parameters)
+
+    search(program.main_algorithm.statements, set())
+    for s_algo in program.sub_algorithms_list:
+        search(s_algo.statements, distinct_parameters[s_algo.name.value])
+
+    return loops
+
+def analyze_loop(loop: PourStatement, pure_sub_algorithms: set[str], distinct_parameters: set[str]) -> Optional[ParallelLoop]:
+    if not has_independent_accesses(loop, pure_sub_algorithms, distinct_parameters):
+        return None
+
+    body = loop.statements
+    written = get_written_symbols(body, pure_sub_algorithms)
+    private: set[Symbol] = set()
+    reductions: dict[Symbol, str] = {}
+    for symbol in written:
+        if isinstance(symbol.type, TableType):
+            continue
+        if is_defined_first(body, symbol):
+            private.add(symbol)
+            continue
+
+        operator = get_scalar_reduction(body, symbol)
+        if operator is None:
+            return None
+        reductions[symbol] = operator
+
+    return ParallelLoop(private, reductions, written)
+
+def has_independent_accesses(loop: PourStatement, pure_sub_algorithms: set[str], distinct_parameters: set[str]) -> bool:
+    # Whether the iterations only share the tables they read, whatever the order they run in
+    iterator = loop.variable.binding
+    if iterator is None or not isinstance(iterator.type, BaseType) or iterator.type.value != "entier":
+        return False
+    if loop.step is not None and loop.step.int_value == 0:
+        return False
+
+    body = loop.statements
+    nodes = [node for statement in body for node in walk(statement)]
+
+    # Pointers could designate anything, and sub-algorithms with side effects could write anything
+    if writes_through_pointer(body) or any(isinstance(node, (UnaryPointer, UnaryDereference)) for node in nodes):
+        return False
+    calls = [node for node in walk(loop) if isinstance(node, (FunctionStatement, FunctionExpression))]
+    if any(call.name.value not in pure_sub_algorithms for call in calls):
+        return False
+
+    # The number of iterations must be known when the loop starts, when the C loop would evaluate the end at each one
+    written = get_written_symbols(body, pure_sub_algorithms)
+    if iterator in written or any(isinstance(node, ID) and node.binding in written for node in walk(loop.end)):
+        return False
+
+    if not tables_are_independent(nodes, written, iterator):
+        return False
+
+    # A table parameter could be the same table as another one, read at other elements
+    for symbol in written:
+        if isinstance(symbol.type, TableType) and symbol.kind != VARIABLE_KIND and symbol.name not in distinct_parameters:
+            return False
+
+    return True
+
+def tables_are_independent(nodes: list[Any], written: set[Symbol], iterator: Symbol) -> bool:
+    # Each iteration only accesses its own elements of a written table: one of the dimensions is always indexed by
+    # the same i + c, so two iterations never reach the same element
+    accesses: dict[Symbol, list[list[Expression]]] = {}
+    table_roots: set[int] = set()
+    for node in nodes:
+        if isinstance(node, TableExpression) and isinstance(node.table_expression, ID) and node.table_expression.binding in written:
+            accesses.setdefault(node.table_expression.binding, []).append(node.indexes)
+            table_roots.add(id(node.table_expression))
+        elif isinstance(node, TableInitializationStatement) and node.table.binding in written:
+            accesses.setdefault(node.table.binding, []).append(node.indexes)
+            table_roots.add(id(node.table))
+
+    for node in nodes:
+        # The whole table, given to a sub-algorithm or assigned
+        if isinstance(node, ID) and node.binding in written and isinstance(node.binding.type, TableType) and id(node) not in table_roots:
+            return False
+
+    for symbol in written:
+        if not isinstance(symbol.type, TableType):
+            continue
+        if symbol not in accesses:
+            return False
+
+        table_accesses = accesses[symbol]
+        nb_dimensions = min(len(indexes) for indexes in table_accesses)
+        if not any(is_iterator_index(table_accesses[0][k], iterator) and
+                   all(expression_key(indexes[k]) == expression_key(table_accesses[0][k]) for indexes in table_accesses)
+                   for k in range(nb_dimensions)):
+            return False
+
+    return True
+
+def is_defined_first(body: list[Statement], symbol: Symbol) -> bool:
+    # Whether every iteration assigns the whole variable, unconditionally, before reading it
+    for statement in body:
+        if isinstance(statement, AssignmentStatement) and isinstance(statement.left, ID) and statement.left.binding is symbol:
+            return not mentions(statement.right, symbol)
+        if isinstance(statement, PourStatement) and statement.variable.binding is symbol:
+            return not mentions(statement.start, symbol)
+        if isinstance(statement, FunctionStatement) and any(isinstance(output, ID) and output.binding is symbol for output in statement.outputs):
+            other_outputs = [output for output in statement.outputs if not isinstance(output, ID) or output.binding is not symbol]
+            return not any(mentions(expression, symbol) for expression in statement.inputs + other_outputs)
+        if mentions(statement, symbol):
+            return False
+    return False
+
+def get_scalar_reduction(body: list[Statement], symbol: Symbol) -> Optional[str]:
+    # The operator if the variable is only used to accumulate a sum or a product of entiers. Real numbers aren't
+    # reduced, as adding them in another order could change the result.
+    if not isinstance(symbol.type, BaseType) or symbol.type.value != "entier":
+        return None
+
+    operators: set[Optional[str]] = set()
+    for statement in body:
+        for node in walk(statement):
+            # The other statements are checked through the ones they contain, but their own expressions can't use it
+            if isinstance(node, PourStatement):
+                if any(mentions(expression, symbol) for expression in (node.variable, node.start, node.end)):
+                    return None
+            elif isinstance(node, TantQueStatement):
+                if mentions(node.condition, symbol):
+                    return None
+            elif isinstance(node, ConditionalBlock):
+                if mentions(node.condition, symbol):
+                    return None
+            elif isinstance(node, Statement) and not isinstance(node, SiStatement) and mentions(node, symbol):
+                operators.add(get_reduction_operator(node, symbol))
+
+    if len(operators) != 1:
+        return None
+    return operators.pop()
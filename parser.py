@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Optional
 
 from ast_nodes import *
+from ast_arena import ASTArena
 
 import ply.yacc as yacc
 from ply.lex import LexToken
@@ -14,11 +15,14 @@ import utils
 class MyParser:
     tokens = MyLexer.tokens
 
-    def __init__(self, lexer: MyLexer, debug=False) -> None:
+    def __init__(self, lexer: MyLexer, debug=False, flat_ast=False) -> None:
         self.lexer = lexer
         self.parser = yacc.yacc(module=self)
         self.debug = debug
 
+        # Return the program as a view over a flat ASTArena instead of a tree of node objects
+        self.flat_ast = flat_ast
+
         self.source_code: str = ""
         self.syntax_errors: list[TokenSyntaxError] = []
 
@@ -32,6 +36,12 @@ class MyParser:
 
         result = self.parser.parse(source_code, debug=self.debug)
 
+        if self.flat_ast and result is not None:
+            # PLY keeps its last symbol stack around, which would keep the object tree alive
+            self.parser.symstack = []
+            self.parser.statestack = []
+            result = ASTArena.from_program(result)
+
         if len(self.incomplete_blocks) == 0:
             if self.debug: print("\n----- END OF DEBUG -----\n")
             return result
@@ -871,23 +881,27 @@ class MyParser:
     ### Basics
     def p_lit_int(self, p):
         '''lit_int : LIT_INT'''
-        p[0] = LitInt(p[1], p=p)
+        p[0] = LitInt(p[1], int(p[1]), p=p)
     
     def p_lit_float(self, p):
         '''lit_float : LIT_FLOAT'''
-        p[0] = LitFloat(p[1], p=p)
+        p[0] = LitFloat(p[1], float(p[1]), p=p)
 
     def p_lit_char(self, p):
         '''lit_char : LIT_CHAR'''
         if p[1] == "bad":
             e = LitCharError(p.lexpos(1), p.lineno(1))
             self.add_error(e)
-        p[0] = LitChar(p[1], p=p)
+            p[0] = LitChar(p[1], None, p=p)
+            return
+
+        char_value = MyLexer.char_escapes[p[1][1]] if p[1][0] == "\\" else p[1]
+        p[0] = LitChar(p[1], char_value, p=p)
 
     def p_lit_bool(self, p):
         '''lit_bool : VRAI
                     | FAUX'''
-        p[0] = LitBool(p[1], p=p)
+        p[0] = LitBool(p[1], p[1].upper() == "VRAI", p=p)
 
     def p_empty(self, p):
         '''empty : '''
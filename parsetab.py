@@ -0,0 +1,256 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "A ALGORITHME ALLANT ARTICLE DE EOF ET FAIRE FAUX FINALGO FINPOUR FINSA FINSI FINTQ GTE ID INSTRUCTIONS LIT_BOOL LIT_CHAR LIT_FLOAT LIT_INT LTE L_ARROW NEWLINE NON OU PAR PAS PE POINTEUR POINTS POUR PS QUE SA SI SINON SINONSI SOUS SUR TABLEAU TANT TYPES VARIABLES VRAIprogram_def : main_algo_definition opt_sub_algo_defs_list EOFprogram_def : main_algo_definition sub_algo_defs_list errormain_algo_definition : main_algo_header opt_type_defs_section variables_section statements_section main_algo_footermain_algo_header : algorithme id newlinemain_algo_footer : FINALGO newlinemain_algo_footer : errormain_algo_definition : main_algo_header opt_type_defs_section variables_section statements_section error main_algo_footermain_algo_definition : main_algo_header opt_type_defs_section variables_section error main_algo_footermain_algo_definition : main_algo_header type_defs_section error main_algo_footermain_algo_definition : main_algo_header error main_algo_footeropt_type_defs_section : type_defs_section\n                                 | emptytype_defs_section : types_header opt_type_defs_listopt_type_defs_list : type_defs_list\n                              | emptytype_defs_list : type_deftype_defs_list : type_defs_list type_deftype_def : id ':' ARTICLE '(' attribute_defs_list ')' newlinetype_def : id ':' ARTICLE '(' attribute_defs_list error NEWLINEtype_def : id ':' ARTICLE '(' error NEWLINEtype_def : id ':' ARTICLE error NEWLINEtype_def : id ':' error NEWLINEtype_def : id error NEWLINEattribute_defs_list : attribute_defattribute_defs_list : attribute_defs_list ',' attribute_defattribute_def : id ':' complex_typeopt_sub_algo_defs_list : sub_algo_defs_list\n                                  | emptysub_algo_defs_list : sub_algo_definitionsub_algo_defs_list : sub_algo_defs_list sub_algo_definitionsub_algo_definition : sub_algo_header inputs_section outputs_section variables_section statements_section sub_algo_footersub_algo_header : sa id newlinesub_algo_footer : FINSA newlinesub_algo_definition : sub_algo_header inputs_section outputs_section variables_section error sub_algo_footersub_algo_definition : sub_algo_header inputs_section outputs_section error sub_algo_footersub_algo_definition : sub_algo_header inputs_section error sub_algo_footersub_algo_definition : sub_algo_header error sub_algo_footervariables_section : variables_header opt_var_declaration_listinputs_section : inputs_header opt_var_declaration_listoutputs_section : outputs_header opt_var_declaration_listopt_var_declaration_list : var_declaration_list\n                                    | empty\n        var_declaration_list : var_declaration_linevar_declaration_list : var_declaration_list var_declaration_linevar_declaration_line : id_list ':' complex_type newlinevar_declaration_line : id_list ':' error NEWLINEvar_declaration_line : id_list error NEWLINEcomplex_type : basetype\n                        | table_type\n                        | pointer_type\n        basetype : IDpointer_type : POINTEUR SUR complex_typepointer_type : POINTEUR SUR errorpointer_type : POINTEUR errortable_range : lit_int POINTS lit_int\n                       | lit_int POINTS emptytable_range : lit_int errortable_range_list : table_rangetable_range_list : table_range_list ',' table_rangetable_range_list : table_range_list ',' errortable_type : TABLEAU '[' table_range_list ']' opt_de complex_type  table_type : TABLEAU '[' table_range_list ']' DE errortable_type : TABLEAU '[' table_range_list ']' errortable_type : TABLEAU '[' table_range_list errortable_type : TABLEAU '[' errortable_type : TABLEAU errorstatements_section : instructions_header opt_statements_listopt_statements_list : statements_list\n                               | emptystatements_list : statementstatements_list : statements_list statementstatement : assignment_statement\n                     | function_statement\n                     | pour_statement\n                     | tq_statement\n                     | si_statementassignment_statement : expression L_ARROW expression newlineassignment_statement : expression L_ARROW error NEWLINEassignment_statement : expression error NEWLINEfunction_statement : id '(' function_inputs_list '!' function_outputs_list ')' newlinefunction_statement : id '(' function_inputs_list '!' error NEWLINEfunction_statement : id '(' function_inputs_list error NEWLINEpour_statement : pour_header opt_statements_list pour_footerpour_header : POUR id ALLANT DE expression A expression opt_ppd newlineopt_ppd : ppd\n                   | emptyppd : PAR PAS DE lit_intppd : PAR PAS DE errorppd : PAR PAS errorppd : PAR errorpour_header : POUR id ALLANT DE expression A error NEWLINEpour_header : POUR id ALLANT DE expression error NEWLINEpour_header : POUR id ALLANT DE error NEWLINEpour_header : POUR id ALLANT error NEWLINEpour_header : POUR id error NEWLINEpour_header : POUR error NEWLINEpour_footer : FINPOUR newlinepour_footer : errortq_statement : tq_header opt_statements_list tq_footertq_header : TANT QUE expression FAIRE newlinetq_header : TANT QUE expression error NEWLINEtq_header : TANT QUE error NEWLINEtq_header : TANT error NEWLINEtq_footer : FINTQ newlinetq_footer : errorsi_statement : si_section opt_sinonsi_list opt_sinon_section si_footersi_header : SI condition_fairesinonsi_header : SINONSI condition_fairesinon_header : SINON FAIRE newlinesinon_header : SINON error NEWLINEsi_footer : FINSI newlinesi_footer : errorcondition_faire : expression FAIRE newlinecondition_faire : expression error NEWLINEcondition_faire : error NEWLINEsi_section : si_header opt_statements_listopt_sinonsi_list : sinonsi_list\n                            | emptyopt_sinon_section : sinon_section\n                             | emptysinon_section : sinon_header opt_statements_listsinonsi_list : sinonsi_sectionsinonsi_list : sinonsi_list sinonsi_sectionsinonsi_section : sinonsi_header opt_statements_listprimary_expression : id\n                              | lit_int\n                              | lit_float\n                              | lit_char\n                              | lit_boolprimary_expression : '(' expression ')' primary_expression : '(' expression errorprimary_expression : '(' errorexpression                : logical_or_expression\n                                     | function_expression\n           logical_or_expression     : logical_and_expression\n           logical_and_expression    : equality_expression\n           equality_expression       : relational_expression\n           relational_expression     : additive_expression\n           additive_expression       : multiplicative_expression\n           multiplicative_expression : unary_expression\n           unary_expression          : postfix_expressionlogical_or_expression  : logical_or_expression OU logical_and_expressionlogical_and_expression : logical_and_expression ET equality_expressionequality_expression : equality_expression '=' relational_expressionrelational_expression : relational_expression '<' additive_expressionrelational_expression : relational_expression '>' additive_expressionrelational_expression : relational_expression LTE additive_expressionrelational_expression : relational_expression GTE additive_expressionadditive_expression : additive_expression '+' multiplicative_expressionadditive_expression : additive_expression '-' multiplicative_expressionmultiplicative_expression : multiplicative_expression '*' unary_expressionmultiplicative_expression : multiplicative_expression '/' unary_expressionmultiplicative_expression : multiplicative_expression '%' unary_expressionlogical_or_expression     : logical_or_expression     OU  error\n           logical_and_expression    : logical_and_expression    ET  error\n           relational_expression     : relational_expression     '<' error\n           relational_expression     : relational_expression     '>' error\n           relational_expression     : relational_expression     LTE error\n           relational_expression     : relational_expression     GTE error\n           equality_expression       : equality_expression       '=' error\n           additive_expression       : additive_expression       '+' error\n           additive_expression       : additive_expression       '-' error\n           multiplicative_expression : multiplicative_expression '*' error\n           multiplicative_expression : multiplicative_expression '/' error\n           multiplicative_expression : multiplicative_expression '%' errorunary_expression : '+' unary_expressionunary_expression : '-' unary_expressionunary_expression : '&' unary_expressionunary_expression : '^' unary_expressionunary_expression : NON unary_expressionunary_expression : '+' error\n                            | '-' error\n                            | '&' error\n                            | '^' error\n                            | NON errorpostfix_expression : primary_expressionattribute_expression : postfix_expression '.' id postfix_expression : attribute_expressionpostfix_expression : postfix_expression '.' errorindex_list : expression_listindex_list : expression_list ',' error table_expression : postfix_expression '[' index_list ']' postfix_expression : table_expressionpostfix_expression : postfix_expression '[' index_list errorpostfix_expression : postfix_expression '[' errorfunction_expression : id '(' function_inputs_list ')' function_expression : id '(' function_inputs_list error function_inputs_list : opt_expression_listfunction_inputs_list : expression_list ',' error function_outputs_list : opt_expression_listfunction_outputs_list : expression_list ',' erroropt_id_list : id_list\n                       | emptyid_list : idid_list : id_list ',' idid_list : id_list ',' erroropt_expression_list : expression_list\n                               | emptyexpression_list : expressionexpression_list : expression_list ',' expressionopt_de : DE\n                  | emptylit_int : LIT_INTlit_float : LIT_FLOATlit_char : LIT_CHARlit_bool : VRAI\n                    | FAUXempty : newline : NEWLINEnewline : error NEWLINEcolon : ':' colon : errorid : IDalgorithme : ALGORITHMEfinalgo : FINALGOsa : SA\n              | SOUS ALGORITHMEfinsa : FINSApour : POURtq : TANT QUEfintq : FINTQtypes_header        : TYPES colon newline\n           variables_header    : VARIABLES colon newline\n           instructions_header : INSTRUCTIONS colon newline\n           inputs_header       : PE colon newline\n           outputs_header      : PS colon newline\n        "
+    
+_lr_action_items = {'ALGORITHME':([0,13,],[5,30,]),'$end':([1,22,23,],[0,-1,-2,]),'EOF':([2,6,7,8,9,24,34,35,47,53,69,70,75,78,81,87,88,89,142,155,208,209,],[-208,22,-27,-28,-29,-30,-6,-10,-209,-37,-5,-9,-210,-36,-33,-3,-6,-8,-35,-7,-31,-34,]),'SA':([2,7,9,24,34,35,47,53,69,70,75,78,81,87,88,89,142,155,208,209,],[12,12,-29,-30,-6,-10,-209,-37,-5,-9,-210,-36,-33,-3,-6,-8,-35,-7,-31,-34,]),'SOUS':([2,7,9,24,34,35,47,53,69,70,75,78,81,87,88,89,142,155,208,209,],[13,13,-29,-30,-6,-10,-209,-37,-5,-9,-210,-36,-33,-3,-6,-8,-35,-7,-31,-34,]),'error':([3,7,9,10,15,16,18,19,20,21,24,25,27,28,29,31,32,33,36,37,38,39,40,41,42,43,44,45,46,47,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,71,72,74,75,76,78,79,80,81,82,83,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,139,142,143,144,146,147,148,149,150,151,152,153,154,156,157,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,176,177,178,179,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,245,246,248,249,250,251,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,280,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,305,307,308,310,311,312,313,314,315,317,320,321,322,323,324,325,330,331,332,333,334,335,336,337,339,340,341,342,343,344,345,346,348,349,351,352,353,354,355,356,357,358,360,361,362,363,365,367,368,369,370,371,372,373,374,375,376,377,378,379,],[15,23,-29,26,34,37,-208,45,48,-213,-30,50,-208,45,48,64,-208,45,48,34,-13,-14,-15,-16,73,48,-211,-212,-4,-209,77,-208,45,-37,48,-39,-41,-42,-43,84,-194,48,-32,88,34,-208,45,-38,48,-17,138,-222,-210,141,-36,-40,48,-33,-44,145,154,-225,34,-67,-68,-69,-70,-72,-73,-74,-75,-76,158,-125,161,-208,-208,-208,-133,-134,173,175,-208,-135,180,-136,-137,-138,-139,192,195,-140,-141,199,201,203,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,48,-223,206,-23,-35,-226,48,-48,-49,-50,-51,213,215,-47,-195,-196,-71,217,-208,225,-132,-125,229,232,-208,-117,-118,-122,-208,180,242,244,247,-116,250,-107,252,255,257,259,261,263,265,267,269,271,273,-166,-171,-125,-167,-172,274,277,-168,-173,-169,-174,-170,-175,-224,281,-22,-31,-34,-45,-46,285,-66,289,-54,48,-79,294,-188,-197,-198,-199,-130,-131,-208,-83,48,-98,-99,48,-105,301,-119,-120,-208,304,-123,-124,-108,-142,-154,306,-96,309,-103,-143,-155,48,-115,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,313,-185,-180,318,-24,-21,322,-65,-58,325,-52,-53,-77,-78,327,-186,-187,331,333,-97,-104,-106,48,-112,-121,48,338,-95,48,-102,-113,-114,-184,-182,342,48,-20,349,-64,352,-208,-57,-82,-189,-200,-187,-111,-109,-110,359,-94,-100,-101,-181,-26,-18,-19,-25,362,-63,-59,-60,-55,-56,48,-81,364,366,-93,-61,-62,-80,-208,-92,48,-85,-86,375,-91,-84,377,-90,379,-89,-87,-88,]),'VARIABLES':([3,14,16,17,18,38,39,40,41,46,47,49,51,56,57,58,71,74,75,79,82,139,143,152,207,210,211,283,320,344,345,],[-208,33,-11,-12,-208,-13,-14,-15,-16,-4,-209,33,-208,-41,-42,-43,-17,-222,-210,-40,-44,-23,-226,-47,-22,-45,-46,-21,-20,-18,-19,]),'TYPES':([3,46,47,75,],[19,-4,-209,-210,]),'ID':([4,5,11,12,18,27,30,32,39,41,47,51,56,58,65,71,74,75,82,83,85,86,91,93,94,95,96,97,98,101,102,103,107,109,111,116,117,120,121,122,136,139,143,152,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,196,197,204,205,207,210,211,214,218,226,227,229,230,232,236,240,245,248,253,283,290,291,292,295,297,298,299,301,305,307,310,311,312,315,316,319,320,321,330,334,335,336,339,340,341,344,345,347,348,350,356,357,358,360,363,367,372,373,],[21,-214,21,-216,21,21,-217,21,21,-16,-209,21,21,-43,21,-17,-222,-210,-44,149,21,-225,21,-70,-72,-73,-74,-75,-76,21,21,21,21,21,21,21,21,21,21,21,-223,-23,-226,-47,-71,21,21,21,21,21,21,21,-107,21,21,21,21,21,21,21,21,21,21,21,21,-224,21,-22,-45,-46,149,-79,21,-83,-98,-99,-105,21,-108,-96,-103,-115,-21,-77,-78,21,21,-97,-104,-106,-112,21,-95,-102,-113,-114,21,149,21,-20,-208,-82,-111,-109,-110,-94,-100,-101,-18,-19,149,-201,-202,-81,21,21,-93,-80,-92,-91,-84,]),'PE':([10,47,62,75,],[28,-209,-32,-210,]),'FINALGO':([15,37,47,63,64,65,75,88,90,91,92,93,94,95,96,97,98,156,204,218,227,229,230,232,290,291,297,298,299,301,330,334,356,363,],[36,36,-209,36,36,-208,-210,36,-67,-68,-69,-70,-72,-73,-74,-75,-76,-71,-224,-79,-83,-98,-99,-105,-77,-78,-97,-104,-106,-112,-82,-111,-81,-80,]),':':([19,21,28,33,42,52,59,60,66,153,154,279,],[44,-213,44,44,72,44,83,-194,44,-195,-196,316,]),'NEWLINE':([20,21,29,36,43,44,45,48,54,61,68,73,80,84,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,135,138,144,145,146,147,148,149,158,161,162,173,175,180,191,192,193,194,195,198,199,200,201,202,203,206,213,215,216,217,224,225,228,231,241,242,244,247,249,250,251,252,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,281,285,288,289,293,294,300,303,304,306,308,309,313,314,317,318,322,327,333,338,349,355,359,361,362,365,366,368,369,370,375,377,378,379,],[47,-213,47,47,47,-211,-212,75,47,47,47,139,47,152,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,47,207,47,211,-48,-49,-50,-51,218,-132,-125,245,248,253,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,283,-66,-54,47,291,-130,-131,47,47,-142,-154,307,310,-143,-155,47,312,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,320,-65,-52,-53,-186,330,47,47,336,339,47,341,-184,-182,47,345,-64,356,-187,360,-63,47,367,-61,-62,-208,372,47,-85,-86,-90,-89,-87,-88,]),',':([21,59,60,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,146,147,148,149,153,154,161,162,191,192,193,194,195,198,199,200,201,202,203,213,215,221,223,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,278,280,282,284,285,286,288,289,293,313,314,322,324,325,329,332,333,343,346,349,351,352,353,354,361,362,],[-213,85,-194,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-48,-49,-50,-51,-195,-196,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-66,-54,295,-199,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,315,319,-24,323,-65,-58,-52,-53,-186,-184,-182,-64,-208,-57,357,-200,-187,-26,-25,-63,-59,-60,-55,-56,-61,-62,]),'(':([21,47,65,75,91,93,94,95,96,97,98,100,101,102,103,109,111,116,117,120,121,122,137,156,157,159,162,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-213,-209,101,-210,101,-70,-72,-73,-74,-75,-76,159,101,101,101,101,101,101,101,101,101,101,205,-71,101,101,226,101,101,101,101,101,-107,101,101,101,101,101,101,101,101,101,101,101,-224,-79,101,-83,-98,-99,-105,101,-108,-96,-103,-115,-77,-78,101,101,-97,-104,-106,-112,101,-95,-102,-113,-114,101,-82,-111,-109,-110,-94,-100,-101,-81,101,101,-93,-80,-92,-91,-84,]),'.':([21,100,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,193,224,225,274,275,277,313,314,],[-213,-125,196,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-125,-130,-131,-179,-177,-185,-184,-182,]),'[':([21,100,119,123,124,125,126,127,128,129,130,131,132,133,134,150,161,162,193,224,225,274,275,277,313,314,],[-213,-125,197,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,212,-132,-125,-125,-130,-131,-179,-177,-185,-184,-182,]),'*':([21,100,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,264,266,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,188,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,188,188,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'/':([21,100,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,264,266,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,189,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,189,189,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'%':([21,100,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,264,266,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,190,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,190,190,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'+':([21,47,65,75,91,93,94,95,96,97,98,100,101,102,103,109,111,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,156,157,159,161,162,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,203,204,218,224,225,226,227,229,230,232,236,240,245,248,253,256,258,260,262,264,265,266,267,268,269,270,271,272,273,274,275,277,290,291,292,295,297,298,299,301,305,307,310,311,312,313,314,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-213,-209,116,-210,116,-70,-72,-73,-74,-75,-76,-125,116,116,116,116,116,186,-139,116,116,-140,-141,116,116,116,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-71,116,116,-132,-125,116,116,116,116,116,-107,116,116,116,116,116,116,116,116,116,116,-166,-171,-125,-167,-172,116,-168,-173,-169,-174,-170,-175,-224,-79,-130,-131,116,-83,-98,-99,-105,116,-108,-96,-103,-115,186,186,186,186,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-77,-78,116,116,-97,-104,-106,-112,116,-95,-102,-113,-114,-184,-182,116,-82,-111,-109,-110,-94,-100,-101,-81,116,116,-93,-80,-92,-91,-84,]),'-':([21,47,65,75,91,93,94,95,96,97,98,100,101,102,103,109,111,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,156,157,159,161,162,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,203,204,218,224,225,226,227,229,230,232,236,240,245,248,253,256,258,260,262,264,265,266,267,268,269,270,271,272,273,274,275,277,290,291,292,295,297,298,299,301,305,307,310,311,312,313,314,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-213,-209,117,-210,117,-70,-72,-73,-74,-75,-76,-125,117,117,117,117,117,187,-139,117,117,-140,-141,117,117,117,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-71,117,117,-132,-125,117,117,117,117,117,-107,117,117,117,117,117,117,117,117,117,117,-166,-171,-125,-167,-172,117,-168,-173,-169,-174,-170,-175,-224,-79,-130,-131,117,-83,-98,-99,-105,117,-108,-96,-103,-115,187,187,187,187,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-77,-78,117,117,-97,-104,-106,-112,117,-95,-102,-113,-114,-184,-182,117,-82,-111,-109,-110,-94,-100,-101,-81,117,117,-93,-80,-92,-91,-84,]),'<':([21,100,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,254,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,182,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,182,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'>':([21,100,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,254,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,183,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,183,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'LTE':([21,100,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,254,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,184,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,184,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'GTE':([21,100,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,254,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,185,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,185,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'=':([21,100,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,249,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,181,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,181,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'ET':([21,100,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,241,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,177,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,177,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'OU':([21,100,105,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,313,314,],[-213,-125,171,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-184,-182,]),'L_ARROW':([21,99,100,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,191,192,193,194,195,198,199,200,201,202,203,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,293,294,313,314,],[-213,157,-125,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-186,-187,-184,-182,]),')':([21,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,146,147,148,149,159,160,161,162,191,192,193,194,195,198,199,200,201,202,203,213,215,219,220,221,222,223,224,225,226,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,280,282,285,288,289,292,293,296,313,314,322,326,328,329,331,332,333,343,346,349,361,362,364,],[-213,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-48,-49,-50,-51,-208,224,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-66,-54,293,-188,-197,-198,-199,-130,-131,-208,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,317,-24,-65,-52,-53,-208,-186,293,-184,-182,-64,355,-190,-197,-189,-200,-187,-26,-25,-63,-61,-62,-191,]),'ALLANT':([21,172,],[-213,243,]),'FAIRE':([21,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,179,191,192,193,194,195,198,199,200,201,202,203,224,225,237,241,242,246,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,293,313,314,333,],[-213,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,251,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,303,-142,-154,308,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-186,-184,-182,-187,]),'!':([21,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,159,161,162,191,192,193,194,195,198,199,200,201,202,203,219,220,221,222,223,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,293,313,314,331,332,333,],[-213,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-208,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,292,-188,-197,-198,-199,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-186,-184,-182,-189,-200,-187,]),']':([21,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,223,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,284,286,293,313,314,324,325,332,333,342,351,352,353,354,],[-213,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-199,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,314,-185,-180,321,-58,-186,-184,-182,-208,-57,-200,-187,-181,-59,-60,-55,-56,]),'A':([21,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,293,313,314,333,337,],[-213,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-186,-184,-182,-187,358,]),'PAR':([21,105,106,110,112,113,114,115,118,119,123,124,125,126,127,128,129,130,131,132,133,134,161,162,191,192,193,194,195,198,199,200,201,202,203,224,225,241,242,249,250,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,293,313,314,333,365,],[-213,-133,-134,-135,-136,-137,-138,-139,-140,-141,-176,-178,-183,-126,-127,-128,-129,-203,-204,-205,-206,-207,-132,-125,-166,-171,-125,-167,-172,-168,-173,-169,-174,-170,-175,-130,-131,-142,-154,-143,-155,-144,-160,-145,-156,-146,-157,-147,-158,-148,-159,-149,-161,-150,-162,-151,-163,-152,-164,-153,-165,-179,-177,-185,-186,-184,-182,-187,371,]),'PS':([25,27,47,55,56,57,58,75,82,86,152,210,211,],[52,-208,-209,-39,-41,-42,-43,-210,-44,-225,-47,-45,-46,]),'FINSA':([26,47,50,65,75,77,90,91,92,93,94,95,96,97,98,140,141,156,204,218,227,229,230,232,290,291,297,298,299,301,330,334,356,363,],[54,-209,54,-208,-210,54,-67,-68,-69,-70,-72,-73,-74,-75,-76,54,54,-71,-224,-79,-83,-98,-99,-105,-77,-78,-97,-104,-106,-112,-82,-111,-81,-80,]),'INSTRUCTIONS':([31,32,47,56,57,58,67,75,76,82,136,152,210,211,],[66,-208,-209,-41,-42,-43,-38,-210,66,-44,-223,-47,-45,-46,]),'POUR':([47,65,75,91,93,94,95,96,97,98,102,103,109,156,169,178,204,218,227,229,230,232,236,240,245,248,253,290,291,297,298,299,301,307,310,311,312,330,334,335,336,339,340,341,356,360,363,367,372,373,],[-209,107,-210,107,-70,-72,-73,-74,-75,-76,107,107,107,-71,107,-107,-224,-79,-83,-98,-99,-105,107,-108,-96,-103,-115,-77,-78,-97,-104,-106,-112,-95,-102,-113,-114,-82,-111,-109,-110,-94,-100,-101,-81,-93,-80,-92,-91,-84,]),'TANT':([47,65,75,91,93,94,95,96,97,98,102,103,109,156,169,178,204,218,227,229,230,232,236,240,245,248,253,290,291,297,298,299,301,307,310,311,312,330,334,335,336,339,340,341,356,360,363,367,372,373,],[-209,108,-210,108,-70,-72,-73,-74,-75,-76,108,108,108,-71,108,-107,-224,-79,-83,-98,-99,-105,108,-108,-96,-103,-115,-77,-78,-97,-104,-106,-112,-95,-102,-113,-114,-82,-111,-109,-110,-94,-100,-101,-81,-93,-80,-92,-91,-84,]),'SI':([47,65,75,91,93,94,95,96,97,98,102,103,109,156,169,178,204,218,227,229,230,232,236,240,245,248,253,290,291,297,298,299,301,307,310,311,312,330,334,335,336,339,340,341,356,360,363,367,372,373,],[-209,111,-210,111,-70,-72,-73,-74,-75,-76,111,111,111,-71,111,-107,-224,-79,-83,-98,-99,-105,111,-108,-96,-103,-115,-77,-78,-97,-104,-106,-112,-95,-102,-113,-114,-82,-111,-109,-110,-94,-100,-101,-81,-93,-80,-92,-91,-84,]),'&':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,120,-210,120,-70,-72,-73,-74,-75,-76,120,120,120,120,120,120,120,120,120,120,-71,120,120,120,120,120,120,120,-107,120,120,120,120,120,120,120,120,120,120,120,-224,-79,120,-83,-98,-99,-105,120,-108,-96,-103,-115,-77,-78,120,120,-97,-104,-106,-112,120,-95,-102,-113,-114,120,-82,-111,-109,-110,-94,-100,-101,-81,120,120,-93,-80,-92,-91,-84,]),'^':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,121,-210,121,-70,-72,-73,-74,-75,-76,121,121,121,121,121,121,121,121,121,121,-71,121,121,121,121,121,121,121,-107,121,121,121,121,121,121,121,121,121,121,121,-224,-79,121,-83,-98,-99,-105,121,-108,-96,-103,-115,-77,-78,121,121,-97,-104,-106,-112,121,-95,-102,-113,-114,121,-82,-111,-109,-110,-94,-100,-101,-81,121,121,-93,-80,-92,-91,-84,]),'NON':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,122,-210,122,-70,-72,-73,-74,-75,-76,122,122,122,122,122,122,122,122,122,122,-71,122,122,122,122,122,122,122,-107,122,122,122,122,122,122,122,122,122,122,122,-224,-79,122,-83,-98,-99,-105,122,-108,-96,-103,-115,-77,-78,122,122,-97,-104,-106,-112,122,-95,-102,-113,-114,122,-82,-111,-109,-110,-94,-100,-101,-81,122,122,-93,-80,-92,-91,-84,]),'LIT_INT':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,212,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,323,324,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,376,],[-209,130,-210,130,-70,-72,-73,-74,-75,-76,130,130,130,130,130,130,130,130,130,130,-71,130,130,130,130,130,130,130,-107,130,130,130,130,130,130,130,130,130,130,130,-224,130,-79,130,-83,-98,-99,-105,130,-108,-96,-103,-115,-77,-78,130,130,-97,-104,-106,-112,130,-95,-102,-113,-114,130,130,130,-82,-111,-109,-110,-94,-100,-101,-81,130,130,-93,-80,-92,-91,-84,130,]),'LIT_FLOAT':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,131,-210,131,-70,-72,-73,-74,-75,-76,131,131,131,131,131,131,131,131,131,131,-71,131,131,131,131,131,131,131,-107,131,131,131,131,131,131,131,131,131,131,131,-224,-79,131,-83,-98,-99,-105,131,-108,-96,-103,-115,-77,-78,131,131,-97,-104,-106,-112,131,-95,-102,-113,-114,131,-82,-111,-109,-110,-94,-100,-101,-81,131,131,-93,-80,-92,-91,-84,]),'LIT_CHAR':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,132,-210,132,-70,-72,-73,-74,-75,-76,132,132,132,132,132,132,132,132,132,132,-71,132,132,132,132,132,132,132,-107,132,132,132,132,132,132,132,132,132,132,132,-224,-79,132,-83,-98,-99,-105,132,-108,-96,-103,-115,-77,-78,132,132,-97,-104,-106,-112,132,-95,-102,-113,-114,132,-82,-111,-109,-110,-94,-100,-101,-81,132,132,-93,-80,-92,-91,-84,]),'VRAI':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,133,-210,133,-70,-72,-73,-74,-75,-76,133,133,133,133,133,133,133,133,133,133,-71,133,133,133,133,133,133,133,-107,133,133,133,133,133,133,133,133,133,133,133,-224,-79,133,-83,-98,-99,-105,133,-108,-96,-103,-115,-77,-78,133,133,-97,-104,-106,-112,133,-95,-102,-113,-114,133,-82,-111,-109,-110,-94,-100,-101,-81,133,133,-93,-80,-92,-91,-84,]),'FAUX':([47,65,75,91,93,94,95,96,97,98,101,102,103,109,111,116,117,120,121,122,156,157,159,169,170,171,174,177,178,181,182,183,184,185,186,187,188,189,190,197,204,218,226,227,229,230,232,236,240,245,248,253,290,291,292,295,297,298,299,301,305,307,310,311,312,315,330,334,335,336,339,340,341,356,357,358,360,363,367,372,373,],[-209,134,-210,134,-70,-72,-73,-74,-75,-76,134,134,134,134,134,134,134,134,134,134,-71,134,134,134,134,134,134,134,-107,134,134,134,134,134,134,134,134,134,134,134,-224,-79,134,-83,-98,-99,-105,134,-108,-96,-103,-115,-77,-78,134,134,-97,-104,-106,-112,134,-95,-102,-113,-114,134,-82,-111,-109,-110,-94,-100,-101,-81,134,134,-93,-80,-92,-91,-84,]),'FINPOUR':([47,75,91,92,93,94,95,96,97,98,102,156,163,218,227,229,230,232,245,290,291,297,298,299,301,307,330,334,339,356,360,363,367,372,373,],[-209,-210,-68,-69,-70,-72,-73,-74,-75,-76,-208,-71,228,-79,-83,-98,-99,-105,-96,-77,-78,-97,-104,-106,-112,-95,-82,-111,-94,-81,-93,-80,-92,-91,-84,]),'FINTQ':([47,75,91,92,93,94,95,96,97,98,103,156,164,218,227,229,230,232,248,290,291,297,298,299,301,310,330,334,340,341,356,363,],[-209,-210,-68,-69,-70,-72,-73,-74,-75,-76,-208,-71,231,-79,-83,-98,-99,-105,-103,-77,-78,-97,-104,-106,-112,-102,-82,-111,-100,-101,-81,-80,]),'SINONSI':([47,75,91,92,93,94,95,96,97,98,104,109,156,166,168,169,176,178,218,227,229,230,232,238,239,240,253,290,291,297,298,299,301,311,312,330,334,356,363,],[-209,-210,-68,-69,-70,-72,-73,-74,-75,-76,170,-208,-71,170,-122,-208,-116,-107,-79,-83,-98,-99,-105,-123,-124,-108,-115,-77,-78,-97,-104,-106,-112,-113,-114,-82,-111,-81,-80,]),'SINON':([47,75,91,92,93,94,95,96,97,98,104,109,156,165,166,167,168,169,176,178,218,227,229,230,232,238,239,240,253,290,291,297,298,299,301,311,312,330,334,356,363,],[-209,-210,-68,-69,-70,-72,-73,-74,-75,-76,-208,-208,-71,237,-117,-118,-122,-208,-116,-107,-79,-83,-98,-99,-105,-123,-124,-108,-115,-77,-78,-97,-104,-106,-112,-113,-114,-82,-111,-81,-80,]),'FINSI':([47,75,91,92,93,94,95,96,97,98,104,109,156,165,166,167,168,169,176,178,218,227,229,230,232,233,234,235,236,238,239,240,253,290,291,297,298,299,301,302,311,312,330,334,335,336,356,363,],[-209,-210,-68,-69,-70,-72,-73,-74,-75,-76,-208,-208,-71,-208,-117,-118,-122,-208,-116,-107,-79,-83,-98,-99,-105,300,-119,-120,-208,-123,-124,-108,-115,-77,-78,-97,-104,-106,-112,-121,-113,-114,-82,-111,-109,-110,-81,-80,]),'ARTICLE':([72,],[137,]),'TABLEAU':([83,214,316,321,347,348,350,],[150,150,150,-208,150,-201,-202,]),'POINTEUR':([83,214,316,321,347,348,350,],[151,151,151,-208,151,-201,-202,]),'QUE':([108,],[174,]),'POINTS':([130,287,],[-203,324,]),'SUR':([151,],[214,]),'DE':([243,321,374,],[305,348,376,]),'PAS':([371,],[374,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program_def':([0,],[1,]),'main_algo_definition':([0,],[2,]),'main_algo_header':([0,],[3,]),'algorithme':([0,],[4,]),'opt_sub_algo_defs_list':([2,],[6,]),'sub_algo_defs_list':([2,],[7,]),'empty':([2,3,18,27,32,51,65,102,103,104,109,159,165,169,226,236,292,321,324,365,],[8,17,40,57,57,57,92,92,92,167,92,222,235,92,222,92,222,350,354,370,]),'sub_algo_definition':([2,7,],[9,24,]),'sub_algo_header':([2,7,],[10,10,]),'sa':([2,7,],[11,11,]),'opt_type_defs_section':([3,],[14,]),'type_defs_section':([3,],[16,]),'types_header':([3,],[18,]),'id':([4,11,18,27,32,39,51,56,65,85,91,101,102,103,107,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,196,197,205,226,236,292,295,305,315,319,357,358,],[20,29,42,60,60,42,60,60,100,153,100,162,100,100,172,100,162,193,193,193,193,193,162,162,100,162,193,162,193,193,193,193,193,193,193,193,193,193,193,275,162,279,162,100,162,162,162,162,279,162,162,]),'inputs_section':([10,],[25,]),'inputs_header':([10,],[27,]),'variables_section':([14,49,],[31,76,]),'variables_header':([14,49,],[32,32,]),'main_algo_footer':([15,37,63,64,88,],[35,70,87,89,155,]),'opt_type_defs_list':([18,],[38,]),'type_defs_list':([18,],[39,]),'type_def':([18,39,],[41,71,]),'colon':([19,28,33,52,66,],[43,61,68,80,135,]),'newline':([20,29,36,43,54,61,68,80,135,144,216,228,231,251,300,303,308,317,355,368,],[46,62,69,74,81,86,136,143,204,210,290,297,298,311,334,335,340,344,363,373,]),'outputs_section':([25,],[49,]),'outputs_header':([25,],[51,]),'sub_algo_footer':([26,50,77,140,141,],[53,78,142,208,209,]),'opt_var_declaration_list':([27,32,51,],[55,67,79,]),'var_declaration_list':([27,32,51,],[56,56,56,]),'var_declaration_line':([27,32,51,56,],[58,58,58,82,]),'id_list':([27,32,51,56,],[59,59,59,59,]),'statements_section':([31,76,],[63,140,]),'instructions_header':([31,76,],[65,65,]),'opt_statements_list':([65,102,103,109,169,236,],[90,163,164,176,239,302,]),'statements_list':([65,102,103,109,169,236,],[91,91,91,91,91,91,]),'statement':([65,91,102,103,109,169,236,],[93,156,93,93,93,93,93,]),'assignment_statement':([65,91,102,103,109,169,236,],[94,94,94,94,94,94,94,]),'function_statement':([65,91,102,103,109,169,236,],[95,95,95,95,95,95,95,]),'pour_statement':([65,91,102,103,109,169,236,],[96,96,96,96,96,96,96,]),'tq_statement':([65,91,102,103,109,169,236,],[97,97,97,97,97,97,97,]),'si_statement':([65,91,102,103,109,169,236,],[98,98,98,98,98,98,98,]),'expression':([65,91,101,102,103,109,111,157,159,169,170,174,197,226,236,292,295,305,315,357,358,],[99,99,160,99,99,99,179,216,223,99,179,246,223,223,99,223,332,337,332,332,365,]),'pour_header':([65,91,102,103,109,169,236,],[102,102,102,102,102,102,102,]),'tq_header':([65,91,102,103,109,169,236,],[103,103,103,103,103,103,103,]),'si_section':([65,91,102,103,109,169,236,],[104,104,104,104,104,104,104,]),'logical_or_expression':([65,91,101,102,103,109,111,157,159,169,170,174,197,226,236,292,295,305,315,357,358,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'function_expression':([65,91,101,102,103,109,111,157,159,169,170,174,197,226,236,292,295,305,315,357,358,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'si_header':([65,91,102,103,109,169,236,],[109,109,109,109,109,109,109,]),'logical_and_expression':([65,91,101,102,103,109,111,157,159,169,170,171,174,197,226,236,292,295,305,315,357,358,],[110,110,110,110,110,110,110,110,110,110,110,241,110,110,110,110,110,110,110,110,110,110,]),'equality_expression':([65,91,101,102,103,109,111,157,159,169,170,171,174,177,197,226,236,292,295,305,315,357,358,],[112,112,112,112,112,112,112,112,112,112,112,112,112,249,112,112,112,112,112,112,112,112,112,]),'relational_expression':([65,91,101,102,103,109,111,157,159,169,170,171,174,177,181,197,226,236,292,295,305,315,357,358,],[113,113,113,113,113,113,113,113,113,113,113,113,113,113,254,113,113,113,113,113,113,113,113,113,]),'additive_expression':([65,91,101,102,103,109,111,157,159,169,170,171,174,177,181,182,183,184,185,197,226,236,292,295,305,315,357,358,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,256,258,260,262,114,114,114,114,114,114,114,114,114,]),'multiplicative_expression':([65,91,101,102,103,109,111,157,159,169,170,171,174,177,181,182,183,184,185,186,187,197,226,236,292,295,305,315,357,358,],[115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,264,266,115,115,115,115,115,115,115,115,115,]),'unary_expression':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[118,118,118,118,118,118,118,191,194,198,200,202,118,118,118,118,118,118,118,118,118,118,118,118,118,118,268,270,272,118,118,118,118,118,118,118,118,118,]),'postfix_expression':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'primary_expression':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'attribute_expression':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,]),'table_expression':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,]),'lit_int':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,212,226,236,292,295,305,315,323,324,357,358,376,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,287,126,126,126,126,126,126,287,353,126,126,378,]),'lit_float':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'lit_char':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'lit_bool':([65,91,101,102,103,109,111,116,117,120,121,122,157,159,169,170,171,174,177,181,182,183,184,185,186,187,188,189,190,197,226,236,292,295,305,315,357,358,],[129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'complex_type':([83,214,316,347,],[144,288,343,361,]),'basetype':([83,214,316,347,],[146,146,146,146,]),'table_type':([83,214,316,347,],[147,147,147,147,]),'pointer_type':([83,214,316,347,],[148,148,148,148,]),'opt_sinonsi_list':([104,],[165,]),'sinonsi_list':([104,],[166,]),'sinonsi_section':([104,166,],[168,238,]),'sinonsi_header':([104,166,],[169,169,]),'condition_faire':([111,170,],[178,240,]),'function_inputs_list':([159,226,],[219,296,]),'opt_expression_list':([159,226,292,],[220,220,328,]),'expression_list':([159,197,226,292,],[221,278,221,329,]),'pour_footer':([163,],[227,]),'tq_footer':([164,],[230,]),'opt_sinon_section':([165,],[233,]),'sinon_section':([165,],[234,]),'sinon_header':([165,],[236,]),'index_list':([197,],[276,]),'attribute_defs_list':([205,],[280,]),'attribute_def':([205,319,],[282,346,]),'table_range_list':([212,],[284,]),'table_range':([212,323,],[286,351,]),'si_footer':([233,],[299,]),'function_outputs_list':([292,],[326,]),'opt_de':([321,],[347,]),'opt_ppd':([365,],[368,]),'ppd':([365,],[369,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program_def","S'",1,None,None,None),
+  ('program_def -> main_algo_definition opt_sub_algo_defs_list EOF','program_def',3,'p_program_def','parser.py',78),
+  ('program_def -> main_algo_definition sub_algo_defs_list error','program_def',3,'p_program_error','parser.py',82),
+  ('main_algo_definition -> main_algo_header opt_type_defs_section variables_section statements_section main_algo_footer','main_algo_definition',5,'p_main_algo_definition','parser.py',87),
+  ('main_algo_header -> algorithme id newline','main_algo_header',3,'p_main_algo_header','parser.py',92),
+  ('main_algo_footer -> FINALGO newline','main_algo_footer',2,'p_main_algo_footer','parser.py',97),
+  ('main_algo_footer -> error','main_algo_footer',1,'p_main_algo_footer_error','parser.py',101),
+  ('main_algo_definition -> main_algo_header opt_type_defs_section variables_section statements_section error main_algo_footer','main_algo_definition',6,'p_main_algo_definition_error_finalgo','parser.py',108),
+  ('main_algo_definition -> main_algo_header opt_type_defs_section variables_section error main_algo_footer','main_algo_definition',5,'p_main_algo_definition_error_statements','parser.py',112),
+  ('main_algo_definition -> main_algo_header type_defs_section error main_algo_footer','main_algo_definition',4,'p_main_algo_definition_error_variables','parser.py',116),
+  ('main_algo_definition -> main_algo_header error main_algo_footer','main_algo_definition',3,'p_main_algo_definition_error_typedef','parser.py',120),
+  ('opt_type_defs_section -> type_defs_section','opt_type_defs_section',1,'p_opt_type_defs_section','parser.py',125),
+  ('opt_type_defs_section -> empty','opt_type_defs_section',1,'p_opt_type_defs_section','parser.py',126),
+  ('type_defs_section -> types_header opt_type_defs_list','type_defs_section',2,'p_type_defs_section','parser.py',130),
+  ('opt_type_defs_list -> type_defs_list','opt_type_defs_list',1,'p_opt_type_defs_list','parser.py',134),
+  ('opt_type_defs_list -> empty','opt_type_defs_list',1,'p_opt_type_defs_list','parser.py',135),
+  ('type_defs_list -> type_def','type_defs_list',1,'p_type_defs_list','parser.py',139),
+  ('type_defs_list -> type_defs_list type_def','type_defs_list',2,'p_type_defs_list_append','parser.py',143),
+  ('type_def -> id : ARTICLE ( attribute_defs_list ) newline','type_def',7,'p_type_def','parser.py',147),
+  ('type_def -> id : ARTICLE ( attribute_defs_list error NEWLINE','type_def',7,'p_type_def_error_closing','parser.py',151),
+  ('type_def -> id : ARTICLE ( error NEWLINE','type_def',6,'p_type_def_error_attributes','parser.py',155),
+  ('type_def -> id : ARTICLE error NEWLINE','type_def',5,'p_type_def_error_opening','parser.py',159),
+  ('type_def -> id : error NEWLINE','type_def',4,'p_type_def_error_article','parser.py',163),
+  ('type_def -> id error NEWLINE','type_def',3,'p_type_def_error_colon','parser.py',167),
+  ('attribute_defs_list -> attribute_def','attribute_defs_list',1,'p_attributes_list','parser.py',171),
+  ('attribute_defs_list -> attribute_defs_list , attribute_def','attribute_defs_list',3,'p_attributes_list_append','parser.py',175),
+  ('attribute_def -> id : complex_type','attribute_def',3,'p_attribute_def','parser.py',179),
+  ('opt_sub_algo_defs_list -> sub_algo_defs_list','opt_sub_algo_defs_list',1,'p_opt_sub_algo_defs_list','parser.py',183),
+  ('opt_sub_algo_defs_list -> empty','opt_sub_algo_defs_list',1,'p_opt_sub_algo_defs_list','parser.py',184),
+  ('sub_algo_defs_list -> sub_algo_definition','sub_algo_defs_list',1,'p_sub_algo_defs_list','parser.py',189),
+  ('sub_algo_defs_list -> sub_algo_defs_list sub_algo_definition','sub_algo_defs_list',2,'p_sub_algo_defs_list_append','parser.py',193),
+  ('sub_algo_definition -> sub_algo_header inputs_section outputs_section variables_section statements_section sub_algo_footer','sub_algo_definition',6,'p_sub_algo_definition','parser.py',198),
+  ('sub_algo_header -> sa id newline','sub_algo_header',3,'p_sub_algo_header','parser.py',203),
+  ('sub_algo_footer -> FINSA newline','sub_algo_footer',2,'p_sub_algo_footer','parser.py',208),
+  ('sub_algo_definition -> sub_algo_header inputs_section outputs_section variables_section error sub_algo_footer','sub_algo_definition',6,'p_sub_algo_definition_error_statements','parser.py',213),
+  ('sub_algo_definition -> sub_algo_header inputs_section outputs_section error sub_algo_footer','sub_algo_definition',5,'p_sub_algo_definition_error_variables','parser.py',217),
+  ('sub_algo_definition -> sub_algo_header inputs_section error sub_algo_footer','sub_algo_definition',4,'p_sub_algo_definition_error_outputs','parser.py',221),
+  ('sub_algo_definition -> sub_algo_header error sub_algo_footer','sub_algo_definition',3,'p_sub_algo_definition_error_inputs','parser.py',225),
+  ('variables_section -> variables_header opt_var_declaration_list','variables_section',2,'p_variables_section','parser.py',230),
+  ('inputs_section -> inputs_header opt_var_declaration_list','inputs_section',2,'p_inputs_section','parser.py',234),
+  ('outputs_section -> outputs_header opt_var_declaration_list','outputs_section',2,'p_outputs_section','parser.py',238),
+  ('opt_var_declaration_list -> var_declaration_list','opt_var_declaration_list',1,'p_opt_var_declaration_list','parser.py',242),
+  ('opt_var_declaration_list -> empty','opt_var_declaration_list',1,'p_opt_var_declaration_list','parser.py',243),
+  ('var_declaration_list -> var_declaration_line','var_declaration_list',1,'p_var_declaration_list','parser.py',248),
+  ('var_declaration_list -> var_declaration_list var_declaration_line','var_declaration_list',2,'p_var_declaration_list_append','parser.py',252),
+  ('var_declaration_line -> id_list : complex_type newline','var_declaration_line',4,'p_var_declaration_line','parser.py',257),
+  ('var_declaration_line -> id_list : error NEWLINE','var_declaration_line',4,'p_var_declaration_line_error_type','parser.py',262),
+  ('var_declaration_line -> id_list error NEWLINE','var_declaration_line',3,'p_var_declaration_line_error_colon','parser.py',266),
+  ('complex_type -> basetype','complex_type',1,'p_complex_type','parser.py',271),
+  ('complex_type -> table_type','complex_type',1,'p_complex_type','parser.py',272),
+  ('complex_type -> pointer_type','complex_type',1,'p_complex_type','parser.py',273),
+  ('basetype -> ID','basetype',1,'p_basetype','parser.py',279),
+  ('pointer_type -> POINTEUR SUR complex_type','pointer_type',3,'p_pointer_type','parser.py',283),
+  ('pointer_type -> POINTEUR SUR error','pointer_type',3,'p_pointer_type_error_type','parser.py',287),
+  ('pointer_type -> POINTEUR error','pointer_type',2,'p_pointer_type_error','parser.py',291),
+  ('table_range -> lit_int POINTS lit_int','table_range',3,'p_table_range','parser.py',298),
+  ('table_range -> lit_int POINTS empty','table_range',3,'p_table_range','parser.py',299),
+  ('table_range -> lit_int error','table_range',2,'p_table_range_error_points','parser.py',303),
+  ('table_range_list -> table_range','table_range_list',1,'p_table_range_list','parser.py',308),
+  ('table_range_list -> table_range_list , table_range','table_range_list',3,'p_table_range_list_append','parser.py',312),
+  ('table_range_list -> table_range_list , error','table_range_list',3,'p_table_range_list_error','parser.py',316),
+  ('table_type -> TABLEAU [ table_range_list ] opt_de complex_type','table_type',6,'p_table_type','parser.py',321),
+  ('table_type -> TABLEAU [ table_range_list ] DE error','table_type',6,'p_table_type_error_type','parser.py',325),
+  ('table_type -> TABLEAU [ table_range_list ] error','table_type',5,'p_table_type_error_de','parser.py',329),
+  ('table_type -> TABLEAU [ table_range_list error','table_type',4,'p_table_type_error_closing','parser.py',333),
+  ('table_type -> TABLEAU [ error','table_type',3,'p_table_type_error_range','parser.py',337),
+  ('table_type -> TABLEAU error','table_type',2,'p_table_type_error_opening','parser.py',342),
+  ('statements_section -> instructions_header opt_statements_list','statements_section',2,'p_statements_section','parser.py',347),
+  ('opt_statements_list -> statements_list','opt_statements_list',1,'p_opt_statements_list','parser.py',351),
+  ('opt_statements_list -> empty','opt_statements_list',1,'p_opt_statements_list','parser.py',352),
+  ('statements_list -> statement','statements_list',1,'p_statements_list','parser.py',357),
+  ('statements_list -> statements_list statement','statements_list',2,'p_statements_list_append','parser.py',361),
+  ('statement -> assignment_statement','statement',1,'p_statement','parser.py',366),
+  ('statement -> function_statement','statement',1,'p_statement','parser.py',367),
+  ('statement -> pour_statement','statement',1,'p_statement','parser.py',368),
+  ('statement -> tq_statement','statement',1,'p_statement','parser.py',369),
+  ('statement -> si_statement','statement',1,'p_statement','parser.py',370),
+  ('assignment_statement -> expression L_ARROW expression newline','assignment_statement',4,'p_assignment_statement','parser.py',375),
+  ('assignment_statement -> expression L_ARROW error NEWLINE','assignment_statement',4,'p_assignement_statement_error_right','parser.py',389),
+  ('assignment_statement -> expression error NEWLINE','assignment_statement',3,'p_assignement_statement_error_arrow','parser.py',393),
+  ('function_statement -> id ( function_inputs_list ! function_outputs_list ) newline','function_statement',7,'p_function_statement','parser.py',398),
+  ('function_statement -> id ( function_inputs_list ! error NEWLINE','function_statement',6,'p_function_statement_error','parser.py',402),
+  ('function_statement -> id ( function_inputs_list error NEWLINE','function_statement',5,'p_function_statement_error_excl','parser.py',406),
+  ('pour_statement -> pour_header opt_statements_list pour_footer','pour_statement',3,'p_pour_statement','parser.py',413),
+  ('pour_header -> POUR id ALLANT DE expression A expression opt_ppd newline','pour_header',9,'p_pour_header','parser.py',418),
+  ('opt_ppd -> ppd','opt_ppd',1,'p_opt_ppd','parser.py',423),
+  ('opt_ppd -> empty','opt_ppd',1,'p_opt_ppd','parser.py',424),
+  ('ppd -> PAR PAS DE lit_int','ppd',4,'p_ppd','parser.py',428),
+  ('ppd -> PAR PAS DE error','ppd',4,'p_ppd_error_expression','parser.py',432),
+  ('ppd -> PAR PAS error','ppd',3,'p_ppd_error_de','parser.py',436),
+  ('ppd -> PAR error','ppd',2,'p_ppd_error_pas','parser.py',440),
+  ('pour_header -> POUR id ALLANT DE expression A error NEWLINE','pour_header',8,'p_pour_header_error_end_expression','parser.py',444),
+  ('pour_header -> POUR id ALLANT DE expression error NEWLINE','pour_header',7,'p_pour_header_error_a','parser.py',449),
+  ('pour_header -> POUR id ALLANT DE error NEWLINE','pour_header',6,'p_pour_header_error_start_expression','parser.py',454),
+  ('pour_header -> POUR id ALLANT error NEWLINE','pour_header',5,'p_pour_header_error_de','parser.py',459),
+  ('pour_header -> POUR id error NEWLINE','pour_header',4,'p_pour_header_error_allant','parser.py',464),
+  ('pour_header -> POUR error NEWLINE','pour_header',3,'p_pour_header_error_variable','parser.py',469),
+  ('pour_footer -> FINPOUR newline','pour_footer',2,'p_pour_footer','parser.py',475),
+  ('pour_footer -> error','pour_footer',1,'p_pour_footer_error','parser.py',479),
+  ('tq_statement -> tq_header opt_statements_list tq_footer','tq_statement',3,'p_tq_statement','parser.py',485),
+  ('tq_header -> TANT QUE expression FAIRE newline','tq_header',5,'p_tq_header','parser.py',489),
+  ('tq_header -> TANT QUE expression error NEWLINE','tq_header',5,'p_tq_header_error_faire','parser.py',494),
+  ('tq_header -> TANT QUE error NEWLINE','tq_header',4,'p_tq_header_error_expression','parser.py',499),
+  ('tq_header -> TANT error NEWLINE','tq_header',3,'p_tq_header_error_que','parser.py',504),
+  ('tq_footer -> FINTQ newline','tq_footer',2,'p_tq_footer','parser.py',509),
+  ('tq_footer -> error','tq_footer',1,'p_tq_footer_error','parser.py',513),
+  ('si_statement -> si_section opt_sinonsi_list opt_sinon_section si_footer','si_statement',4,'p_si_statement','parser.py',519),
+  ('si_header -> SI condition_faire','si_header',2,'p_si_header','parser.py',527),
+  ('sinonsi_header -> SINONSI condition_faire','sinonsi_header',2,'p_sinonsi_header','parser.py',532),
+  ('sinon_header -> SINON FAIRE newline','sinon_header',3,'p_sinon_header','parser.py',536),
+  ('sinon_header -> SINON error NEWLINE','sinon_header',3,'p_sinon_header_error_faire','parser.py',539),
+  ('si_footer -> FINSI newline','si_footer',2,'p_si_footer','parser.py',543),
+  ('si_footer -> error','si_footer',1,'p_si_footer_error','parser.py',547),
+  ('condition_faire -> expression FAIRE newline','condition_faire',3,'p_condition_faire','parser.py',553),
+  ('condition_faire -> expression error NEWLINE','condition_faire',3,'p_condition_faire_error_faire','parser.py',557),
+  ('condition_faire -> error NEWLINE','condition_faire',2,'p_condition_faire_error_condition','parser.py',561),
+  ('si_section -> si_header opt_statements_list','si_section',2,'p_si_section','parser.py',566),
+  ('opt_sinonsi_list -> sinonsi_list','opt_sinonsi_list',1,'p_opt_sinonsi_list','parser.py',570),
+  ('opt_sinonsi_list -> empty','opt_sinonsi_list',1,'p_opt_sinonsi_list','parser.py',571),
+  ('opt_sinon_section -> sinon_section','opt_sinon_section',1,'p_opt_sinon_section','parser.py',575),
+  ('opt_sinon_section -> empty','opt_sinon_section',1,'p_opt_sinon_section','parser.py',576),
+  ('sinon_section -> sinon_header opt_statements_list','sinon_section',2,'p_sinon_section','parser.py',580),
+  ('sinonsi_list -> sinonsi_section','sinonsi_list',1,'p_sinonsi_list','parser.py',584),
+  ('sinonsi_list -> sinonsi_list sinonsi_section','sinonsi_list',2,'p_sinonsi_list_append','parser.py',588),
+  ('sinonsi_section -> sinonsi_header opt_statements_list','sinonsi_section',2,'p_sinonsi_section','parser.py',592),
+  ('primary_expression -> id','primary_expression',1,'p_primary_expression','parser.py',596),
+  ('primary_expression -> lit_int','primary_expression',1,'p_primary_expression','parser.py',597),
+  ('primary_expression -> lit_float','primary_expression',1,'p_primary_expression','parser.py',598),
+  ('primary_expression -> lit_char','primary_expression',1,'p_primary_expression','parser.py',599),
+  ('primary_expression -> lit_bool','primary_expression',1,'p_primary_expression','parser.py',600),
+  ('primary_expression -> ( expression )','primary_expression',3,'p_primary_expression_parens','parser.py',605),
+  ('primary_expression -> ( expression error','primary_expression',3,'p_primary_expression_parens_error_closing','parser.py',610),
+  ('primary_expression -> ( error','primary_expression',2,'p_p_primary_expression_parens_error_expression','parser.py',614),
+  ('expression -> logical_or_expression','expression',1,'p_expression','parser.py',619),
+  ('expression -> function_expression','expression',1,'p_expression','parser.py',620),
+  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_expression','parser.py',621),
+  ('logical_and_expression -> equality_expression','logical_and_expression',1,'p_expression','parser.py',622),
+  ('equality_expression -> relational_expression','equality_expression',1,'p_expression','parser.py',623),
+  ('relational_expression -> additive_expression','relational_expression',1,'p_expression','parser.py',624),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_expression','parser.py',625),
+  ('multiplicative_expression -> unary_expression','multiplicative_expression',1,'p_expression','parser.py',626),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_expression','parser.py',627),
+  ('logical_or_expression -> logical_or_expression OU logical_and_expression','logical_or_expression',3,'p_logical_or_expression','parser.py',632),
+  ('logical_and_expression -> logical_and_expression ET equality_expression','logical_and_expression',3,'p_logical_and_expression','parser.py',638),
+  ('equality_expression -> equality_expression = relational_expression','equality_expression',3,'p_equality_expression','parser.py',643),
+  ('relational_expression -> relational_expression < additive_expression','relational_expression',3,'p_relational_expression_lt','parser.py',648),
+  ('relational_expression -> relational_expression > additive_expression','relational_expression',3,'p_relational_expression_gt','parser.py',653),
+  ('relational_expression -> relational_expression LTE additive_expression','relational_expression',3,'p_relational_expression_lte','parser.py',658),
+  ('relational_expression -> relational_expression GTE additive_expression','relational_expression',3,'p_relational_expression_gte','parser.py',663),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression_plus','parser.py',668),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression_minus','parser.py',673),
+  ('multiplicative_expression -> multiplicative_expression * unary_expression','multiplicative_expression',3,'p_multiplicative_expression_times','parser.py',678),
+  ('multiplicative_expression -> multiplicative_expression / unary_expression','multiplicative_expression',3,'p_multiplicative_expression_divide','parser.py',683),
+  ('multiplicative_expression -> multiplicative_expression % unary_expression','multiplicative_expression',3,'p_multiplicative_expression_modulo','parser.py',688),
+  ('logical_or_expression -> logical_or_expression OU error','logical_or_expression',3,'p_binary_expression_error','parser.py',694),
+  ('logical_and_expression -> logical_and_expression ET error','logical_and_expression',3,'p_binary_expression_error','parser.py',695),
+  ('relational_expression -> relational_expression < error','relational_expression',3,'p_binary_expression_error','parser.py',696),
+  ('relational_expression -> relational_expression > error','relational_expression',3,'p_binary_expression_error','parser.py',697),
+  ('relational_expression -> relational_expression LTE error','relational_expression',3,'p_binary_expression_error','parser.py',698),
+  ('relational_expression -> relational_expression GTE error','relational_expression',3,'p_binary_expression_error','parser.py',699),
+  ('equality_expression -> equality_expression = error','equality_expression',3,'p_binary_expression_error','parser.py',700),
+  ('additive_expression -> additive_expression + error','additive_expression',3,'p_binary_expression_error','parser.py',701),
+  ('additive_expression -> additive_expression - error','additive_expression',3,'p_binary_expression_error','parser.py',702),
+  ('multiplicative_expression -> multiplicative_expression * error','multiplicative_expression',3,'p_binary_expression_error','parser.py',703),
+  ('multiplicative_expression -> multiplicative_expression / error','multiplicative_expression',3,'p_binary_expression_error','parser.py',704),
+  ('multiplicative_expression -> multiplicative_expression % error','multiplicative_expression',3,'p_binary_expression_error','parser.py',705),
+  ('unary_expression -> + unary_expression','unary_expression',2,'p_unary_expression_plus','parser.py',711),
+  ('unary_expression -> - unary_expression','unary_expression',2,'p_unary_expression_minus','parser.py',716),
+  ('unary_expression -> & unary_expression','unary_expression',2,'p_unary_expression_pointer','parser.py',721),
+  ('unary_expression -> ^ unary_expression','unary_expression',2,'p_unary_expression_dereference','parser.py',726),
+  ('unary_expression -> NON unary_expression','unary_expression',2,'p_unary_expression_not','parser.py',731),
+  ('unary_expression -> + error','unary_expression',2,'p_unary_expression_error','parser.py',736),
+  ('unary_expression -> - error','unary_expression',2,'p_unary_expression_error','parser.py',737),
+  ('unary_expression -> & error','unary_expression',2,'p_unary_expression_error','parser.py',738),
+  ('unary_expression -> ^ error','unary_expression',2,'p_unary_expression_error','parser.py',739),
+  ('unary_expression -> NON error','unary_expression',2,'p_unary_expression_error','parser.py',740),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser.py',745),
+  ('attribute_expression -> postfix_expression . id','attribute_expression',3,'p_attribute_expression','parser.py',750),
+  ('postfix_expression -> attribute_expression','postfix_expression',1,'p_postfix_expression_attribute','parser.py',754),
+  ('postfix_expression -> postfix_expression . error','postfix_expression',3,'p_postfix_expression_attribute_error','parser.py',758),
+  ('index_list -> expression_list','index_list',1,'p_index_list','parser.py',762),
+  ('index_list -> expression_list , error','index_list',3,'p_index_list_error','parser.py',766),
+  ('table_expression -> postfix_expression [ index_list ]','table_expression',4,'p_table_expression','parser.py',770),
+  ('postfix_expression -> table_expression','postfix_expression',1,'p_postfix_expression_table','parser.py',774),
+  ('postfix_expression -> postfix_expression [ index_list error','postfix_expression',4,'p_postfix_expression_table_error_closing','parser.py',778),
+  ('postfix_expression -> postfix_expression [ error','postfix_expression',3,'p_postfix_expression_table_error_expression','parser.py',782),
+  ('function_expression -> id ( function_inputs_list )','function_expression',4,'p_function_expression','parser.py',788),
+  ('function_expression -> id ( function_inputs_list error','function_expression',4,'p_function_expression_error','parser.py',803),
+  ('function_inputs_list -> opt_expression_list','function_inputs_list',1,'p_function_inputs_list','parser.py',815),
+  ('function_inputs_list -> expression_list , error','function_inputs_list',3,'p_function_inputs_list_error','parser.py',819),
+  ('function_outputs_list -> opt_expression_list','function_outputs_list',1,'p_function_outputs_list','parser.py',823),
+  ('function_outputs_list -> expression_list , error','function_outputs_list',3,'p_function_outputs_list_error','parser.py',827),
+  ('opt_id_list -> id_list','opt_id_list',1,'p_opt_id_list','parser.py',832),
+  ('opt_id_list -> empty','opt_id_list',1,'p_opt_id_list','parser.py',833),
+  ('id_list -> id','id_list',1,'p_id_list','parser.py',837),
+  ('id_list -> id_list , id','id_list',3,'p_id_list_append','parser.py',841),
+  ('id_list -> id_list , error','id_list',3,'p_id_list_error','parser.py',845),
+  ('opt_expression_list -> expression_list','opt_expression_list',1,'p_opt_expression_list','parser.py',850),
+  ('opt_expression_list -> empty','opt_expression_list',1,'p_opt_expression_list','parser.py',851),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',856),
+  ('expression_list -> expression_list , expression','expression_list',3,'p_expression_list_append','parser.py',861),
+  ('opt_de -> DE','opt_de',1,'p_opt_de','parser.py',867),
+  ('opt_de -> empty','opt_de',1,'p_opt_de','parser.py',868),
+  ('lit_int -> LIT_INT','lit_int',1,'p_lit_int','parser.py',873),
+  ('lit_float -> LIT_FLOAT','lit_float',1,'p_lit_float','parser.py',877),
+  ('lit_char -> LIT_CHAR','lit_char',1,'p_lit_char','parser.py',881),
+  ('lit_bool -> VRAI','lit_bool',1,'p_lit_bool','parser.py',888),
+  ('lit_bool -> FAUX','lit_bool',1,'p_lit_bool','parser.py',889),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',893),
+  ('newline -> NEWLINE','newline',1,'p_newline','parser.py',897),
+  ('newline -> error NEWLINE','newline',2,'p_newline_error','parser.py',902),
+  ('colon -> :','colon',1,'p_colon','parser.py',908),
+  ('colon -> error','colon',1,'p_colon_error','parser.py',911),
+  ('id -> ID','id',1,'p_id','parser.py',915),
+  ('algorithme -> ALGORITHME','algorithme',1,'p_algorithme','parser.py',919),
+  ('finalgo -> FINALGO','finalgo',1,'p_finalgo','parser.py',922),
+  ('sa -> SA','sa',1,'p_sa','parser.py',926),
+  ('sa -> SOUS ALGORITHME','sa',2,'p_sa','parser.py',927),
+  ('finsa -> FINSA','finsa',1,'p_finsa','parser.py',930),
+  ('pour -> POUR','pour',1,'p_pour','parser.py',933),
+  ('tq -> TANT QUE','tq',2,'p_tq','parser.py',936),
+  ('fintq -> FINTQ','fintq',1,'p_fintq','parser.py',939),
+  ('types_header -> TYPES colon newline','types_header',3,'p_basic_headers','parser.py',943),
+  ('variables_header -> VARIABLES colon newline','variables_header',3,'p_basic_headers','parser.py',944),
+  ('instructions_header -> INSTRUCTIONS colon newline','instructions_header',3,'p_basic_headers','parser.py',945),
+  ('inputs_header -> PE colon newline','inputs_header',3,'p_basic_headers','parser.py',946),
+  ('outputs_header -> PS colon newline','outputs_header',3,'p_basic_headers','parser.py',947),
+]
@@ -1,13 +1,54 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from ast_nodes import SubAlgorithm, VariableType
+from dataclasses import dataclass, field
+from ast_nodes import CustomTypeDefinition, SubAlgorithm, TableType, VariableType
+
+VARIABLE_KIND = "variable"
+INPUT_KIND = "input"
+OUTPUT_KIND = "output"
 
 @dataclass
 class ProgramVariables:
     main_algorithm_variables: AlgorithmVariables
     sub_algorithm_variables: dict[str, AlgorithmVariables]
     sub_algorithms: dict[str, SubAlgorithm]
-    
+    custom_types: list[CustomTypeDefinition]
+    sub_algorithm_signatures: dict[str, SubAlgorithmSignature]
+
+
+@dataclass(eq=False)
+class SubAlgorithmSignature:
+    name: str
+    input_types: list[VariableType]
+    output_types: list[VariableType]
+
+    # For each parameter, the positions of the table dimensions left open-ended ('tableau[0..]'), whose size is passed as an extra C parameter
+    input_open_dimensions: list[list[int]]
+    output_open_dimensions: list[list[int]]
+
+    # A single output that isn't a table is returned by the C function, otherwise non-table outputs are passed by pointer
+    output_as_return: bool
+    outputs_as_pointer: list[bool]
+
+    @property
+    def nb_inputs(self) -> int:
+        return len(self.input_types)
+
+    @property
+    def nb_outputs(self) -> int:
+        return len(self.output_types)
+
+    @staticmethod
+    def get_open_dimensions(var_type: VariableType) -> list[int]:
+        if not isinstance(var_type, TableType):
+            return []
+        return [i for i, table_range in enumerate(var_type.ranges) if table_range.end is None]
+
+
+@dataclass(eq=False)
+class Symbol:
+    name: str
+    type: VariableType
+    kind: str
 
 @dataclass
 class AlgorithmVariables:
@@ -15,12 +56,22 @@ class AlgorithmVariables:
     outputs: dict[str, VariableType]
     variables: dict[str, VariableType]
 
+    # The three namespaces merged into one, so that an identifier is resolved with a single lookup
+    symbols: dict[str, Symbol] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.symbols = {}
+        for names, kind in ((self.variables, VARIABLE_KIND), (self.inputs, INPUT_KIND), (self.outputs, OUTPUT_KIND)):
+            for name, var_type in names.items():
+                if name not in self.symbols:
+                    self.symbols[name] = Symbol(name, var_type, kind)
+
     def var_is_defined(self, var_name: str):
-        return var_name in self.inputs or var_name in self.outputs or var_name in self.variables
+        return var_name in self.symbols
+
+    def get_symbol(self, var: str) -> Symbol | None:
+        return self.symbols.get(var)
 
     def get_var_type(self, var: str) -> VariableType | None:
-        if var in self.variables: return self.variables[var]
-        if var in self.inputs:  return self.inputs[var]
-        if var in self.outputs: return self.outputs[var]
-        
-        return None
\ No newline at end of file
+        symbol = self.symbols.get(var)
+        return symbol.type if symbol is not None else None
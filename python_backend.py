@@ -0,0 +1,1040 @@
+from __future__ import annotations
+import ast as py
+import math
+import struct
+import sys
+from types import CodeType
+from typing import Any, Optional, cast
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ast_nodes import *
+from bounds_checks import find_safe_indexes
+from call_graph import CallGraph, find_pure_sub_algorithms
+from calling_convention import CallingConvention
+from common_subexpressions import get_variables, is_pure_index
+from constant_folding import c_divide
+from data_flow import get_written_symbols
+from loop_unrolling import get_trip_count
+from parallel_loops import has_independent_accesses, is_iterator_index, mentions
+from program_variables import AlgorithmVariables, ProgramVariables, SubAlgorithmSignature, Symbol
+from tail_calls import find_tail_calls, get_self_call, is_parameter
+from value_ranges import ValueRangeAnalysis
+
+# The depth of the calls allowed while a program runs (python's default is far below what the C stack allows)
+RECURSION_LIMIT = 10**6
+
+# The names the generated code can't give to a variable
+PYTHON_CONSTANTS = ("None", "True", "False")
+
+DEFAULT_VALUES = {
+    "entier"   : 0,
+    "réel"     : 0.0,
+    "caractère": "\0",
+    "booléen"  : False,
+}
+
+# A réel is a C float, and an entier a 32 bits int
+FLOAT_STRUCT = struct.Struct("f")
+INT_BITS = 32
+
+# The C types of the NF04 types that compute, and the order in which C converts the operands of an operation to the
+# type of the other one (a réel literal is a double)
+C_NUMBER_TYPES = {
+    "entier": "int",
+    "réel"  : "float",
+}
+C_NUMBER_PROMOTIONS = ("double", "float", "int")
+
+# The types of the elements of the tables stored as NumPy arrays, the C types for the numbers. A caractère is stored
+# as its code, as numpy's strings drop the '\0' characters.
+NUMPY_DTYPES = {
+    "entier"   : "int32",
+    "réel"     : "float32",
+    "caractère": "uint32",
+    "booléen"  : "bool",
+}
+
+# The NumPy types of the C numbers, which the operands of an element-wise operation are converted to
+NUMPY_NUMBER_TYPES = {
+    "int"   : "int32",
+    "float" : "float32",
+    "double": "float64",
+}
+
+# Element-wise loops with literal bounds and fewer iterations are left as python loops, which are faster
+MIN_VECTORIZED_ITERATIONS = 16
+
+
+def to_float(value: float) -> float:
+    # The value rounded to a float, infinite beyond the largest one as in C
+    try:
+        return FLOAT_STRUCT.unpack(FLOAT_STRUCT.pack(value))[0]
+    except OverflowError:
+        return math.copysign(math.inf, value)
+
+def c_remainder(left: int, right: int) -> int:
+    # The remainder of the truncating division, with the sign of the dividend
+    return left - right * c_divide(left, right)
+
+def divide_arrays(left: Any, right: Any) -> Any:
+    # The truncating division of c_divide, element by element
+    quotient = numpy.abs(left) // numpy.abs(right)
+    return numpy.where((left < 0) != (right < 0), -quotient, quotient)
+
+def remainder_arrays(left: Any, right: Any) -> Any:
+    return left - right * divide_arrays(left, right)
+
+def checked_index(index: int, start: int, end: Optional[int]) -> int:
+    # The position in the list of an index of the range start..end (end excluded, None for an open dimension, whose
+    # list stops at its end anyway): a negative position would silently be counted from the end of the list
+    if index < start or (end is not None and index >= end):
+        raise IndexError(f"l'indice {index} est hors des bornes {start}..{end if end is not None else ''} du tableau")
+    return index - start
+
+def array_slice(start: int, nb_elements: int, step: int, size: int) -> slice:
+    # The elements an element-wise loop goes through along a dimension, which must all be in the array: a python
+    # slice would silently stop at its ends
+    last = start + (nb_elements - 1) * step
+    if not (0 <= start < size and 0 <= last < size):
+        raise IndexError("indice hors des bornes du tableau")
+    stop = last + step
+    return slice(start, stop if stop >= 0 else None, step)
+
+def codes_to_characters(codes: Any) -> Any:
+    # The caractères of a list made from an array of their codes
+    if isinstance(codes, list):
+        return [codes_to_characters(code) for code in codes]
+    return chr(codes)
+
+def arrays_to_lists(value: Any) -> Any:
+    # The value with its arrays, including those of its articles, replaced by lists like the other tables
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        values = value.tolist()
+        return codes_to_characters(values) if value.dtype == NUMPY_DTYPES["caractère"] else values
+    if isinstance(value, list):
+        return [arrays_to_lists(element) for element in value]
+    if isinstance(value, Article):
+        for name in value.__slots__:
+            setattr(value, name, arrays_to_lists(getattr(value, name)))
+    return value
+
+def is_table(value: Any) -> bool:
+    return isinstance(value, list) or (numpy is not None and isinstance(value, numpy.ndarray))
+
+def copy_into(destination: Any, source: Any):
+    # Copies a table or an article into another one of the same type, keeping the objects nested in the destination
+    # (which may be pointed to)
+    if isinstance(destination, Article):
+        destination._affecter(source)
+        return
+    if not isinstance(destination, list):
+        destination[...] = source
+        return
+    for k, element in enumerate(source):
+        if is_table(element) or isinstance(element, Article):
+            copy_into(destination[k], element)
+        else:
+            destination[k] = element
+
+
+class Article:
+    # The base of the classes generated for the article types, whose fields are the slots. An article is copied
+    # into the one it is assigned to, so that it stays the same object while the program runs.
+    __slots__ = ()
+
+    def _affecter(self, other: Article):
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if is_table(value) or isinstance(value, Article):
+                copy_into(value, getattr(other, name))
+            else:
+                setattr(self, name, getattr(other, name))
+
+    def _copie(self) -> Article:
+        result = type(self)()
+        result._affecter(self)
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields_str = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__.lstrip('_')}({fields_str})"
+
+
+class Pointer:
+    # A pointer to an element of a list: a table element, or the box holding a variable whose address is taken
+    __slots__ = ("container", "key")
+
+    def __init__(self, container: Any, key: Any) -> None:
+        self.container = container
+        self.key = key
+
+    @property
+    def valeur(self) -> Any:
+        return self.container[self.key]
+
+    @valeur.setter
+    def valeur(self, value: Any):
+        self.container[self.key] = value
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and self.container is other.container and self.key == other.key
+
+
+class FieldPointer(Pointer):
+    # A pointer to a field of an article
+    __slots__ = ()
+
+    @property
+    def valeur(self) -> Any:
+        return getattr(self.container, self.key)
+
+    @valeur.setter
+    def valeur(self, value: Any):
+        setattr(self.container, self.key, value)
+
+
+class ArrayPointer(Pointer):
+    # A pointer to an element of a NumPy array, read as a python value
+    __slots__ = ()
+
+    @property
+    def valeur(self) -> Any:
+        return self.container.item(self.key)
+
+    @valeur.setter
+    def valeur(self, value: Any):
+        self.container[self.key] = value
+
+
+class CharacterArrayPointer(Pointer):
+    # A pointer to an element of a NumPy array of caractères, which holds its code
+    __slots__ = ()
+
+    @property
+    def valeur(self) -> Any:
+        return chr(self.container.item(self.key))
+
+    @valeur.setter
+    def valeur(self, value: Any):
+        self.container[self.key] = ord(value)
+
+
+class ObjectPointer:
+    # A pointer to a table or an article, which is never replaced by another object
+    __slots__ = ("valeur",)
+
+    def __init__(self, value: Any) -> None:
+        self.valeur = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ObjectPointer) and self.valeur is other.valeur
+
+
+# The names the generated code uses besides those of the program
+RUNTIME = {
+    "_division": c_divide,
+    "_reste": c_remainder,
+    "_Article": Article,
+    "_Pointeur": Pointer,
+    "_PointeurChamp": FieldPointer,
+    "_PointeurObjet": ObjectPointer,
+    "_range": range,
+    "_reel": to_float,
+    "_len": len,
+    "_chr": chr,
+    "_ord": ord,
+    "_numpy": numpy,
+    "_division_tableau": divide_arrays,
+    "_reste_tableau": remainder_arrays,
+    "_tranche": array_slice,
+    "_indice": checked_index,
+    "_en_listes": arrays_to_lists,
+    "_PointeurTableau": ArrayPointer,
+    "_PointeurCaractere": CharacterArrayPointer,
+}
+
+def run_code(code: CodeType) -> dict[str, Any]:
+    # Runs the main algorithm, and gives the final values of its variables (tables as lists indexed from 0)
+    namespace = dict(RUNTIME)
+    exec(code, namespace)
+
+    previous_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(previous_limit, RECURSION_LIMIT))
+    try:
+        return namespace["_algorithme"]()
+    finally:
+        sys.setrecursionlimit(previous_limit)
+
+
+class VectorizedLoop:
+    # A pour loop run as operations on arrays: its variable, the names of the number of iterations and of the array
+    # of the values the variable takes (only computed if an expression uses them), and its step
+    def __init__(self, iterator: Symbol, nb_elements: str, values: str, step: int) -> None:
+        self.iterator = iterator
+        self.nb_elements = nb_elements
+        self.values = values
+        self.step = step
+        self.uses_values = False
+
+
+class PythonCodeGenerator:
+    # Lowers a checked program to a python module, using the types found by the semantic analysis:
+    #   - the entiers are python ints, divided with truncation like in C. The result of additions, subtractions and
+    #     multiplications is brought back to 32 bits (wrapping around like the C int) where it is used, which gives
+    #     the same value as doing it after each operation, unless the value range analysis proves it fits.
+    #   - the réels are python floats rounded to single precision after each operation C computes on floats, and
+    #     when they are assigned or given to a réel (operations with a réel literal are computed in double, as in C)
+    #   - the tables are nested lists, indexed from 0 by subtracting the start of each dimension, once the index is
+    #     checked against the range (unless the analysis of the bounds checks proves it is always in it)
+    #   - the articles are objects of a generated class, copied when assigned or given as an input
+    #   - a scalar variable whose address is taken is kept in a list of one element (its box), which the pointers refer to
+    # A sub-algorithm becomes a function taking its inputs, then its outputs: the tables and articles are changed in
+    # place, and the other outputs are given with the value of the caller's variable and returned (the single output
+    # returned in C is returned alone). The calls of a sub-algorithm to itself that end it start its function again
+    # with the new inputs, as python has no tail calls. The main algorithm returns its variables.
+    # With numpy_tables, the tables of entiers, réels, caractères and booléens are NumPy arrays, whose elements are
+    # read as python values. The pour loops whose iterations only assign their own elements of the arrays (as for
+    # the vectorization of the C code), from array elements, literals and variables that the loop doesn't change,
+    # become one operation on the arrays per assignment.
+
+    def __init__(self, program: Program, program_variables: ProgramVariables, numpy_tables=False) -> None:
+        if numpy_tables and numpy is None:
+            raise Exception("Le module numpy est nécessaire pour utiliser des tableaux NumPy")
+
+        self.program = program
+        self.program_variables = program_variables
+        self.numpy_tables = numpy_tables
+        self.custom_types = {custom_type.name.value for custom_type in program_variables.custom_types}
+
+        # Article inputs that the sub-algorithm never modifies, which don't need to be copied
+        call_graph = CallGraph(program)
+        calling_convention = CallingConvention(program, program_variables, call_graph, True, numpy_tables)
+        self.pointer_inputs = calling_convention.pointer_inputs
+        self.tail_calls = find_tail_calls(program, program_variables, self.pointer_inputs)
+
+        # The table parameters that never share memory with another parameter, whose element-wise loops can be vectorized
+        self.distinct_parameters = calling_convention.restrict_parameters
+        self.pure_sub_algorithms = find_pure_sub_algorithms(call_graph, program_variables)
+        self.safe_indexes = find_safe_indexes(program, program_variables)
+        self.nb_vectorized_loops = 0
+
+        self.current_s_algo: Optional[SubAlgorithm] = None
+        self.current_distinct_parameters: set[str] = set()
+        self.boxed: set[Symbol] = set()
+        self.value_ranges: ValueRangeAnalysis
+        self.nb_temporaries = 0
+
+    def generate_module(self) -> py.Module:
+        body: list[py.stmt] = [self.custom_type_to_class(custom_type) for custom_type in self.program_variables.custom_types]
+        for s_algo in self.program.sub_algorithms_list:
+            body.append(self.s_algo_to_function(s_algo))
+        body.append(self.main_algo_to_function(self.program.main_algorithm))
+
+        module = py.Module(body, type_ignores=[])
+        return py.fix_missing_locations(module)
+
+    @staticmethod
+    def name(name: str) -> str:
+        return name + "_" if name in PYTHON_CONSTANTS else name
+
+    @staticmethod
+    def class_name(type_name: str) -> str:
+        # Prefixed, so that a variable can have the name of its type
+        return "_" + type_name
+
+    @staticmethod
+    def located(statement: py.stmt, position: TrackPosition) -> py.stmt:
+        # The line of the NF04 statement, for the errors raised while running it
+        statement.lineno = statement.end_lineno = max(position.lineno, 1)
+        statement.col_offset = statement.end_col_offset = 0
+        return statement
+
+    def new_temporary(self) -> str:
+        self.nb_temporaries += 1
+        return f"_tmp{self.nb_temporaries - 1}"
+
+    def is_article(self, var_type: Optional[VariableType]) -> bool:
+        return isinstance(var_type, BaseType) and var_type.value in self.custom_types
+
+    def is_object(self, var_type: Optional[VariableType]) -> bool:
+        # The values changed in place rather than replaced
+        return isinstance(var_type, TableType) or self.is_article(var_type)
+
+    def get_array_element_type(self, var_type: Optional[VariableType]) -> Optional[str]:
+        # The type of the elements of a table stored as a NumPy array (a table of tables being a single array)
+        if not self.numpy_tables or not isinstance(var_type, TableType):
+            return None
+        element_type = var_type.type
+        while isinstance(element_type, TableType):
+            element_type = element_type.type
+        if isinstance(element_type, BaseType) and element_type.value in NUMPY_DTYPES:
+            return element_type.value
+        return None
+
+    def get_array_access(self, expression: Expression) -> Optional[tuple[py.expr, py.expr]]:
+        # The array and the position (an index, or a tuple of them) of an access to the elements of a NumPy array
+        if not isinstance(expression, TableExpression) or self.get_array_element_type(expression.table_expression.expr_type) is None:
+            return None
+
+        indexes = [self.index_to_py(expression, k) for k in range(len(expression.indexes))]
+        key = indexes[0] if len(indexes) == 1 else py.Tuple(indexes, py.Load())
+        return self.expression_to_py(expression.table_expression), key
+
+    def is_character_array_element(self, expression: Expression) -> bool:
+        return (self.get_array_access(expression) is not None and isinstance(expression.expr_type, BaseType)
+                and expression.expr_type.value == "caractère")
+
+
+    def custom_type_to_class(self, custom_type: CustomTypeDefinition) -> py.ClassDef:
+        names = [self.name(attribute.name.value) for attribute in custom_type.attributes]
+        slots = py.Assign([py.Name("__slots__", py.Store())], py.Tuple([py.Constant(name) for name in names], py.Load()))
+
+        init_body: list[py.stmt] = [py.Assign([py.Attribute(py.Name("self", py.Load()), name, py.Store())], self.default_value(attribute.type))
+                                    for name, attribute in zip(names, custom_type.attributes)]
+        arguments = py.arguments(posonlyargs=[], args=[py.arg("self")], kwonlyargs=[], kw_defaults=[], defaults=[])
+        init = py.FunctionDef("__init__", arguments, init_body or [py.Pass()], [], None)
+
+        return py.ClassDef(self.class_name(custom_type.name.value), [py.Name("_Article", py.Load())], [], [slots, init], [])
+
+    def default_value(self, var_type: VariableType) -> py.expr:
+        # The value of a variable before it is assigned (C leaves it undefined)
+        if isinstance(var_type, PtrType):
+            return py.Constant(None)
+        if isinstance(var_type, BaseType):
+            if var_type.value in DEFAULT_VALUES:
+                return py.Constant(DEFAULT_VALUES[var_type.value])
+            return py.Call(py.Name(self.class_name(var_type.value), py.Load()), [], [])
+
+        table_type = cast(TableType, var_type)
+        element_type = self.get_array_element_type(table_type)
+        if element_type is not None:
+            shape: list[py.expr] = []
+            while isinstance(var_type, TableType):
+                shape += [py.Constant(cast(LitInt, table_range.end).int_value - table_range.start.int_value) for table_range in var_type.ranges]
+                var_type = var_type.type
+            shape_py = py.Tuple(shape, py.Load())
+            return py.Call(py.Attribute(py.Name("_numpy", py.Load()), "zeros", py.Load()), [shape_py, py.Constant(NUMPY_DTYPES[element_type])], [])
+
+        result = self.default_value(table_type.type)
+        for table_range in reversed(table_type.ranges):
+            size = cast(LitInt, table_range.end).int_value - table_range.start.int_value
+            if isinstance(result, py.Constant):
+                result = py.BinOp(py.List([result], py.Load()), py.Mult(), py.Constant(size))
+            else:
+                generator = py.comprehension(py.Name("_", py.Store()), py.Call(py.Name("_range", py.Load()), [py.Constant(size)], []), [], 0)
+                result = py.ListComp(result, [generator])
+        return result
+
+
+    def find_boxed_symbols(self, statements: list[Statement]) -> set[Symbol]:
+        # The scalar variables whose address is taken
+        boxed: set[Symbol] = set()
+        for statement in statements:
+            for node in walk(statement):
+                if not isinstance(node, UnaryPointer):
+                    continue
+                expression = node.expression
+                while isinstance(expression, SubExpression):
+                    expression = expression.expression
+                if isinstance(expression, ID) and expression.binding is not None and not self.is_object(expression.binding.type):
+                    boxed.add(expression.binding)
+        return boxed
+
+    def declarations_to_statements(self, var_decl_list: list[VariableDeclaration], algo_variables: AlgorithmVariables) -> list[py.stmt]:
+        result: list[py.stmt] = []
+        for var_decl in var_decl_list:
+            value = self.default_value(var_decl.type)
+            if algo_variables.symbols[var_decl.name.value] in self.boxed:
+                value = py.List([value], py.Load())
+            result.append(self.located(py.Assign([py.Name(self.name(var_decl.name.value), py.Store())], value), var_decl.name))
+        return result
+
+    def unboxed(self, name: str, symbol: Symbol) -> py.expr:
+        if symbol in self.boxed:
+            return py.Subscript(py.Name(self.name(name), py.Load()), py.Constant(0), py.Load())
+        return py.Name(self.name(name), py.Load())
+
+    def main_algo_to_function(self, main_algo: MainAlgorithm) -> py.FunctionDef:
+        algo_variables = self.program_variables.main_algorithm_variables
+        self.boxed = self.find_boxed_symbols(main_algo.statements)
+        self.current_distinct_parameters = set()
+        self.value_ranges = ValueRangeAnalysis(main_algo.statements, algo_variables)
+        self.value_ranges.run()
+
+        body = self.declarations_to_statements(main_algo.variable_declarations, algo_variables)
+        body += self.statements_to_py(main_algo.statements)
+
+        # The arrays are given as lists, like the other tables
+        names = [var_decl.name.value for var_decl in main_algo.variable_declarations]
+        values: list[Optional[py.expr]] = []
+        for var_decl in main_algo.variable_declarations:
+            value = self.unboxed(var_decl.name.value, algo_variables.symbols[var_decl.name.value])
+            if self.numpy_tables and self.is_object(var_decl.type):
+                value = py.Call(py.Name("_en_listes", py.Load()), [value], [])
+            values.append(value)
+        variables = py.Dict([py.Constant(name) for name in names], values)
+        body.append(py.Return(variables))
+
+        arguments = py.arguments(posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[])
+        return py.FunctionDef("_algorithme", arguments, body, [], None)
+
+    def s_algo_to_function(self, s_algo: SubAlgorithm) -> py.FunctionDef:
+        signature = self.program_variables.sub_algorithm_signatures[s_algo.name.value]
+        algo_variables = self.program_variables.sub_algorithm_variables[s_algo.name.value]
+        self.boxed = self.find_boxed_symbols(s_algo.statements)
+        self.current_distinct_parameters = self.distinct_parameters[s_algo.name.value]
+        self.value_ranges = ValueRangeAnalysis(s_algo.statements, algo_variables)
+        self.value_ranges.run()
+
+        # The returned output is a local variable
+        parameters = list(s_algo.inputs)
+        local_declarations = list(s_algo.variable_declarations)
+        if signature.output_as_return:
+            local_declarations.append(s_algo.outputs[0])
+        else:
+            parameters += s_algo.outputs
+
+        body: list[py.stmt] = []
+        for parameter in parameters:
+            if algo_variables.symbols[parameter.name.value] in self.boxed:
+                name = self.name(parameter.name.value)
+                body.append(py.Assign([py.Name(name, py.Store())], py.List([py.Name(name, py.Load())], py.Load())))
+        body += self.declarations_to_statements(local_declarations, algo_variables)
+        self.current_s_algo = s_algo
+        if s_algo.name.value in self.tail_calls:
+            body.append(py.While(py.Constant(True), self.statements_to_py(s_algo.statements) + [py.Break()], []))
+        else:
+            body += self.statements_to_py(s_algo.statements)
+        self.current_s_algo = None
+
+        returned = [output.name.value for output in self.returned_outputs(s_algo, signature)]
+        values = [self.unboxed(name, algo_variables.symbols[name]) for name in returned]
+        if len(values) == 1:
+            body.append(py.Return(values[0]))
+        elif values:
+            body.append(py.Return(py.Tuple(values, py.Load())))
+
+        arguments = py.arguments(posonlyargs=[], args=[py.arg(self.name(parameter.name.value)) for parameter in parameters], kwonlyargs=[], kw_defaults=[], defaults=[])
+        return py.FunctionDef(self.name(s_algo.name.value), arguments, body or [py.Pass()], [], None)
+
+    def returned_outputs(self, s_algo: SubAlgorithm, signature: SubAlgorithmSignature) -> list[VariableDeclaration]:
+        if signature.output_as_return:
+            return [s_algo.outputs[0]]
+        return [output for output in s_algo.outputs if not self.is_object(output.type)]
+
+
+    def statements_to_py(self, statements: list[Statement]) -> list[py.stmt]:
+        result: list[py.stmt] = []
+        for statement in statements:
+            result += [self.located(py_statement, statement) for py_statement in self.statement_to_py(statement)]
+        return result
+
+    def block_to_py(self, statements: list[Statement]) -> list[py.stmt]:
+        return self.statements_to_py(statements) or [py.Pass()]
+
+    def statement_to_py(self, statement: Statement) -> list[py.stmt]:
+        if self.current_s_algo is not None and id(statement) in self.tail_calls.get(self.current_s_algo.name.value, set()):
+            return self.tail_call_to_py(statement, self.current_s_algo)
+
+        if isinstance(statement, AssignmentStatement):
+            return [self.assignment_to_py(statement.left, self.expression_to_py(statement.right), self.c_type(statement.right))]
+
+        if isinstance(statement, SiStatement):
+            orelse = self.statements_to_py(statement.default_block)
+            for conditional_block in reversed(statement.conditional_blocks):
+                condition = self.expression_to_py(conditional_block.condition)
+                orelse = [self.located(py.If(condition, self.block_to_py(conditional_block.statements), orelse), conditional_block.condition)]
+            return orelse
+
+        if isinstance(statement, PourStatement):
+            return self.pour_to_py(statement)
+
+        if isinstance(statement, TantQueStatement):
+            return [py.While(self.expression_to_py(statement.condition), self.block_to_py(statement.statements), [])]
+
+        if isinstance(statement, FunctionStatement):
+            return self.function_statement_to_py(statement)
+
+        if isinstance(statement, ExpressionStatement):
+            return [py.Expr(self.expression_to_py(statement.expression))]
+
+        raise Exception("")
+
+    def assignment_to_py(self, left: Expression, value: py.expr, value_c_type: Optional[str]) -> py.stmt:
+        # An article is copied into the one assigned, the other values replace the previous one
+        if self.is_article(left.expr_type):
+            return py.Expr(py.Call(py.Attribute(self.expression_to_py(left), "_affecter", py.Load()), [value], []))
+        value = self.converted(value, value_c_type, cast(VariableType, left.expr_type))
+        if self.is_character_array_element(left):
+            value = py.Call(py.Name("_ord", py.Load()), [value], [])
+        return py.Assign([self.target_to_py(left)], value)
+
+    def pour_to_py(self, loop: PourStatement) -> list[py.stmt]:
+        # The loop variable ends with the first value that fails the condition, as in C. A python for loop over a
+        # range (which computes the end once) is used when the body can't change the variable or the end.
+        step = loop.step.int_value if loop.step is not None else 1
+        iterator = cast(Symbol, loop.variable.binding)
+        start = self.expression_to_py(loop.start)
+        vectorized = self.vectorized_pour_to_py(loop)
+        if vectorized is not None:
+            self.nb_vectorized_loops += 1
+            return [py.Assign([self.target_to_py(loop.variable)], start)] + vectorized
+        body = self.block_to_py(loop.statements)
+        comparison = py.Lt() if step >= 0 else py.Gt()
+
+        written = get_written_symbols(loop.statements)
+        if step == 0 or iterator in self.boxed or iterator in written or not is_pure_index(loop.end) or get_variables(loop.end) & (written | self.boxed):
+            test = py.Compare(self.expression_to_py(loop.variable), [comparison], [self.expression_to_py(loop.end)])
+            increment = py.AugAssign(self.target_to_py(loop.variable), py.Add(), py.Constant(step))
+            return [py.Assign([self.target_to_py(loop.variable)], start), py.While(test, body + [self.located(increment, loop)], [])]
+
+        nb_iterations = get_trip_count(loop)
+        if nb_iterations is not None:
+            iteration_range = py.Call(py.Name("_range", py.Load()), [start, self.expression_to_py(loop.end), py.Constant(step)], [])
+            for_loop = py.For(self.target_to_py(loop.variable), iteration_range, body, [])
+            return [for_loop, py.Assign([self.target_to_py(loop.variable)], py.Constant(cast(LitInt, loop.start).int_value + nb_iterations * step))]
+
+        # The variable keeps the start if there is no iteration, and goes one step past the last one otherwise
+        iteration_range = py.Call(py.Name("_range", py.Load()), [self.expression_to_py(loop.variable), self.expression_to_py(loop.end), py.Constant(step)], [])
+        for_loop = py.For(self.target_to_py(loop.variable), iteration_range, body, [])
+        test = py.Compare(self.expression_to_py(loop.variable), [comparison], [self.expression_to_py(loop.end)])
+        increment = py.AugAssign(self.target_to_py(loop.variable), py.Add(), py.Constant(step))
+        return [py.Assign([self.target_to_py(loop.variable)], start), for_loop, py.If(test, [self.located(increment, loop)], [])]
+
+    def vectorized_pour_to_py(self, loop: PourStatement) -> Optional[list[py.stmt]]:
+        # The statements running all the iterations of an element-wise loop at once, after the variable is given the
+        # start: each assignment to an element of an array becomes an assignment to the slice of the elements the
+        # iterations go through. None if the loop isn't element-wise.
+        iterator = loop.variable.binding
+        if not self.numpy_tables or iterator is None or iterator in self.boxed:
+            return None
+        nb_iterations = get_trip_count(loop)
+        if nb_iterations is not None and nb_iterations < MIN_VECTORIZED_ITERATIONS:
+            return None
+        if not has_independent_accesses(loop, self.pure_sub_algorithms, self.current_distinct_parameters):
+            return None
+
+        step = loop.step.int_value if loop.step is not None else 1
+        vector_loop = VectorizedLoop(iterator, self.new_temporary(), self.new_temporary(), step)
+        assignments: list[py.stmt] = []
+        for statement in loop.statements:
+            if not isinstance(statement, AssignmentStatement) or not mentions(statement.left, iterator):
+                return None
+            target = self.vector_expression_to_py(statement.left, vector_loop)
+            value = self.vector_expression_to_py(statement.right, vector_loop)
+            if not isinstance(target, py.Subscript) or value is None:
+                return None
+            assignments.append(self.located(py.Assign([self.stored(target)], value), statement))
+
+        # The iterations are counted like the python for loops, the variable ending one step past the last one
+        variable = self.expression_to_py(loop.variable)
+        nb_elements = py.Name(vector_loop.nb_elements, py.Load())
+        iteration_range = py.Call(py.Name("_range", py.Load()), [variable, self.expression_to_py(loop.end), py.Constant(step)], [])
+        count = py.Assign([py.Name(vector_loop.nb_elements, py.Store())], py.Call(py.Name("_len", py.Load()), [iteration_range], []))
+        last = py.BinOp(variable, py.Add(), py.BinOp(nb_elements, py.Mult(), py.Constant(step)))
+        if vector_loop.uses_values:
+            dtype = py.keyword("dtype", py.Constant(NUMPY_DTYPES["entier"]))
+            values = py.Call(py.Attribute(py.Name("_numpy", py.Load()), "arange", py.Load()), [variable, last, py.Constant(step)], [dtype])
+            assignments.insert(0, py.Assign([py.Name(vector_loop.values, py.Store())], values))
+        increment = self.located(py.Assign([self.target_to_py(loop.variable)], last), loop)
+        return [count, py.If(py.Compare(nb_elements, [py.Gt()], [py.Constant(0)]), assignments + [increment], [])]
+
+    def vector_expression_to_py(self, expression: Expression, vector_loop: VectorizedLoop) -> Optional[py.expr]:
+        # The values of the expression for all the iterations, as an array (or a single value when the expression
+        # doesn't depend on the loop variable). The caractères are their codes, like in the arrays. None if numpy
+        # can't compute it the way the iterations would.
+        if not mentions(expression, vector_loop.iterator):
+            value = self.expression_to_py(expression)
+            if isinstance(expression.expr_type, BaseType) and expression.expr_type.value == "caractère":
+                value = py.Call(py.Name("_ord", py.Load()), [value], [])
+            return value
+
+        if isinstance(expression, ID):
+            vector_loop.uses_values = True
+            return py.Name(vector_loop.values, py.Load())
+        if isinstance(expression, SubExpression):
+            return self.vector_expression_to_py(expression.expression, vector_loop)
+        if isinstance(expression, TableExpression):
+            return self.vector_access_to_py(expression, vector_loop)
+
+        if isinstance(expression, UnaryOperation) and not isinstance(expression, (UnaryPointer, UnaryDereference)):
+            operand = self.vector_expression_to_py(expression.expression, vector_loop)
+            if operand is None:
+                return None
+            if isinstance(expression, UnaryNot):
+                return py.Call(py.Attribute(py.Name("_numpy", py.Load()), "logical_not", py.Load()), [operand], [])
+            return py.UnaryOp(py.UAdd() if isinstance(expression, UnaryPlus) else py.USub(), operand)
+
+        if not isinstance(expression, BinaryOperation):
+            return None
+        # numpy doesn't stop on a division by 0, which is only allowed by a literal that isn't 0
+        if isinstance(expression, (BinaryDivide, BinaryModulo)):
+            divisor = expression.right
+            if not isinstance(divisor, (LitInt, LitFloat)) or (divisor.int_value if isinstance(divisor, LitInt) else divisor.float_value) == 0:
+                return None
+
+        left = self.vector_expression_to_py(expression.left, vector_loop)
+        right = self.vector_expression_to_py(expression.right, vector_loop)
+        if left is None or right is None:
+            return None
+        operands_type = self.operands_c_type(expression)
+        left = self.vector_operand_to_py(left, expression.left, operands_type)
+        right = self.vector_operand_to_py(right, expression.right, operands_type)
+
+        if isinstance(expression, BinaryDivide) and isinstance(expression.expr_type, BaseType) and expression.expr_type.value == "entier":
+            return py.Call(py.Name("_division_tableau", py.Load()), [left, right], [])
+        if isinstance(expression, BinaryModulo):
+            return py.Call(py.Name("_reste_tableau", py.Load()), [left, right], [])
+        if isinstance(expression, (BinaryAnd, BinaryOr)):
+            function = "logical_and" if isinstance(expression, BinaryAnd) else "logical_or"
+            return py.Call(py.Attribute(py.Name("_numpy", py.Load()), function, py.Load()), [left, right], [])
+
+        comparisons = {BinaryEq: py.Eq, BinaryLT: py.Lt, BinaryGT: py.Gt, BinaryLTE: py.LtE, BinaryGTE: py.GtE}
+        if type(expression) in comparisons:
+            return py.Compare(left, [comparisons[type(expression)]()], [right])
+        operators = {BinaryPlus: py.Add, BinaryMinus: py.Sub, BinaryTimes: py.Mult, BinaryDivide: py.Div}
+        if type(expression) not in operators:
+            return None
+        return py.BinOp(left, operators[type(expression)](), right)
+
+    def vector_operand_to_py(self, operand_py: py.expr, operand: Expression, operands_type: Optional[str]) -> py.expr:
+        # The operand converted to the type C computes the operation in: numpy would compute a float32 array and a
+        # python float in float32, and an int32 and a float32 array in float64
+        operand_type = self.c_type(operand)
+        converted = (operands_type == "double" and operand_type != "double") or (operands_type == "float" and operand_type == "int")
+        if not converted:
+            return operand_py
+        numpy_type = py.Attribute(py.Name("_numpy", py.Load()), NUMPY_NUMBER_TYPES[operands_type], py.Load())
+        return py.Call(numpy_type, [operand_py], [])
+
+    def vector_access_to_py(self, expression: TableExpression, vector_loop: VectorizedLoop) -> Optional[py.expr]:
+        # The elements of an array read at i + c along one dimension, at the same position along the others
+        table = expression.table_expression
+        if not isinstance(table, ID) or table.binding is None or self.get_array_element_type(table.expr_type) is None:
+            return None
+        table_type = cast(TableType, table.expr_type)
+        if not isinstance(table_type.type, BaseType) or len(expression.indexes) != len(table_type.ranges):
+            return None
+
+        if sum(mentions(index, vector_loop.iterator) for index in expression.indexes) != 1:
+            return None
+
+        keys: list[py.expr] = []
+        for k, (table_range, index) in enumerate(zip(table_type.ranges, expression.indexes)):
+            key = self.index_to_py(expression, k)
+            if mentions(index, vector_loop.iterator):
+                if not is_iterator_index(index, vector_loop.iterator):
+                    return None
+                # The size of a table parameter without an end is the one of the array given
+                if table_range.end is None:
+                    size: py.expr = py.Subscript(py.Attribute(self.expression_to_py(table), "shape", py.Load()), py.Constant(k), py.Load())
+                else:
+                    size = py.Constant(table_range.end.int_value - table_range.start.int_value)
+                key = py.Call(py.Name("_tranche", py.Load()), [key, py.Name(vector_loop.nb_elements, py.Load()), py.Constant(vector_loop.step), size], [])
+            keys.append(key)
+        return py.Subscript(self.expression_to_py(table), keys[0] if len(keys) == 1 else py.Tuple(keys, py.Load()), py.Load())
+
+    def function_statement_to_py(self, statement: FunctionStatement) -> list[py.stmt]:
+        function_name = statement.name.value
+        signature = self.program_variables.sub_algorithm_signatures[function_name]
+        s_algo = self.program_variables.sub_algorithms[function_name]
+        inputs = self.call_inputs_to_py(statement.inputs, s_algo)
+
+        if signature.output_as_return:
+            call = py.Call(py.Name(self.name(function_name), py.Load()), inputs, [])
+            return [self.assignment_to_py(statement.outputs[0], call, self.type_to_c_type(signature.output_types[0]))]
+
+        # The outputs written after the call are those designated before it: the containers and keys of the
+        # elements are kept in temporaries
+        result: list[py.stmt] = []
+        outputs: list[py.expr] = []
+        # The targets of the returned values, and whether they are caractères stored as their code
+        targets: list[tuple[py.expr, bool]] = []
+        for output, output_type in zip(statement.outputs, signature.output_types):
+            array_access = self.get_array_access(output)
+            if array_access is not None and not self.is_object(output_type):
+                container, key = self.new_temporary(), self.new_temporary()
+                result.append(py.Assign([py.Name(container, py.Store())], array_access[0]))
+                result.append(py.Assign([py.Name(key, py.Store())], array_access[1]))
+                element: py.expr = py.Call(py.Attribute(py.Name(container, py.Load()), "item", py.Load()), [py.Name(key, py.Load())], [])
+                is_character = self.is_character_array_element(output)
+                outputs.append(py.Call(py.Name("_chr", py.Load()), [element], []) if is_character else element)
+                targets.append((py.Subscript(py.Name(container, py.Load()), py.Name(key, py.Load()), py.Store()), is_character))
+                continue
+
+            output_py = self.expression_to_py(output)
+            if self.is_object(output_type):
+                outputs.append(output_py)
+                continue
+
+            if isinstance(output_py, py.Subscript):
+                container, key = self.new_temporary(), self.new_temporary()
+                result.append(py.Assign([py.Name(container, py.Store())], output_py.value))
+                result.append(py.Assign([py.Name(key, py.Store())], cast(py.expr, output_py.slice)))
+                output_py = py.Subscript(py.Name(container, py.Load()), py.Name(key, py.Load()), py.Load())
+            elif isinstance(output_py, py.Attribute):
+                container = self.new_temporary()
+                result.append(py.Assign([py.Name(container, py.Store())], output_py.value))
+                output_py = py.Attribute(py.Name(container, py.Load()), output_py.attr, py.Load())
+
+            outputs.append(output_py)
+            targets.append((self.stored(output_py), False))
+
+        call = py.Call(py.Name(self.name(function_name), py.Load()), inputs + outputs, [])
+        if not targets:
+            result.append(py.Expr(call))
+            return result
+
+        # The returned caractères go through temporaries, to be converted to their code
+        stores = [target for target, _ in targets]
+        converted_stores: list[py.stmt] = []
+        if any(is_character for _, is_character in targets):
+            stores = []
+            for target, is_character in targets:
+                value = self.new_temporary()
+                stores.append(py.Name(value, py.Store()))
+                value_py: py.expr = py.Name(value, py.Load())
+                converted_stores.append(py.Assign([target], py.Call(py.Name("_ord", py.Load()), [value_py], []) if is_character else value_py))
+
+        if len(stores) == 1:
+            result.append(py.Assign(stores, call))
+        else:
+            result.append(py.Assign([py.Tuple(stores, py.Store())], call))
+        return result + converted_stores
+
+    def tail_call_to_py(self, statement: Statement, s_algo: SubAlgorithm) -> list[py.stmt]:
+        # The inputs that change take the values of the arguments, all computed before the first one is assigned
+        inputs, _ = cast(tuple[list[Expression], list[Expression]], get_self_call(statement, s_algo))
+        symbols = self.program_variables.sub_algorithm_variables[s_algo.name.value].symbols
+        values = self.call_inputs_to_py(inputs, s_algo)
+
+        targets: list[py.expr] = []
+        changed_values: list[py.expr] = []
+        for input, input_decl, value in zip(inputs, s_algo.inputs, values):
+            if not is_parameter(input, symbols[input_decl.name.value]):
+                targets.append(py.Name(self.name(input_decl.name.value), py.Store()))
+                changed_values.append(value)
+
+        result: list[py.stmt] = []
+        if len(targets) == 1:
+            result.append(py.Assign(targets, changed_values[0]))
+        elif targets:
+            result.append(py.Assign([py.Tuple(targets, py.Store())], py.Tuple(changed_values, py.Load())))
+        return result + [py.Continue()]
+
+    def call_inputs_to_py(self, inputs: list[Expression], s_algo: SubAlgorithm) -> list[py.expr]:
+        # The articles are copied, unless the sub-algorithm never modifies them or they are returned by a call
+        result = []
+        for input, input_decl in zip(inputs, s_algo.inputs):
+            input_py = self.converted(self.expression_to_py(input), self.c_type(input), input_decl.type)
+            if self.is_article(input_decl.type) and input_decl.name.value not in self.pointer_inputs[s_algo.name.value] and not isinstance(input, FunctionExpression):
+                input_py = py.Call(py.Attribute(input_py, "_copie", py.Load()), [], [])
+            result.append(input_py)
+        return result
+
+    def converted(self, value: py.expr, from_c_type: Optional[str], to_type: VariableType) -> py.expr:
+        # An entier or a double given to a réel is rounded to a float, as the C conversion does
+        if not (from_c_type in ("int", "double") and isinstance(to_type, BaseType) and to_type.value == "réel"):
+            return value
+        return self.rounded(value)
+
+    @staticmethod
+    def rounded(value: py.expr) -> py.expr:
+        # The value as a float
+        if isinstance(value, py.Constant):
+            return py.Constant(to_float(value.value))
+        return py.Call(py.Name("_reel", py.Load()), [value], [])
+
+    @staticmethod
+    def type_to_c_type(var_type: Optional[VariableType]) -> Optional[str]:
+        if isinstance(var_type, BaseType):
+            return C_NUMBER_TYPES.get(var_type.value)
+        return None
+
+    def c_type(self, expression: Expression) -> Optional[str]:
+        # The C type of the number computed by the expression (None if it isn't one)
+        if isinstance(expression, LitFloat):
+            return "double"
+        if isinstance(expression, (SubExpression, UnaryPlus, UnaryMinus)):
+            return self.c_type(expression.expression)
+        if isinstance(expression, (BinaryPlus, BinaryMinus, BinaryTimes, BinaryDivide, BinaryModulo)):
+            return self.operands_c_type(expression)
+        return self.type_to_c_type(expression.expr_type)
+
+    def operands_c_type(self, expression: BinaryOperation) -> Optional[str]:
+        # The type both operands are converted to
+        operand_types = (self.c_type(expression.left), self.c_type(expression.right))
+        return next((c_type for c_type in C_NUMBER_PROMOTIONS if c_type in operand_types), None)
+
+    def wraps(self, expression: Expression) -> bool:
+        # The operations on entiers whose result can go beyond 32 bits (the analysis gives no range to those that overflow)
+        if not isinstance(expression, (BinaryPlus, BinaryMinus, BinaryTimes, UnaryMinus)) or self.c_type(expression) != "int":
+            return False
+        return not isinstance(self.value_ranges.get_range(expression), tuple)
+
+    @staticmethod
+    def wrapped(value: py.expr) -> py.expr:
+        # The value brought back to a 32 bits int (with the bits above removed, like the C operations)
+        offset = py.BinOp(value, py.Add(), py.Constant(1 << (INT_BITS - 1)))
+        masked = py.BinOp(offset, py.BitAnd(), py.Constant((1 << INT_BITS) - 1))
+        return py.BinOp(masked, py.Sub(), py.Constant(1 << (INT_BITS - 1)))
+
+    @staticmethod
+    def stored(expression: py.expr) -> py.expr:
+        # The same access, as the target of an assignment
+        if isinstance(expression, py.Name):
+            return py.Name(expression.id, py.Store())
+        if isinstance(expression, py.Subscript):
+            return py.Subscript(expression.value, expression.slice, py.Store())
+        if isinstance(expression, py.Attribute):
+            return py.Attribute(expression.value, expression.attr, py.Store())
+        raise Exception("")
+
+    def target_to_py(self, expression: Expression) -> py.expr:
+        array_access = self.get_array_access(expression)
+        if array_access is not None:
+            return py.Subscript(array_access[0], array_access[1], py.Store())
+        return self.stored(self.expression_to_py(expression))
+
+
+    def expression_to_py(self, expression: Expression) -> py.expr:
+        if isinstance(expression, ID):
+            symbol = expression.binding
+            if symbol is not None and symbol in self.boxed:
+                return py.Subscript(py.Name(self.name(expression.value), py.Load()), py.Constant(0), py.Load())
+            return py.Name(self.name(expression.value), py.Load())
+        if isinstance(expression, LitInt):
+            return py.Constant(expression.int_value)
+        if isinstance(expression, LitFloat):
+            return py.Constant(expression.float_value)
+        if isinstance(expression, LitChar):
+            return py.Constant(expression.char_value)
+        if isinstance(expression, LitBool):
+            return py.Constant(expression.bool_value)
+
+        if isinstance(expression, SubExpression):
+            return self.expression_to_py(expression.expression)
+
+        if self.wraps(expression):
+            return self.wrapped(self.unwrapped_to_py(expression))
+        if isinstance(expression, BinaryOperation):
+            return self.binary_operation_to_py(expression)
+
+        if isinstance(expression, UnaryPointer):
+            return self.address_to_py(expression.expression)
+        if isinstance(expression, UnaryDereference):
+            return py.Attribute(self.expression_to_py(expression.expression), "valeur", py.Load())
+        if isinstance(expression, UnaryOperation):
+            operator = {UnaryPlus: py.UAdd, UnaryMinus: py.USub, UnaryNot: py.Not}[type(expression)]
+            return py.UnaryOp(operator(), self.expression_to_py(expression.expression))
+
+        array_access = self.get_array_access(expression)
+        if array_access is not None:
+            # A part of an array is a view sharing its elements, an element is read as a python value
+            array, key = array_access
+            if isinstance(expression.expr_type, TableType):
+                return py.Subscript(array, key, py.Load())
+            element = py.Call(py.Attribute(array, "item", py.Load()), [key], [])
+            if self.is_character_array_element(expression):
+                return py.Call(py.Name("_chr", py.Load()), [element], [])
+            return element
+
+        if isinstance(expression, TableExpression):
+            result = self.expression_to_py(expression.table_expression)
+            for k in range(len(expression.indexes)):
+                result = py.Subscript(result, self.index_to_py(expression, k), py.Load())
+            return result
+
+        if isinstance(expression, AttributeExpression):
+            return py.Attribute(self.expression_to_py(expression.expression), self.name(expression.attribute.value), py.Load())
+
+        if isinstance(expression, FunctionExpression):
+            s_algo = self.program_variables.sub_algorithms[expression.name.value]
+            return py.Call(py.Name(self.name(expression.name.value), py.Load()), self.call_inputs_to_py(expression.inputs, s_algo), [])
+
+        raise Exception("")
+
+    def index_to_py(self, access: TableExpression, dimension: int) -> py.expr:
+        # The position in the list of the index of the dimension, which starts at 0
+        table_range = cast(TableType, access.table_expression.expr_type).ranges[dimension]
+        index = access.indexes[dimension]
+        start = table_range.start.int_value
+        if (id(access), dimension) not in self.safe_indexes:
+            end = py.Constant(table_range.end.int_value if table_range.end is not None else None)
+            return py.Call(py.Name("_indice", py.Load()), [self.expression_to_py(index), py.Constant(start), end], [])
+
+        if isinstance(index, LitInt):
+            return py.Constant(index.int_value - start)
+        index_py = self.expression_to_py(index)
+        if start == 0:
+            return index_py
+        return py.BinOp(index_py, py.Sub(), py.Constant(start))
+
+    def unwrapped_to_py(self, expression: Expression) -> py.expr:
+        # An operand of an operation on entiers, whose result doesn't need to be brought back to 32 bits yet
+        while isinstance(expression, SubExpression):
+            expression = expression.expression
+        if isinstance(expression, UnaryMinus) and self.wraps(expression):
+            return py.UnaryOp(py.USub(), self.unwrapped_to_py(expression.expression))
+        if isinstance(expression, BinaryOperation) and self.wraps(expression):
+            return self.binary_operation_to_py(expression)
+        return self.expression_to_py(expression)
+
+    def operand_to_py(self, operand: Expression, expression: BinaryOperation) -> py.expr:
+        # An entier operand of an operation on floats is rounded to a float first
+        if self.wraps(expression):
+            return self.unwrapped_to_py(operand)
+        operand_py = self.expression_to_py(operand)
+        if self.operands_c_type(expression) == "float" and self.c_type(operand) == "int":
+            return self.rounded(operand_py)
+        return operand_py
+
+    def binary_operation_to_py(self, expression: BinaryOperation) -> py.expr:
+        left = self.operand_to_py(expression.left, expression)
+        right = self.operand_to_py(expression.right, expression)
+
+        # The division of two entiers truncates, and the remainder has the sign of the dividend
+        if isinstance(expression, BinaryDivide) and isinstance(expression.expr_type, BaseType) and expression.expr_type.value == "entier":
+            return py.Call(py.Name("_division", py.Load()), [left, right], [])
+        if isinstance(expression, BinaryModulo):
+            return py.Call(py.Name("_reste", py.Load()), [left, right], [])
+
+        if isinstance(expression, (BinaryAnd, BinaryOr)):
+            return py.BoolOp(py.And() if isinstance(expression, BinaryAnd) else py.Or(), [left, right])
+
+        comparisons = {BinaryEq: py.Eq, BinaryLT: py.Lt, BinaryGT: py.Gt, BinaryLTE: py.LtE, BinaryGTE: py.GtE}
+        if type(expression) in comparisons:
+            return py.Compare(left, [comparisons[type(expression)]()], [right])
+
+        operators = {BinaryPlus: py.Add, BinaryMinus: py.Sub, BinaryTimes: py.Mult, BinaryDivide: py.Div}
+        result = py.BinOp(left, operators[type(expression)](), right)
+        if self.c_type(expression) == "float":
+            return self.rounded(result)
+        return result
+
+    def address_to_py(self, expression: Expression) -> py.expr:
+        while isinstance(expression, SubExpression):
+            expression = expression.expression
+        if isinstance(expression, UnaryDereference):
+            return self.expression_to_py(expression.expression)
+
+        array_access = self.get_array_access(expression)
+        if array_access is not None and not self.is_object(expression.expr_type):
+            pointer_class = "_PointeurCaractere" if self.is_character_array_element(expression) else "_PointeurTableau"
+            return py.Call(py.Name(pointer_class, py.Load()), list(array_access), [])
+
+        expression_py = self.expression_to_py(expression)
+        if self.is_object(expression.expr_type):
+            return py.Call(py.Name("_PointeurObjet", py.Load()), [expression_py], [])
+        if isinstance(expression_py, py.Subscript):
+            return py.Call(py.Name("_Pointeur", py.Load()), [expression_py.value, cast(py.expr, expression_py.slice)], [])
+        if isinstance(expression_py, py.Attribute):
+            return py.Call(py.Name("_PointeurChamp", py.Load()), [expression_py.value, py.Constant(expression_py.attr)], [])
+        raise Exception("")
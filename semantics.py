@@ -5,7 +5,7 @@ from typing import Any, Optional, Tuple
 from ast_nodes import Program
 from errors import AttributeRedeclarationError, CKeywordError, DifferentTypesComparisonError, IdRedefinitionError, IncompatibleAssignmentTypesError, IncompatibleInputTypeError, IncompatibleOutputTypeError, InvalidAttributError, InvalidBinaryOperationTermType, InvalidUnaryOperationExpressionTypeError, NonAssignableExpressionError, NonBooleanIfConditionError, NonBooleanUnaryNotError, NonBooleanWhileConditionError, NonCustomTypeAttributeAccessError, NonIntegerEndError, NonIntegerIndexError, NonIntegerIterationVariableError, NonIntegerStartError, NonPointerDereferenceError, NonTableElementAccessError, NonUniqueOutputFunctionExpressionError, SemanticError, SubAlgoRedefinitionError, TableAssignmentError, TableEndNotDefinedForVariableError, TableIndexWrongTypeError, TableRangeInvalidEndError, TypeDefinitionRecursionError, TypeRedefinitionError, UndeclaredVariableError, UndefinedFunctionError, UnknownBaseTypeError, UnmatchedNumberOfInputsError, UnmatchedNumberOfOutputsError, UnmatchedTableIndexesError, VariableRedeclarationError
 from parser import MyParser
-from program_variables import AlgorithmVariables, ProgramVariables
+from program_variables import AlgorithmVariables, ProgramVariables, SubAlgorithmSignature
 
 
 REEL_T = "réel"
@@ -28,8 +28,15 @@ class MySemantics:
         self.parser = parser
         self.semantic_errors: list[SemanticError] = []
         self.custom_types: dict[str, CustomTypeDefinition] = {}
+
+        # The custom types, ordered so that each article comes after the articles it contains
+        self.sorted_custom_types: list[CustomTypeDefinition] = []
         
         self.sous_algos: dict[str, SubAlgorithm] = {}
+        self.signatures: dict[str, SubAlgorithmSignature] = {}
+
+        # Equal parameter types are shared between signatures, keyed by their string representation
+        self._interned_types: dict[str, VariableType] = {}
 
         # A list of 'bad' / unknown variable basetypes. Used to prevent a bad type from generating multiple errors for multiple variables.
         self._bad_var_types: set[str] = set()
@@ -52,7 +59,7 @@ class MySemantics:
 
         sub_algos = {s.name.value: s for s in program.sub_algorithms_list}
 
-        return ProgramVariables(main_algo_variables, s_algo_variables, sub_algos), None
+        return ProgramVariables(main_algo_variables, s_algo_variables, sub_algos, self.sorted_custom_types, self.signatures), None
 
     def verify_type_definitions(self, type_defs: list[CustomTypeDefinition]):
 
@@ -89,39 +96,66 @@ class MySemantics:
 
                 self.verify_var_type(attr_type)
 
-        # Finally, test for recursion errors
-        for t in type_defs:
-            if self.type_contains_type(BaseType(t.name.value), BaseType(t.name.value)):
-                e = TypeDefinitionRecursionError(t.name)
-                self.add_error(e)
-
-    def type_contains_type(self, type_to_check: VariableType, other_type: VariableType, visited_custom_types: Optional[set[str]] = None) -> bool:
-        if isinstance(type_to_check, PtrType):
-            return False
-
-        if visited_custom_types == None:
-            visited_custom_types = set()
-
-        if isinstance(type_to_check, BaseType):
-            if type_to_check.value in visited_custom_types:
-                return True
-
-            if type_to_check.value not in self.custom_types:
-                return False
-
-            visited_custom_types.add(type_to_check.value)
-            
-            type_def = self.custom_types[type_to_check.value]
-            for attr in type_def.attributes:
-                if self.type_contains_type(attr.type, other_type, visited_custom_types):
-                    return True
-
-            return False
-
-        if isinstance(type_to_check, TableType):
-            return self.type_contains_type(type_to_check.type, other_type, visited_custom_types)
+        # Finally, test for recursion errors. A single pass finds all the strongly connected components of the
+        # article containment graph, every article that is part of a cycle is recursive.
+        for component in self.get_type_definitions_components():
+            for t in component:
+                if len(component) > 1 or t.name.value in self.get_contained_custom_types(t):
+                    e = TypeDefinitionRecursionError(t.name)
+                    self.add_error(e)
 
-        raise Exception("")
+            self.sorted_custom_types += component
+
+    def get_contained_custom_types(self, type_def: CustomTypeDefinition) -> list[str]:
+        contained_types = []
+        for attr in type_def.attributes:
+            attr_type = attr.type
+
+            # Tables contain their elements, but pointers don't contain what they point to
+            while isinstance(attr_type, TableType):
+                attr_type = attr_type.type
+
+            if isinstance(attr_type, BaseType) and attr_type.value in self.custom_types:
+                contained_types.append(attr_type.value)
+
+        return contained_types
+
+    def get_type_definitions_components(self) -> list[list[CustomTypeDefinition]]:
+        # Tarjan's algorithm. The components are found in reverse topological order, meaning that an article is
+        # always preceded by the articles it contains, which is also the order in which they must be defined in C.
+        components: list[list[CustomTypeDefinition]] = []
+        indexes: dict[str, int] = {}
+        low_links: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+
+        def visit(type_name: str):
+            indexes[type_name] = low_links[type_name] = len(indexes)
+            stack.append(type_name)
+            on_stack.add(type_name)
+
+            for contained_type in self.get_contained_custom_types(self.custom_types[type_name]):
+                if contained_type not in indexes:
+                    visit(contained_type)
+                    low_links[type_name] = min(low_links[type_name], low_links[contained_type])
+                elif contained_type in on_stack:
+                    low_links[type_name] = min(low_links[type_name], indexes[contained_type])
+
+            if low_links[type_name] == indexes[type_name]:
+                component = []
+                while True:
+                    name = stack.pop()
+                    on_stack.remove(name)
+                    component.append(self.custom_types[name])
+                    if name == type_name:
+                        break
+                components.append(component[::-1])
+
+        for type_name in self.custom_types:
+            if type_name not in indexes:
+                visit(type_name)
+
+        return components
 
     
     # First we need to discover all the sub algorithms before checking if they are valid, incase one of them calls another
@@ -141,6 +175,27 @@ class MySemantics:
                 self.add_error(e)
             else:
                 self.sous_algos[s_algo_name] = s_algo
+                self.signatures[s_algo_name] = self.get_signature(s_algo)
+
+    def intern_type(self, var_type: VariableType) -> VariableType:
+        return self._interned_types.setdefault(str(var_type), var_type)
+
+    def get_signature(self, s_algo: SubAlgorithm) -> SubAlgorithmSignature:
+        input_types = [self.intern_type(input_var.type) for input_var in s_algo.inputs]
+        output_types = [self.intern_type(output_var.type) for output_var in s_algo.outputs]
+
+        output_as_return = len(output_types) == 1 and not isinstance(output_types[0], TableType)
+        outputs_as_pointer = [not output_as_return and not isinstance(output_type, TableType) for output_type in output_types]
+
+        return SubAlgorithmSignature(
+            s_algo.name.value,
+            input_types,
+            output_types,
+            [SubAlgorithmSignature.get_open_dimensions(input_type) for input_type in input_types],
+            [SubAlgorithmSignature.get_open_dimensions(output_type) for output_type in output_types],
+            output_as_return,
+            outputs_as_pointer
+        )
 
 
     def verify_main_algo_and_get_variables(self, main_algo: MainAlgorithm) -> AlgorithmVariables:
@@ -254,6 +309,9 @@ class MySemantics:
             for statement in c_b.statements:
                 self.verify_statement(statement, algo_variables)
 
+        for statement in si_statement.default_block:
+            self.verify_statement(statement, algo_variables)
+
     
     def verify_function_statement(self, function_statement: FunctionStatement, algo_variables: AlgorithmVariables):
         function_name = function_statement.name
@@ -280,9 +338,9 @@ class MySemantics:
         if undeclared:
             return
 
-        s_algo = self.sous_algos[function_name.value]
-        expected_input_types = [input_var.type for input_var in s_algo.inputs]
-        expected_output_types = [output_var.type for output_var in s_algo.outputs]
+        signature = self.signatures[function_name.value]
+        expected_input_types = signature.input_types
+        expected_output_types = signature.output_types
 
         if len(input_types) != len(expected_input_types):
             e = UnmatchedNumberOfInputsError(function_name, len(input_types), len(expected_input_types))
@@ -387,7 +445,7 @@ class MySemantics:
                 outputs[var_name] = var_type
                 ids[var_name] = var_id
 
-        return AlgorithmVariables(variables, inputs, outputs)
+        return AlgorithmVariables(inputs=inputs, outputs=outputs, variables=variables)
 
     @staticmethod
     def is_entier(var_type: VariableType) -> bool:
@@ -415,7 +473,7 @@ class MySemantics:
                     e = TableEndNotDefinedForVariableError(start)
                     self.add_error(e)
                 elif end is not None:
-                    if int(end.value) <= int(start.value):
+                    if end.int_value <= start.int_value:
                         e = TableRangeInvalidEndError(end, description="L'indice de fin ne peut pas être inférieur ou égal à l'indice de début")
                         self.add_error(e)
                         is_valid = False
@@ -578,13 +636,16 @@ class MySemantics:
             
 
     def verify_id_and_get_type(self, _id: ID, algo_variables: AlgorithmVariables) -> VariableType | None:
-        id_type = algo_variables.get_var_type(_id.value)
-        if id_type is None:
+        symbol = _id.binding
+        if symbol is None:
+            symbol = _id.binding = algo_variables.symbols.get(_id.value)
+
+        if symbol is None:
             e = UndeclaredVariableError(_id)
             self.add_error(e)
             return None
             
-        return id_type
+        return symbol.type
 
     def is_compatible_type(self, left_type: VariableType, right_type: VariableType, cast_entier_to_reel = False) -> bool:
         if isinstance(left_type, BaseType):
@@ -687,16 +748,15 @@ class MySemantics:
             self.add_error(e)
             return None
 
-        function = self.sous_algos[function_name.value]
-        expected_outputs = function.outputs
-        if len(expected_outputs) != 1:
-            e = NonUniqueOutputFunctionExpressionError(function_name, len(expected_outputs))
+        signature = self.signatures[function_name.value]
+        if signature.nb_outputs != 1:
+            e = NonUniqueOutputFunctionExpressionError(function_name, signature.nb_outputs)
             self.add_error(e)
             return None
 
         inputs = function_expression.inputs
         input_types = [self.verify_expression_and_get_type(input_expression, algo_variables) for input_expression in inputs]
-        expected_input_types = [input_var.type for input_var in function.inputs]
+        expected_input_types = signature.input_types
 
         if len(input_types) != len(expected_input_types):
             e = UnmatchedNumberOfInputsError(function_name, len(input_types), len(expected_input_types))
@@ -707,5 +767,5 @@ class MySemantics:
                     e = IncompatibleInputTypeError(in_expr, in_type, exp_in_type)
                     self.add_error(e)
 
-        return expected_outputs[0].type
+        return signature.output_types[0]
 
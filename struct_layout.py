@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from ast_nodes import BaseType, CustomTypeDefinition, PtrType, TableType, VariableDeclaration, VariableType
+
+# Size and alignment in bytes of the C types the compiler emits, as on the usual 64 bits targets
+BASE_TYPE_LAYOUTS = {
+    "entier"   : (4, 4),
+    "réel"     : (4, 4),
+    "caractère": (1, 1),
+    "booléen"  : (1, 1),
+}
+POINTER_LAYOUT = (8, 8)
+
+
+def get_type_layout(var_type: VariableType, struct_layouts: dict[str, tuple[int, int]]) -> tuple[int, int]:
+    if isinstance(var_type, PtrType):
+        return POINTER_LAYOUT
+
+    if isinstance(var_type, TableType):
+        element_size, alignment = get_type_layout(var_type.type, struct_layouts)
+        nb_elements = 1
+        for table_range in var_type.ranges:
+            assert table_range.end is not None
+            nb_elements *= table_range.end.int_value - table_range.start.int_value
+        return element_size * nb_elements, alignment
+
+    assert isinstance(var_type, BaseType)
+    if var_type.value in BASE_TYPE_LAYOUTS:
+        return BASE_TYPE_LAYOUTS[var_type.value]
+    return struct_layouts[var_type.value]
+
+def get_struct_layout(attributes: list[VariableDeclaration], struct_layouts: dict[str, tuple[int, int]]) -> tuple[int, int]:
+    # Each field starts at the next multiple of its alignment, and the size is rounded up to the largest one
+    offset = 0
+    struct_alignment = 1
+    for attribute in attributes:
+        size, alignment = get_type_layout(attribute.type, struct_layouts)
+        offset = (offset + alignment - 1) // alignment * alignment + size
+        struct_alignment = max(struct_alignment, alignment)
+
+    return (offset + struct_alignment - 1) // struct_alignment * struct_alignment, struct_alignment
+
+
+class StructLayout:
+    # Reorders the fields of the article types by decreasing alignment, which leaves no padding between them. The
+    # fields keep their names, so only their position in memory changes. The custom types have to be given in
+    # dependency order, as the layout of a nested article is needed to place it.
+
+    def __init__(self, custom_types: list[CustomTypeDefinition]) -> None:
+        self.attributes: dict[str, list[VariableDeclaration]] = {}
+
+        # Size and alignment of each type, with the fields in declaration order and once reordered
+        self.original_layouts: dict[str, tuple[int, int]] = {}
+        self.layouts: dict[str, tuple[int, int]] = {}
+
+        for custom_type in custom_types:
+            name = custom_type.name.value
+            self.original_layouts[name] = get_struct_layout(custom_type.attributes, self.original_layouts)
+
+            # sorted is stable, so fields with the same alignment stay in declaration order
+            attributes = sorted(custom_type.attributes, key=lambda attribute: -get_type_layout(attribute.type, self.layouts)[1])
+            self.attributes[name] = attributes
+            self.layouts[name] = get_struct_layout(attributes, self.layouts)
+
+    def get_size_savings(self) -> dict[str, tuple[int, int]]:
+        # The size of each type before and after reordering its fields
+        return {name: (self.original_layouts[name][0], self.layouts[name][0]) for name in self.layouts}
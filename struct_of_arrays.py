@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from ast_nodes import ID, AttributeExpression, BaseType, Program, Statement, TableExpression, TableType, walk
+from program_variables import VARIABLE_KIND, AlgorithmVariables, ProgramVariables, Symbol
+
+
+def find_struct_of_arrays_tables(program: Program, program_variables: ProgramVariables) -> set[Symbol]:
+    # The local tables of articles that can be stored as one table per field: every use of them has to access a
+    # single field of an element (tab[i].champ), so the table is never passed whole, copied or pointed to
+    custom_types = {custom_type.name.value for custom_type in program_variables.custom_types}
+
+    algorithms: list[tuple[list[Statement], AlgorithmVariables]] = [(program.main_algorithm.statements, program_variables.main_algorithm_variables)]
+    for s_algo in program.sub_algorithms_list:
+        algorithms.append((s_algo.statements, program_variables.sub_algorithm_variables[s_algo.name.value]))
+
+    tables: set[Symbol] = set()
+    for statements, algo_variables in algorithms:
+        candidates = {symbol for symbol in algo_variables.symbols.values()
+                      if symbol.kind == VARIABLE_KIND and isinstance(symbol.type, TableType)
+                      and isinstance(symbol.type.type, BaseType) and symbol.type.type.value in custom_types}
+        if not candidates:
+            continue
+
+        uses = {symbol: 0 for symbol in candidates}
+        field_accesses = {symbol: 0 for symbol in candidates}
+        for statement in statements:
+            for node in walk(statement):
+                if isinstance(node, ID) and node.binding in uses:
+                    uses[node.binding] += 1
+                elif isinstance(node, AttributeExpression) and isinstance(node.expression, TableExpression):
+                    table = node.expression.table_expression
+                    if isinstance(table, ID) and table.binding in field_accesses:
+                        if len(node.expression.indexes) == len(table.binding.type.ranges):
+                            field_accesses[table.binding] += 1
+
+        tables.update(symbol for symbol in candidates if uses[symbol] == field_accesses[symbol])
+
+    return tables
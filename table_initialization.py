@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import Optional
+
+from ast_nodes import ID, AssignmentStatement, Expression, LitBool, LitChar, LitFloat, LitInt, PourStatement, Program, SiStatement, Statement, TableExpression, TableInitializationStatement, TableType, TantQueStatement
+
+LITERAL_TYPES = (LitInt, LitFloat, LitChar, LitBool)
+
+
+def get_flat_index(table_type: TableType, indexes: list[Expression]) -> Optional[int]:
+    # The position of an element in the table, in row-major order, if its indexes are literals within the bounds
+    flat_index = 0
+    for table_range, index in zip(table_type.ranges, indexes):
+        if not isinstance(index, LitInt) or table_range.end is None:
+            return None
+        if not table_range.start.int_value <= index.int_value < table_range.end.int_value:
+            return None
+        flat_index = flat_index * (table_range.end.int_value - table_range.start.int_value) + index.int_value - table_range.start.int_value
+
+    return flat_index
+
+def get_constant_store(statement: Statement) -> Optional[tuple[ID, int]]:
+    # The table and element position of an assignment of a literal to a table element with literal indexes
+    if not isinstance(statement, AssignmentStatement) or not isinstance(statement.right, LITERAL_TYPES):
+        return None
+
+    left = statement.left
+    if not isinstance(left, TableExpression) or not isinstance(left.table_expression, ID):
+        return None
+
+    table = left.table_expression
+    if table.binding is None or not isinstance(table.binding.type, TableType) or len(left.indexes) != len(table.binding.type.ranges):
+        return None
+
+    flat_index = get_flat_index(table.binding.type, left.indexes)
+    if flat_index is None:
+        return None
+
+    return table, flat_index
+
+
+class TableInitializationPass:
+    # Replaces runs of assignments of literals to consecutive elements of a table (tab[0] <-- 1, tab[1] <-- 5, ...)
+    # by a TableInitializationStatement, which is generated as a single copy. A run stops at the first store that
+    # isn't to the next element, so stores whose indexes are out of order or repeated are kept as they are.
+
+    def __init__(self, min_run_length: int) -> None:
+        self.min_run_length = min_run_length
+        self.nb_coalesced_stores = 0
+
+    def run(self, program: Program):
+        program.main_algorithm.statements = self.coalesce_statements(program.main_algorithm.statements)
+        for s_algo in program.sub_algorithms_list:
+            s_algo.statements = self.coalesce_statements(s_algo.statements)
+
+    def coalesce_statements(self, statements: list[Statement]) -> list[Statement]:
+        result: list[Statement] = []
+        run: list[AssignmentStatement] = []
+        run_table: Optional[ID] = None
+        run_end = 0
+
+        for statement in statements:
+            self.coalesce_blocks(statement)
+
+            store = get_constant_store(statement)
+            if store is not None and run and store[0].binding is run_table.binding and store[1] == run_end:
+                run.append(statement)
+                run_end += 1
+                continue
+
+            result += self.end_run(run)
+            run = []
+            if store is not None:
+                run = [statement]
+                run_table, run_end = store[0], store[1] + 1
+            else:
+                result.append(statement)
+
+        result += self.end_run(run)
+        return result
+
+    def end_run(self, run: list[AssignmentStatement]) -> list[Statement]:
+        if len(run) < self.min_run_length:
+            return list(run)
+
+        self.nb_coalesced_stores += len(run)
+        first_store = run[0].left
+        assert isinstance(first_store, TableExpression)
+        table = first_store.table_expression
+        assert isinstance(table, ID)
+
+        return [TableInitializationStatement(table, first_store.indexes, [store.right for store in run], s=run[0])]
+
+    def coalesce_blocks(self, statement: Statement):
+        if isinstance(statement, (PourStatement, TantQueStatement)):
+            statement.statements = self.coalesce_statements(statement.statements)
+        elif isinstance(statement, SiStatement):
+            for conditional_block in statement.conditional_blocks:
+                conditional_block.statements = self.coalesce_statements(conditional_block.statements)
+            statement.default_block = self.coalesce_statements(statement.default_block)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import Optional
+
+from ast_nodes import *
+from data_flow import get_root_symbol
+from program_variables import AlgorithmVariables, ProgramVariables, Symbol
+
+
+def get_tail_statements(statements: list[Statement]) -> list[Statement]:
+    # The statements after which the sub-algorithm ends: the last one, or the last ones of the blocks of a last si
+    if not statements:
+        return []
+    last = statements[-1]
+    if not isinstance(last, SiStatement):
+        return [last]
+
+    result = []
+    for conditional_block in last.conditional_blocks:
+        result += get_tail_statements(conditional_block.statements)
+    return result + get_tail_statements(last.default_block)
+
+
+def find_tail_calls(program: Program, program_variables: ProgramVariables, pointer_inputs: dict[str, set[str]]) -> dict[str, set[int]]:
+    # The calls of each sub-algorithm to itself, by id of the statement, that can jump back to the start of the C
+    # function with new values of its inputs instead of calling it again. Such a call is the last statement run,
+    # and gives the sub-algorithm's own outputs (or assigns the single output to the returned value).
+    # The local variables are reused by the next run, so none of them can be pointed to, and the tables (as well as
+    # the articles passed by pointer) must be passed on unchanged: their parameters aren't copies.
+    tail_calls: dict[str, set[int]] = {}
+    for s_algo in program.sub_algorithms_list:
+        name = s_algo.name.value
+        algo_variables = program_variables.sub_algorithm_variables[name]
+        if any(isinstance(node, UnaryPointer) and get_root_symbol(node.expression) is not None for statement in s_algo.statements for node in walk(statement)):
+            continue
+
+        calls = {id(statement) for statement in get_tail_statements(s_algo.statements) if is_tail_call(statement, s_algo, algo_variables, pointer_inputs[name])}
+        if calls:
+            tail_calls[name] = calls
+
+    return tail_calls
+
+def get_self_call(statement: Statement, s_algo: SubAlgorithm) -> Optional[tuple[list[Expression], list[Expression]]]:
+    # The inputs and outputs of a call to the sub-algorithm itself
+    name = s_algo.name.value
+    if isinstance(statement, FunctionStatement) and statement.name.value == name:
+        return statement.inputs, statement.outputs
+    if isinstance(statement, AssignmentStatement) and isinstance(statement.right, FunctionExpression) and statement.right.name.value == name:
+        return statement.right.inputs, [statement.left]
+    return None
+
+def is_tail_call(statement: Statement, s_algo: SubAlgorithm, algo_variables: AlgorithmVariables, pointer_inputs: set[str]) -> bool:
+    call = get_self_call(statement, s_algo)
+    if call is None:
+        return False
+    inputs, outputs = call
+
+    if len(outputs) != len(s_algo.outputs):
+        return False
+    for output, output_decl in zip(outputs, s_algo.outputs):
+        if not is_parameter(output, algo_variables.symbols[output_decl.name.value]):
+            return False
+
+    for input, input_decl in zip(inputs, s_algo.inputs):
+        if isinstance(input_decl.type, TableType) or input_decl.name.value in pointer_inputs:
+            if not is_parameter(input, algo_variables.symbols[input_decl.name.value]):
+                return False
+
+    return True
+
+def is_parameter(expression: Expression, symbol: Symbol) -> bool:
+    return isinstance(expression, ID) and expression.binding is symbol
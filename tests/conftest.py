@@ -0,0 +1,95 @@
+import os
+import shutil
+import subprocess
+import sys
+from typing import cast
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ast_nodes import BaseType, LitInt, Program, TableType
+from compiler import MyCompiler
+from compiler_options import CompilerOptions
+from lexer import MyLexer
+from parser import MyParser
+
+# The programs compiled by the tests print the final values of the variables of the main algorithm. Only printf is
+# declared, so that the sub-algorithms can have the name of any other function of the C library.
+PRINTF_DECLARATION = "int printf(const char *format, ...);\n"
+
+PRINT_FORMATS = {
+    "entier"   : "%d",
+    "réel"     : "%.9g",
+    "caractère": "%c",
+    "booléen"  : "%d",
+}
+
+requires_gcc = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc n'est pas installé")
+
+
+def parse(source_code: str) -> Program:
+    parser = MyParser(MyLexer())
+    program = parser.parse(source_code if source_code.endswith("\n") else source_code + "\n")
+    assert not parser.syntax_errors, "\n".join(str(e) for e in parser.syntax_errors)
+    return program
+
+def compile_to_c(source_code: str, **options) -> tuple[str, MyCompiler]:
+    compiler = MyCompiler(options=CompilerOptions(**options))
+    code, errors = compiler.compile(source_code)
+    assert not errors, "\n".join(str(e) for e in errors)
+    return code, compiler
+
+def print_statements(compiler: MyCompiler, code: str) -> str:
+    # The printf calls of the variables of base types and of the tables of base types, element by element. The
+    # temporaries added by the passes, whose names start with _, aren't printed.
+    result = ""
+    for var_decl in compiler.program.main_algorithm.variable_declarations:
+        var_type = var_decl.type
+        name = var_decl.name.value
+        if name.startswith("_"):
+            continue
+        if isinstance(var_type, BaseType) and var_type.value in PRINT_FORMATS:
+            result += f'  printf("{name}={PRINT_FORMATS[var_type.value]}\\n", {name});\n'
+        elif isinstance(var_type, TableType) and isinstance(var_type.type, BaseType) and var_type.type.value in PRINT_FORMATS:
+            # A rebased table is printed through its storage, which is indexed from 0
+            storage = f"_{name}_storage"
+            table = storage if storage in code else name
+            sizes = [cast(LitInt, table_range.end).int_value - table_range.start.int_value for table_range in var_type.ranges]
+            loops = "".join(f"for (int _k{k} = 0; _k{k} < {size}; _k{k}++) " for k, size in enumerate(sizes))
+            indexes = "".join(f"[_k{k}]" for k in range(len(sizes)))
+            result += f'  {loops}printf("{name}[%d]={PRINT_FORMATS[var_type.type.value]}\\n", _k{len(sizes) - 1}, {table}{indexes});\n'
+    return result
+
+
+def build_and_run(tmp_path, source_code: str, gcc_flags: tuple[str, ...], options: dict) -> subprocess.CompletedProcess:
+    code, compiler = compile_to_c(source_code, **options)
+    main_start = code.index("void main()")
+    main_end = code.index("\n}\n", main_start)
+    code = PRINTF_DECLARATION + code[:main_end] + "\n" + print_statements(compiler, code) + code[main_end:]
+    code = code.replace("void main()", "int main()")
+
+    c_path = tmp_path / "programme.c"
+    executable = tmp_path / "programme"
+    c_path.write_text(code)
+    compilation = subprocess.run(["gcc", *gcc_flags, "-o", str(executable), str(c_path), "-lm"], capture_output=True, text=True)
+    assert compilation.returncode == 0, compilation.stderr + "\n" + code
+
+    return subprocess.run([str(executable)], capture_output=True, text=True, timeout=60)
+
+
+@pytest.fixture
+def run_program(tmp_path):
+    # Compiles the program with the options and gcc, runs it, and gives what it printed and its exit status
+    def run(source_code: str, gcc_flags: tuple[str, ...] = ("-O0",), **options) -> tuple[str, int]:
+        execution = build_and_run(tmp_path, source_code, gcc_flags, options)
+        return execution.stdout, execution.returncode
+    return run
+
+@pytest.fixture
+def run_program_with_errors(tmp_path):
+    # The same, also giving what the program wrote to the error output
+    def run(source_code: str, gcc_flags: tuple[str, ...] = ("-O0",), **options) -> tuple[str, str, int]:
+        execution = build_and_run(tmp_path, source_code, gcc_flags, options)
+        return execution.stdout, execution.stderr, execution.returncode
+    return run
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+import pytest
+
+from ast_arena import NodeView
+from compiler import MyCompiler
+from compiler_options import CompilerOptions
+from lexer import MyLexer
+from parser import MyParser
+from python_backend import run_code
+from test_ast_serialization import PROGRAM
+from test_inlining import LOOPS
+from test_loop_invariants import INVARIANTS
+from test_python_backend import VECTORS
+
+# The bubble sort of exemple.txt
+BUBBLE_SORT = """algorithme tri
+    variables:
+        i, fin, temp: entier
+        tab: tableau[0..10] de entier
+    instructions:
+        pour i allant de 0 à 10
+            tab[i] <-- -i
+        finpour
+        pour fin allant de 9 à 0 par pas de -1
+            pour i allant de 0 à fin
+                si tab[i] > tab[i+1] faire
+                    temp <-- tab[i]
+                    tab[i] <-- tab[i+1]
+                    tab[i+1] <-- temp
+                finsi
+            finpour
+        finpour
+finalgo
+"""
+
+OPTIONS = [
+    {},
+    {"inline_threshold": 4},
+    {"struct_inputs_by_pointer": True, "restrict_tables": True},
+    {"reorder_struct_fields": True},
+    {"struct_of_arrays": True},
+    {"table_initialization_threshold": 2},
+    {"constant_folding": True},
+    {"hoist_loop_invariants": True},
+    {"eliminate_common_subexpressions": True},
+    {"rebase_tables": True},
+    {"parallelize_loops": True},
+    {"vectorize_loops": True},
+    {"interchange_loops": True},
+    {"full_unroll_threshold": 50},
+    {"unroll_factor": 4},
+    {"eliminate_tail_calls": True},
+    {"check_bounds": True},
+    {"compact_tables": True},
+    {"large_table_threshold": 16},
+]
+
+
+def flat_compiler(**options) -> MyCompiler:
+    return MyCompiler(parser=MyParser(MyLexer(), flat_ast=True), options=CompilerOptions(**options))
+
+def test_parser_gives_a_view():
+    assert isinstance(MyParser(MyLexer(), flat_ast=True).parse(BUBBLE_SORT), NodeView)
+
+@pytest.mark.parametrize("options", OPTIONS, ids=lambda options: ",".join(options) or "defaut")
+@pytest.mark.parametrize("source_code", [BUBBLE_SORT, PROGRAM, LOOPS, INVARIANTS, VECTORS], ids=["tri", "serialisation", "boucles", "invariants", "vecteurs"])
+def test_flat_program_compiles_to_the_same_c(source_code, options):
+    compiler = MyCompiler(options=CompilerOptions(**options))
+    code, errors = compiler.compile(source_code)
+    assert not errors
+    flat = flat_compiler(**options)
+    assert flat.compile(source_code) == (code, [])
+    assert flat.report == compiler.report
+
+@pytest.mark.parametrize("numpy_tables", [False, True], ids=["listes", "numpy"])
+def test_flat_program_runs_in_python(monkeypatch, numpy_tables):
+    monkeypatch.setattr(MyCompiler, "_python_code_cache", OrderedDict())
+    code, _ = MyCompiler(options=CompilerOptions(numpy_tables=numpy_tables)).compile_to_python(VECTORS)
+    values = run_code(code)
+    MyCompiler._python_code_cache.clear()
+    flat_code, errors = flat_compiler(numpy_tables=numpy_tables).compile_to_python(VECTORS)
+    assert not errors and flat_code is not code
+    assert repr(run_code(flat_code)) == repr(values)
@@ -0,0 +1,103 @@
+import pickle
+
+import pytest
+
+from ast_serialization import MAGIC, VERSION, decode_program, encode_program
+from compiler import MyCompiler
+from compiler_options import CompilerOptions
+from conftest import compile_to_c, parse
+from lexer import MyLexer
+from parser import MyParser
+from semantics import MySemantics
+
+PROGRAM = """algorithme serialisation
+    types:
+        point: article(x: réel, y: réel, nom: tableau[0..8] de caractère)
+    variables:
+        i, n: entier
+        r: réel
+        c: caractère
+        ok: booléen
+        t: tableau[-2..5, 0..3] de entier
+        p: point
+        q: pointeur sur point
+    instructions:
+        n <-- 5
+        r <-- 2500.5
+        c <-- 'z'
+        ok <-- non vrai
+        pour i allant de 4 à -2 par pas de -2
+            t[i, 1] <-- -i * 3 % 7
+        finpour
+        si n > 3 faire
+            p.x <-- r / 2.0
+        sinonsi n = 3 faire
+            p.y <-- 1.0
+        sinon faire
+            p.nom[0] <-- c
+        finsi
+        q <-- &p
+        (^q).y <-- p.x
+        tant que n > 0 faire
+            n <-- n - 1
+        fintq
+        carre(n ! r)
+finalgo
+
+sa carre
+pe:
+    x: entier
+ps:
+    y: réel
+variables:
+    k: entier
+instructions:
+    y <-- x * x
+finsa
+"""
+
+
+def test_round_trip_gives_the_same_tree():
+    program = parse(PROGRAM)
+    decoded = decode_program(encode_program(program))
+    assert decoded == program
+    assert encode_program(decoded) == encode_program(program)
+
+def test_round_trip_keeps_the_positions():
+    program = parse(PROGRAM)
+    decoded = decode_program(encode_program(program))
+    statement, decoded_statement = program.main_algorithm.statements[4], decoded.main_algorithm.statements[4]
+    assert (decoded_statement.lineno, decoded_statement.lexpos) == (statement.lineno, statement.lexpos)
+
+def test_decoded_program_passes_semantics():
+    parser = MyParser(MyLexer())
+    parser.parse(PROGRAM)
+    decoded = decode_program(encode_program(parse(PROGRAM)))
+    program_variables, errors = MySemantics(parser).verify_program_and_get_variables_or_errors(decoded)
+    assert errors is None
+    assert set(program_variables.sub_algorithms) == {"carre"}
+
+def test_decoded_program_compiles_to_the_same_c(monkeypatch):
+    # The passes change the decoded tree like the parsed one
+    options = {"constant_folding": True, "hoist_loop_invariants": True, "eliminate_common_subexpressions": True, "check_bounds": True}
+    code, _ = compile_to_c(PROGRAM, **options)
+
+    compiler = MyCompiler(options=CompilerOptions(**options))
+    parse_source = compiler.parser.parse
+    monkeypatch.setattr(compiler.parser, "parse", lambda source_code: decode_program(encode_program(parse_source(source_code))))
+    decoded_code, errors = compiler.compile(PROGRAM)
+    assert not errors
+    assert decoded_code == code
+
+def test_binary_format_is_smaller_than_pickle():
+    program = parse(PROGRAM)
+    assert len(encode_program(program)) < len(pickle.dumps(program))
+
+def test_other_data_is_rejected():
+    data = encode_program(parse(PROGRAM))
+    with pytest.raises(ValueError):
+        decode_program(b"PKL0" + data[len(MAGIC):])
+
+    other_version = (VERSION + 1).to_bytes(2, "little")
+    with pytest.raises(ValueError):
+        decode_program(MAGIC + other_version + data[len(MAGIC) + 2:])
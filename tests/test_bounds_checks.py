@@ -0,0 +1,86 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# lit reads an element of a table parameter with an open dimension, whose end is the size passed by the call
+OPEN_DIMENSION = """algorithme ouvert
+    variables:
+        x, y: entier
+        t: tableau[0..3] de entier
+    instructions:
+        t[0] <-- 4
+        t[1] <-- 5
+        t[2] <-- 6
+        lit(t, INDICE ! x)
+        y <-- lit(t, 1)
+finalgo
+
+sa lit
+pe:
+    u: tableau[0..] de entier
+    n: entier
+ps:
+    v: entier
+variables:
+    k: entier
+instructions:
+    v <-- u[n]
+finsa
+"""
+
+# The accesses by the loop variables are within the bounds, the ones by j and by the loop variable shifted aren't known to be
+ELIMINATION = """algorithme elimination
+    variables:
+        i, j, s: entier
+        t: tableau[1..9] de entier
+        m: tableau[0..4, 0..3] de entier
+    instructions:
+        pour i allant de 1 à 9
+            t[i] <-- i * 2
+        finpour
+        pour i allant de 0 à 4
+            pour j allant de 0 à 3
+                m[i, j] <-- i + j
+            finpour
+        finpour
+        s <-- 0
+        pour i allant de 1 à 9
+            s <-- s + t[i] + t[i + 1]
+        finpour
+        j <-- DERNIER
+        s <-- s + m[3, j]
+finalgo
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [{}, {"inline_threshold": 4}], ids=["appel", "en_ligne"])
+def test_open_dimension_is_checked(run_program_with_errors, options):
+    output, errors, status = run_program_with_errors(OPEN_DIMENSION.replace("INDICE", "2"), check_bounds=True, **options)
+    assert (errors, status) == ("", 0) and "x=6\n" in output and "y=5\n" in output
+    output, errors, status = run_program_with_errors(OPEN_DIMENSION.replace("INDICE", "5"), check_bounds=True, **options)
+    assert (output, errors, status) == ("", "Ligne 22 : l'indice 5 est hors des bornes 0..3 du tableau\n", 1)
+
+def test_inlined_open_dimension_is_checked_with_the_size_of_the_argument():
+    code, compiler = compile_to_c(OPEN_DIMENSION.replace("INDICE", "2"), check_bounds=True, inline_threshold=4)
+    main_code = code[code.index("void main()"):]
+    assert "t[_verifier_indice(_lit_n, 0, 0 + 3, 22)]" in main_code and "(t)[_verifier_indice(((int)(1)), 0, 0 + 3, 22)]" in main_code
+    assert compiler.report["bounds_checks"] == {"checked": 3, "eliminated": 3}
+
+@requires_gcc
+def test_elimination_keeps_the_checks_that_fail(run_program_with_errors):
+    output, errors, status = run_program_with_errors(ELIMINATION.replace("DERNIER", "2"), check_bounds=True)
+    assert (output, errors, status) == ("", "Ligne 17 : l'indice 9 est hors des bornes 1..9 du tableau\n", 1)
+
+@requires_gcc
+def test_checks_left_pass(run_program_with_errors):
+    source_code = ELIMINATION.replace("DERNIER", "2").replace("t[i + 1]", "t[9 - i]")
+    output, errors, status = run_program_with_errors(source_code, check_bounds=True)
+    assert (errors, status) == ("", 0)
+    assert run_program_with_errors(source_code) == (output, errors, status)
+    _, errors, status = run_program_with_errors(source_code.replace("j <-- 2", "j <-- 3"), check_bounds=True)
+    assert (errors, status) == ("Ligne 20 : l'indice 3 est hors des bornes 0..3 du tableau\n", 1)
+
+def test_elimination_count():
+    _, compiler = compile_to_c(ELIMINATION.replace("DERNIER", "2"), check_bounds=True)
+    assert compiler.report["bounds_checks"] == {"checked": 2, "eliminated": 5}
@@ -0,0 +1,125 @@
+from conftest import compile_to_c, requires_gcc
+
+# The sub-algorithms can have the name of a function of the C library, whose header isn't included
+TABLE_INITIALIZATION = """algorithme initialisation
+    variables:
+        n: entier
+        t: tableau[0..6] de entier
+    instructions:
+        n <-- 2
+        t[0] <-- 4
+        t[1] <-- 8
+        t[2] <-- 15
+        t[3] <-- 16
+        t[4] <-- 23
+        t[5] <-- 42
+        strlen(t[n] ! n)
+finalgo
+
+sa strlen
+pe:
+    x: entier
+ps:
+    y: entier
+variables:
+    k: entier
+instructions:
+    y <-- x * 2
+finsa
+"""
+
+# The table of somme is allocated on the heap, and div is a function of stdlib.h
+LARGE_TABLES = """algorithme grands_tableaux
+    variables:
+        i, s, q: entier
+        t: tableau[0..300] de entier
+    instructions:
+        pour i allant de 0 à 300
+            t[i] <-- i * 7 % 13
+        finpour
+        somme(300 ! s)
+        div(s, 7 ! q)
+finalgo
+
+sa somme
+pe:
+    n: entier
+ps:
+    s: entier
+variables:
+    i: entier
+    u: tableau[0..300] de entier
+instructions:
+    s <-- 0
+    pour i allant de 0 à n
+        u[i] <-- i % 5
+        s <-- s + u[i]
+    finpour
+finsa
+
+sa div
+pe:
+    x, y: entier
+ps:
+    q: entier
+variables:
+    k: entier
+instructions:
+    q <-- x / y
+finsa
+"""
+
+# The last access is out of the bounds: the checked program stops with an error
+OUT_OF_BOUNDS = """algorithme bornes
+    variables:
+        i, q: entier
+        t: tableau[1..5] de entier
+    instructions:
+        pour i allant de 1 à 5
+            t[i] <-- i
+        finpour
+        div(t[4], 2 ! q)
+        i <-- q - 2
+        t[i] <-- 0
+finalgo
+
+sa div
+pe:
+    x, y: entier
+ps:
+    q: entier
+variables:
+    k: entier
+instructions:
+    q <-- x / y
+finsa
+"""
+
+
+@requires_gcc
+def test_table_initialization_with_library_names(run_program):
+    output, status = run_program(TABLE_INITIALIZATION)
+    assert status == 0
+    assert run_program(TABLE_INITIALIZATION, table_initialization_threshold=4) == (output, status)
+
+@requires_gcc
+def test_large_tables_with_library_names(run_program):
+    output, status = run_program(LARGE_TABLES)
+    assert status == 0
+    assert run_program(LARGE_TABLES, large_table_threshold=1000) == (output, status)
+
+@requires_gcc
+def test_bounds_check_with_library_names(run_program):
+    output, status = run_program(OUT_OF_BOUNDS.replace("q - 2", "q - 1"), check_bounds=True)
+    assert status == 0 and "q=2\n" in output
+    assert run_program(OUT_OF_BOUNDS, check_bounds=True) == ("", 1)
+
+def test_only_used_functions_are_declared():
+    code, _ = compile_to_c(TABLE_INITIALIZATION, table_initialization_threshold=4)
+    assert "#include <string.h>" not in code and "void *memcpy(" in code
+    code, _ = compile_to_c(TABLE_INITIALIZATION)
+    assert "memcpy" not in code
+    code, _ = compile_to_c(LARGE_TABLES, large_table_threshold=1000)
+    assert "#include <stdlib.h>" not in code and "void *malloc(" in code and "void free(" in code
+    code, _ = compile_to_c(OUT_OF_BOUNDS, check_bounds=True)
+    assert "#include" not in code.replace("#include <stddef.h>", "") and "int dprintf(" in code and "void exit(" in code
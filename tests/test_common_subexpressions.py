@@ -0,0 +1,72 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+from test_ast_arena import BUBBLE_SORT
+
+# Each write to i or j, by an assignment, as the output of a call or in one branch, must make the
+# addresses and indexes computed from it be computed again. The write to t[j], which is t[i + 1], goes through the
+# same element as the kept address.
+INTERVENING_WRITES = """algorithme sous_expressions
+    variables:
+        i, j, s: entier
+        t, u: tableau[0..10] de entier
+    instructions:
+        pour i allant de 0 à 10
+            t[i] <-- i
+        finpour
+        i <-- 2
+        j <-- 3
+        t[i + 1] <-- 5
+        s <-- t[i + 1] * 2
+        t[j] <-- 9
+        s <-- s + t[i + 1] + t[i + 1]
+        i <-- i + 1
+        t[i + 1] <-- t[i + 1] + s
+        s <-- s + t[i + 1] * (i + 1)
+        suivant(i ! i)
+        t[i + 1] <-- t[i + 1] - 1
+        s <-- s + t[i + 1]
+        si s > 0 faire
+            t[i * 2] <-- t[i * 2] + 1
+        sinon faire
+            i <-- 0
+        finsi
+        t[i * 2] <-- t[i * 2] + 3
+        pour j allant de 0 à 9
+            u[j + 1] <-- t[j + 1] - t[j]
+        finpour
+        j <-- 4
+        u[j - 1] <-- t[j - 1]
+        j <-- j + 2
+        u[j - 1] <-- t[j - 1]
+finalgo
+
+sa suivant
+pe:
+    x: entier
+ps:
+    y: entier
+variables:
+    k: entier
+instructions:
+    y <-- x + 2
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("source_code", [BUBBLE_SORT, INTERVENING_WRITES], ids=["tri", "ecritures"])
+def test_elimination_gives_the_same_output(run_program, source_code):
+    output, status = run_program(source_code)
+    assert status == 0
+    assert run_program(source_code, eliminate_common_subexpressions=True) == (output, status)
+
+def test_addresses_and_indexes_are_computed_again_after_a_write():
+    code, compiler = compile_to_c(INTERVENING_WRITES, eliminate_common_subexpressions=True)
+    assert compiler.report["common_subexpressions"] == {"addresses": 5, "indexes": 3, "removed": 12}
+    assert code.count("= &t[i + 1];") == 3 and code.count("= j - 1;") == 2
+
+def test_bubble_sort_addresses_are_reused():
+    code, compiler = compile_to_c(BUBBLE_SORT, eliminate_common_subexpressions=True)
+    assert compiler.report["common_subexpressions"] == {"addresses": 2, "indexes": 0, "removed": 4}
+    assert "_adr0 = &tab[i];" in code and "_adr1 = &tab[i + 1];" in code
@@ -0,0 +1,80 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# The values of a8 and b8 reach the limits of int8_t, and the ones of c16 and d16 those of int16_t without fitting in
+# int8_t. e32 and f, whose counter has no bound known at compile time, need an int, as do g, h and w, given to or by
+# a sub-algorithm, or computed from its parameters.
+VALUE_RANGES = """algorithme compacts
+    variables:
+        i, j, k, n: entier
+        a8: tableau[0..26] de entier
+        b8, c16: tableau[0..4] de entier
+        d16: tableau[0..10] de entier
+        e32: tableau[0..3] de entier
+        f: tableau[0..40] de entier
+        g, h: tableau[0..5] de entier
+    instructions:
+        pour i allant de 0 à 26
+            a8[i] <-- i * 9 - 128
+        finpour
+        b8[0] <-- 127
+        b8[1] <-- -128
+        b8[2] <-- a8[25] + 5
+        b8[3] <-- a8[0] % 7
+        c16[0] <-- 127
+        c16[1] <-- b8[0] + 1
+        c16[2] <-- -129
+        c16[3] <-- 32767
+        pour j allant de 0 à 10
+            d16[j] <-- (j - 5) * 6553
+        finpour
+        e32[0] <-- 32768
+        e32[1] <-- -32769
+        e32[2] <-- d16[9] * 2
+        k <-- 0
+        n <-- 0
+        tant que k < 40 faire
+            f[k] <-- n
+            n <-- n + k * 9
+            k <-- k + 1
+        fintq
+        pour i allant de 0 à 5
+            g[i] <-- i * 20
+        finpour
+        doubler(g ! h)
+        pour i allant de 0 à 5
+            g[i] <-- g[i] + h[i] / 2
+        finpour
+finalgo
+
+sa doubler
+pe:
+    u: tableau[0..5] de entier
+ps:
+    v: tableau[0..5] de entier
+variables:
+    i: entier
+    w: tableau[0..5] de entier
+instructions:
+    pour i allant de 0 à 5
+        w[i] <-- u[i] * 2
+        v[i] <-- w[i] + 100
+    finpour
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [{}, {"inline_threshold": 4}], ids=["appel", "en_ligne"])
+def test_compact_tables_give_the_same_output(run_program, options):
+    output, status = run_program(VALUE_RANGES, **options)
+    assert status == 0
+    assert "b8[0]=127\nb8[1]=-128\n" in output and "c16[1]=128\nc16[2]=-129\nc16[3]=32767\n" in output
+    assert "d16[0]=-32765\n" in output and "e32[0]=32768\ne32[1]=-32769\n" in output
+    assert run_program(VALUE_RANGES, compact_tables=True, **options) == (output, status)
+
+def test_no_value_is_truncated_by_the_chosen_types():
+    code, compiler = compile_to_c(VALUE_RANGES, compact_tables=True)
+    assert compiler.report["compact_tables"] == {"a8": "int8_t", "b8": "int8_t", "c16": "int16_t", "d16": "int16_t"}
+    assert "int8_t a8[26];" in code and "int16_t d16[10];" in code and "int e32[3];" in code and "int w[5];" in code
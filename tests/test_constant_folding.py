@@ -0,0 +1,61 @@
+from conftest import compile_to_c, requires_gcc
+
+# Divisions and remainders by negative literals truncate like C, the loops that don't run still set their variable to
+# the start, and the branches of constant conditions are removed
+LITERALS = """algorithme repliement
+    variables:
+        i, j, n, q, r, s: entier
+        x, y, z: réel
+        ok: booléen
+        t: tableau[0..10] de entier
+    instructions:
+        q <-- -7 / 2
+        r <-- -7 % 2
+        n <-- 7 / (-2) + 7 % (-2) * 100
+        s <-- (0 - 7) / (0 - 2) * 1000 + (-7) % (-2) * 10 + 2147483647 / -1000
+        x <-- 7 / 2 * 2.0 + 1.0 / 3
+        y <-- 16777216.0 + 1.0 + 0.5 * 3
+        z <-- -0.1 * 3 - (2.5 - 4)
+        ok <-- 1.5 <= 1.25 * 2
+        pour i allant de 5 à 5
+            s <-- s + 1
+        finpour
+        pour j allant de 0 à 10 par pas de -1
+            s <-- s + 100
+        finpour
+        pour i allant de 2 * 3 à 3 + 1 - 1
+            s <-- s + 1000
+        finpour
+        pour n allant de 0 à 10
+            t[n + 1 - 1] <-- n * 2 - (3 - 5)
+        finpour
+        si 2 > 3 faire
+            s <-- 0
+        sinonsi 1 + 1 = 2 faire
+            s <-- s + t[3 - 1 + 1]
+        sinon faire
+            s <-- -1
+        finsi
+        tant que faux faire
+            s <-- 0
+        fintq
+        si q < 0 faire
+            r <-- r + 10 / (5 - 5 + 1)
+        finsi
+finalgo
+"""
+
+
+@requires_gcc
+def test_folding_gives_the_same_output(run_program):
+    output, status = run_program(LITERALS)
+    assert status == 0 and "q=-3\nr=9\n" in output and "i=6\nj=0\n" in output
+    assert run_program(LITERALS, constant_folding=True) == (output, status)
+
+def test_operations_on_literals_are_computed():
+    code, compiler = compile_to_c(LITERALS, constant_folding=True)
+    main_code = code[code.index("void main()"):]
+    assert "q = -3;\n  r = -1;\n  n = 97;\n  s = -2144493;" in main_code
+    assert "i = 5;\n  j = 0;\n  i = 6;\n  for (n = 0;" in main_code
+    assert "t[n] = " in main_code and "s = s + t[3];\n  if (q < 0) {" in main_code and "while" not in main_code
+    assert compiler.report["constant_folding"] == 170
@@ -0,0 +1,165 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# A réel argument computed in double (with a literal) is converted to float by the call
+CONVERSIONS = """algorithme conversions
+    variables:
+        x, r, s: réel
+        n: entier
+    instructions:
+        x <-- 16777216.0
+        r <-- diff(x + 0.6, x)
+        s <-- moitie(7)
+        n <-- doubler(3)
+finalgo
+
+sa diff
+pe:
+    u, v: réel
+ps:
+    d: réel
+variables:
+    k: entier
+instructions:
+    d <-- u - v
+finsa
+
+sa moitie
+pe:
+    u: entier
+ps:
+    m: réel
+variables:
+    k: entier
+instructions:
+    m <-- u / 2.0
+finsa
+
+sa doubler
+pe:
+    u: entier
+ps:
+    m: entier
+variables:
+    k: entier
+instructions:
+    m <-- u * 2
+finsa
+"""
+
+LOOPS = """algorithme boucles
+    variables:
+        i, q, r, s: entier
+        t: tableau[0..20] de entier
+        m, moy: réel
+    instructions:
+        s <-- 0
+        m <-- 0.0
+        pour i allant de 0 à 20
+            t[i] <-- carre(i - 7)
+            division(t[i] + 3, 4 ! q, r)
+            s <-- s + q * 10 + r
+            moy <-- moyenne(t[i], i)
+            m <-- m + moy
+        finpour
+        echange(3, 9 ! q, r)
+finalgo
+
+sa carre
+pe:
+    x: entier
+ps:
+    y: entier
+variables:
+    k: entier
+instructions:
+    y <-- x * x
+finsa
+
+sa division
+pe:
+    u, v: entier
+ps:
+    q, r: entier
+variables:
+    k: entier
+instructions:
+    q <-- u / v
+    r <-- u % v
+finsa
+
+sa moyenne
+pe:
+    u, v: entier
+ps:
+    m: réel
+variables:
+    k: entier
+instructions:
+    m <-- (u + v) / 2.0
+finsa
+
+sa echange
+pe:
+    u, v: entier
+ps:
+    x, y: entier
+variables:
+    k: entier
+instructions:
+    x <-- v
+    y <-- u
+finsa
+"""
+
+# The first output changes the index of the second one, whose address is taken before the call
+OUTPUT_ADDRESSES = """algorithme adresses
+    variables:
+        i: entier
+        t: tableau[0..10] de entier
+    instructions:
+        pour i allant de 0 à 10
+            t[i] <-- 0
+        finpour
+        i <-- 0
+        ecrit(3 ! i, t[i])
+        ecrit(1 ! t[i - 4], i)
+finalgo
+
+sa ecrit
+pe:
+    u: entier
+ps:
+    x, y: entier
+variables:
+    k: entier
+instructions:
+    x <-- u + 2
+    y <-- 7
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("source_code", [CONVERSIONS, LOOPS, OUTPUT_ADDRESSES], ids=["conversions", "boucles", "adresses"])
+def test_inlining_gives_the_same_output(run_program, source_code):
+    output, status = run_program(source_code)
+    assert status == 0
+    assert run_program(source_code, inline_threshold=4) == (output, status)
+
+@requires_gcc
+def test_inlined_real_argument_is_converted_to_float(run_program):
+    output, _ = run_program(CONVERSIONS, inline_threshold=4)
+    assert "r=0\n" in output
+
+def test_calls_are_inlined():
+    code, compiler = compile_to_c(LOOPS, inline_threshold=4)
+    main_start = code.index("void main()")
+    main_code = code[main_start:code.index("\n}\n", main_start)]
+    assert "carre(" not in main_code and "moyenne(" not in main_code
+
+@requires_gcc
+def test_inlined_outputs_are_written_at_their_address_before_the_call(run_program):
+    output, _ = run_program(OUTPUT_ADDRESSES, inline_threshold=4)
+    assert "t[0]=7\n" in output and "t[5]=0\n" in output and "t[1]=3\n" in output and "i=7\n" in output
@@ -0,0 +1,131 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# Large tables in the main algorithm (static), in a sub-algorithm called recursively and in inlined ones (allocated
+# on the heap), of 1 and 2 dimensions, of articles, and with a non-zero lower bound
+LARGE_TABLES = """algorithme grands
+    types:
+        point: article(x: réel, n: entier)
+    variables:
+        i, s, r, f: entier
+        t: tableau[0..5000] de entier
+        c: tableau[-10..3000] de entier
+        pts: tableau[0..1000] de point
+    instructions:
+        t[0] <-- 3
+        t[1] <-- 1
+        t[2] <-- 4
+        t[3] <-- 1
+        pour i allant de 4 à 5000
+            t[i] <-- (t[i - 1] + t[i - 4]) % 1000
+        finpour
+        pour i allant de -10 à 3000
+            c[i] <-- i % 100
+        finpour
+        pour i allant de 0 à 1000
+            pts[i].n <-- i
+            pts[i].x <-- i * 0.5
+        finpour
+        somme(t, 5000 ! s)
+        recurre(6 ! r)
+        remplit(40 ! f)
+        s <-- s + c[-5] + c[2999] + pts[999].n
+finalgo
+
+sa somme
+pe:
+    t: tableau[0..5000] de entier
+    n: entier
+ps:
+    s: entier
+variables:
+    i: entier
+    m: tableau[0..50, 0..100] de entier
+instructions:
+    s <-- 0
+    pour i allant de 0 à n
+        m[i % 50, i % 100] <-- t[i]
+        s <-- s + m[i % 50, i % 100]
+    finpour
+finsa
+
+sa recurre
+pe:
+    n: entier
+ps:
+    r: entier
+variables:
+    i: entier
+    u: tableau[0..2000] de entier
+instructions:
+    pour i allant de 0 à 2000
+        u[i] <-- n * i
+    finpour
+    r <-- u[1999]
+    si n > 0 faire
+        recurre(n - 1 ! r)
+        r <-- r + u[1999]
+    finsi
+finsa
+
+sa remplit
+pe:
+    n: entier
+ps:
+    f: entier
+variables:
+    i: entier
+    v: tableau[0..3000] de entier
+instructions:
+    pour i allant de 0 à 3000
+        v[i] <-- i % n
+    finpour
+    f <-- v[2999] + v[41]
+finsa
+"""
+
+# A table of 800 TB, which can't be allocated on a 64 bits target
+TOO_LARGE = """algorithme trop_grand
+    variables:
+        f: entier
+    instructions:
+        remplit(3 ! f)
+finalgo
+
+sa remplit
+pe:
+    n: entier
+ps:
+    f: entier
+variables:
+    g: tableau[0..2000000000, 0..100000] de entier
+instructions:
+    g[1, 2] <-- n
+    f <-- g[1, 2]
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [
+    {},
+    {"inline_threshold": 4},
+    {"rebase_tables": True, "compact_tables": True, "struct_of_arrays": True},
+], ids=["seul", "en_ligne", "autres_passes"])
+def test_large_tables_give_the_same_output(run_program, options):
+    output, status = run_program(LARGE_TABLES, **options)
+    assert status == 0 and "r=41979\n" in output
+    assert run_program(LARGE_TABLES, large_table_threshold=4000, **options) == (output, status)
+
+def test_large_tables_are_static_or_allocated():
+    code, _ = compile_to_c(LARGE_TABLES, large_table_threshold=4000)
+    assert "static int t[5000];" in code and "static point pts[1000];" in code
+    assert "int (*m)[100] = _allouer_tableau(sizeof(int [50][100]), 38);" in code and "free(m);\n  return s;" in code
+    assert "static int c[3000 - -10];" in code and "int *u = _allouer_tableau(sizeof(int [2000]), 54);" in code
+
+@requires_gcc
+@pytest.mark.parametrize("options", [{}, {"inline_threshold": 4}], ids=["appel", "en_ligne"])
+def test_failed_allocation_stops_the_program(run_program_with_errors, options):
+    output, errors, status = run_program_with_errors(TOO_LARGE, large_table_threshold=4000, **options)
+    assert (output, errors, status) == ("", "Ligne 14 : mémoire insuffisante pour allouer un tableau de 800000000000000 octets\n", 1)
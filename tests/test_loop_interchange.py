@@ -0,0 +1,86 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# The nests going down the columns are interchanged when their iterations are independent or only sum an entier.
+# The ones computing p or x, whose result depends on the order, the one reading the previous row it writes, and the
+# one with a bound unknown at compile time whose variables are used after it, aren't.
+COLUMNS = """algorithme echange
+    variables:
+        i, j, n, s, p: entier
+        x: réel
+        m, d: tableau[0..6, 0..5] de entier
+        r: tableau[0..6, 0..5] de réel
+    instructions:
+        n <-- 6
+        pour j allant de 0 à 5
+            pour i allant de 0 à 6
+                m[i, j] <-- i * 7 - j * j
+                d[i, j] <-- 0
+            finpour
+        finpour
+        s <-- 0
+        p <-- 1
+        pour j allant de 0 à 5
+            pour i allant de 0 à 6
+                s <-- s + m[i, j] * (i + 1)
+            finpour
+        finpour
+        pour j allant de 0 à 5
+            pour i allant de 0 à 6
+                p <-- (p * 3 + m[i, j]) % 1000
+            finpour
+        finpour
+        pour j allant de 0 à 5
+            pour i allant de 0 à 6
+                r[i, j] <-- m[i, j] * 0.3
+            finpour
+        finpour
+        x <-- 0.0
+        pour j allant de 0 à 5
+            pour i allant de 0 à 6
+                x <-- x + r[i, j]
+            finpour
+        finpour
+        pour j allant de 0 à 5
+            pour i allant de 1 à 6
+                d[i, j] <-- m[i, j]
+                m[i, j] <-- m[i - 1, j] + 1
+            finpour
+        finpour
+        pour j allant de 0 à 5
+            pour i allant de 0 à n
+                d[i, j] <-- d[i, j] + i
+            finpour
+        finpour
+        s <-- s + i + j
+        transpose(m ! d)
+finalgo
+
+sa transpose
+pe:
+    m: tableau[0..6, 0..5] de entier
+ps:
+    d: tableau[0..6, 0..5] de entier
+variables:
+    i, j: entier
+instructions:
+    pour j allant de 0 à 5
+        pour i allant de 0 à 6
+            d[i, j] <-- m[i, j] - d[i, j]
+        finpour
+    finpour
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [{}, {"inline_threshold": 4}, {"hoist_loop_invariants": True}], ids=["seul", "en_ligne", "invariants"])
+def test_interchange_gives_the_same_output(run_program, options):
+    output, status = run_program(COLUMNS, **options)
+    assert status == 0
+    assert run_program(COLUMNS, interchange_loops=True, **options) == (output, status)
+
+def test_independent_nests_are_interchanged():
+    _, compiler = compile_to_c(COLUMNS, interchange_loops=True)
+    assert compiler.report["loop_interchange"] == ["echange:9", "echange:17", "echange:27", "transpose:61"]
@@ -0,0 +1,57 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# x + 0.6 is computed in double: rounding it to float before adding y changes the result
+REAL_WITH_LITERAL = """algorithme reels
+    variables:
+        i: entier
+        x, y, r: réel
+    instructions:
+        x <-- 16777216.0
+        pour i allant de 0 à 3
+            y <-- 1.0
+            r <-- x + 0.6 + y
+        finpour
+finalgo
+"""
+
+INVARIANTS = """algorithme invariants
+    variables:
+        i, j, n, s: entier
+        x, y, z: réel
+        t: tableau[0..10] de entier
+    instructions:
+        n <-- 7
+        s <-- 0
+        x <-- 1.5
+        y <-- 0.25
+        z <-- 0.0
+        pour i allant de 0 à n * 2 - 4
+            t[i] <-- n * 3 + i
+            s <-- s + (n - 2) * (n + 1) / 3
+            z <-- z + x * y - i
+            j <-- 0
+            tant que j < n / 2 faire
+                s <-- s + j * (n % 4)
+                j <-- j + 1
+            fintq
+        finpour
+finalgo
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("source_code", [REAL_WITH_LITERAL, INVARIANTS], ids=["reels", "invariants"])
+def test_hoisting_gives_the_same_output(run_program, source_code):
+    output, status = run_program(source_code)
+    assert status == 0
+    assert run_program(source_code, hoist_loop_invariants=True) == (output, status)
+
+def test_real_operation_with_literal_is_not_hoisted():
+    _, compiler = compile_to_c(REAL_WITH_LITERAL, hoist_loop_invariants=True)
+    assert compiler.report["loop_invariants"]["expressions"] == 0
+
+def test_invariants_are_hoisted():
+    _, compiler = compile_to_c(INVARIANTS, hoist_loop_invariants=True)
+    assert compiler.report["loop_invariants"] == {"bounds": 1, "expressions": 5}
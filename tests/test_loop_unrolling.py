@@ -0,0 +1,91 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# Positive and negative steps, iteration counts that aren't a multiple of the factor, empty and single iteration loops,
+# and the value of the counter after the loop
+PROGRAM = """algorithme deroule
+    variables:
+        i, j, s, p, n: entier
+        t: tableau[0..20] de entier
+        u: tableau[-10..10] de entier
+        m: tableau[0..4, 0..3] de entier
+        r: réel
+    instructions:
+        s <-- 0
+        pour i allant de 0 à 20
+            t[i] <-- i * i - 3
+        finpour
+        pour i allant de 9 à -11 par pas de -1
+            u[i] <-- -i + t[i + 10]
+        finpour
+        pour i allant de 19 à 0 par pas de -3
+            s <-- s + t[i] * i
+        finpour
+        n <-- i
+        pour i allant de 0 à 4
+            pour j allant de 0 à 3
+                m[i, j] <-- i * 10 - j
+            finpour
+        finpour
+        p <-- i + j
+        pour i allant de 5 à 5
+            s <-- s + 1000
+        finpour
+        p <-- p + i
+        pour i allant de 7 à 3 par pas de 2
+            s <-- s + 1000
+        finpour
+        p <-- p * 100 + i
+        r <-- 1.0
+        pour i allant de 1 à 12 par pas de 2
+            r <-- r * 1.5 + i
+            si i % 3 = 0 faire
+                s <-- s - i
+            finsi
+        finpour
+        j <-- 0
+        pour i allant de 0 à 10
+            j <-- j + 1
+            tant que non (j % 4 = 0) faire
+                j <-- j + 1
+            fintq
+        finpour
+        appel(3 ! s)
+finalgo
+
+sa appel
+pe:
+    k: entier
+ps:
+    q: entier
+variables:
+    w: entier
+    v: tableau[0..8] de entier
+instructions:
+    pour w allant de 7 à -1 par pas de -1
+        v[w] <-- w * k
+    finpour
+    q <-- w
+    pour w allant de 0 à 7
+        q <-- q + v[w]
+    finpour
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [
+    {"full_unroll_threshold": 64},
+    {"unroll_factor": 4},
+    {"unroll_factor": 3},
+    {"full_unroll_threshold": 8, "unroll_factor": 2},
+], ids=["complet", "facteur4", "facteur3", "mixte"])
+def test_unrolled_build_gives_the_same_output(run_program, options):
+    output, status = run_program(PROGRAM)
+    assert status == 0
+    assert run_program(PROGRAM, **options) == (output, status)
+
+def test_loops_are_unrolled():
+    _, compiler = compile_to_c(PROGRAM, full_unroll_threshold=8, unroll_factor=2)
+    assert compiler.report["loop_unrolling"]["full"] > 0 and compiler.report["loop_unrolling"]["partial"] > 0
@@ -0,0 +1,122 @@
+from conftest import compile_to_c, requires_gcc
+
+# Independent loops, loops carrying a dependence from one iteration to the next, reductions and calls
+PROGRAM = """algorithme test
+    variables:
+        i, j, k, s, p, t, n, c: entier
+        x: réel
+        ta: tableau[0..1000] de entier
+        tb: tableau[0..1000] de entier
+        m: tableau[0..50, 0..40] de entier
+        r: tableau[0..1000] de réel
+        mm: tableau[0..50] de tableau[0..40] de entier
+    instructions:
+        n <-- 1000
+        pour i allant de 0 à n
+            ta[i] <-- (i * 37) % 101
+        finpour
+        s <-- 0
+        p <-- 1
+        pour i allant de 0 à n
+            t <-- ta[i] * 2
+            tb[i] <-- t + 1
+            s <-- s + t - i
+            si ta[i] > 50 faire
+                s <-- s + 1
+            finsi
+        finpour
+        pour i allant de 1 à 20
+            p <-- p * (ta[i] % 3 + 1)
+        finpour
+        pour i allant de 0 à 50
+            pour j allant de 0 à 40
+                c <-- carre(ta[i + j])
+                m[i, j] <-- i * j + c
+            finpour
+        finpour
+        c <-- 0
+        pour i allant de 1 à n
+            ta[i] <-- ta[i - 1] + 1
+        finpour
+        pour i allant de 0 à n - 1
+            tb[i] <-- tb[i + 1]
+        finpour
+        x <-- 0.0
+        pour i allant de 0 à n
+            r[i] <-- 0.5 * i
+            x <-- x + r[i]
+        finpour
+        pour i allant de 0 à n
+            c <-- c + 1
+            tb[i] <-- c
+        finpour
+        pour k allant de 0 à 50
+            remplir(k ! mm[k])
+        finpour
+        pour k allant de 0 à 10
+            incr(k ! t)
+            tb[k] <-- t
+        finpour
+        n <-- somme(ta)
+        s <-- s + n + i + j + k + mm[7][3] + mm[50 - 1][40 - 1]
+finalgo
+
+sa carre
+pe:
+    v: entier
+ps:
+    w: entier
+variables:
+instructions:
+    w <-- v * v
+finsa
+
+sa remplir
+pe:
+    v: entier
+ps:
+    l: tableau[0..40] de entier
+variables:
+    q: entier
+instructions:
+    pour q allant de 0 à 40
+        l[q] <-- v + q
+    finpour
+finsa
+
+sa somme
+pe:
+    t: tableau[0..1000] de entier
+ps:
+    r: entier
+variables:
+    q: entier
+instructions:
+    r <-- 0
+    pour q allant de 0 à 1000
+        r <-- r + t[q]
+    finpour
+finsa
+
+sa incr
+pe:
+    v: entier
+ps:
+    w: entier
+variables:
+instructions:
+    w <-- v + 1
+finsa
+"""
+
+
+@requires_gcc
+def test_parallel_build_gives_the_same_output(run_program):
+    output, status = run_program(PROGRAM, gcc_flags=("-O2",))
+    assert status == 0
+    assert run_program(PROGRAM, gcc_flags=("-O2", "-fopenmp"), parallelize_loops=True) == (output, status)
+
+def test_only_independent_loops_are_parallel():
+    code, compiler = compile_to_c(PROGRAM, parallelize_loops=True)
+    assert compiler.report["parallel_loops"] == code.count("#pragma omp parallel for")
+    assert 0 < compiler.report["parallel_loops"] < code.count("for (")
@@ -0,0 +1,261 @@
+from collections import OrderedDict
+from typing import Any
+
+import pytest
+
+from ast_nodes import BaseType, TableType
+from compiler import MyCompiler
+from compiler_options import CompilerOptions
+from conftest import PRINT_FORMATS, compile_to_c, requires_gcc
+from python_backend import run_code
+from test_c_library import LARGE_TABLES
+from test_inlining import CONVERSIONS, LOOPS
+from test_loop_invariants import INVARIANTS, REAL_WITH_LITERAL
+from test_loop_unrolling import PROGRAM as UNROLLING
+from test_parallel_loops import PROGRAM as PARALLEL
+from test_tail_calls import PROGRAM as TAIL_CALLS
+
+BELOW_START = """algorithme bornes
+    variables:
+        i, x: entier
+        t: tableau[1..5] de entier
+        m: tableau[0..3, 2..4] de entier
+    instructions:
+        pour i allant de 1 à 5
+            t[i] <-- i * 10
+        finpour
+        m[2, 3] <-- 7
+        i <-- DEBUT
+        x <-- ACCES
+finalgo
+"""
+
+# The réels are C floats, computed in double with a literal, and the entiers 32 bits ints which wrap around
+NUMBERS = """algorithme nombres
+    variables:
+        i, n, h, p: entier
+        x, y, r, s, q, d, e: réel
+        egal: booléen
+        t: tableau[0..4] de réel
+    instructions:
+        x <-- 16777216.0
+        y <-- x + 1.0
+        r <-- x + 0.6 + 1.0
+        n <-- 16777217
+        e <-- n
+        d <-- x * n
+        q <-- 0.1
+        s <-- 0.0
+        pour i allant de 0 à 1000
+            s <-- s + q
+        finpour
+        t[0] <-- s / 3
+        t[1] <-- s / 3.0
+        t[2] <-- (s + n) * q
+        t[3] <-- -s * 1.5 - q
+        egal <-- faux
+        si e = x faire
+            egal <-- vrai
+        finsi
+        p <-- 2147483647
+        p <-- p + 1
+        h <-- 0
+        pour i allant de 0 à 100
+            h <-- h * 31 + i
+        finpour
+        n <-- -h * 7 / 3 % 1000
+finalgo
+"""
+
+# The element-wise loops run as NumPy operations: operations in double with a literal, entiers in operations on réels,
+# overflowing entiers
+VECTORS = """algorithme vecteurs
+    variables:
+        i, j, k, n, s: entier
+        x: réel
+        ta, tb, d: tableau[1..41] de entier
+        r, w, v: tableau[0..41] de réel
+        h: tableau[1..41] de entier
+        c: tableau[0..30] de caractère
+        f: tableau[0..30] de booléen
+        m: tableau[0..5, 0..20] de entier
+        e: tableau[0..5] de entier
+    instructions:
+        n <-- 17
+        x <-- 1.5
+        pour i allant de 1 à 41
+            ta[i] <-- i * 3 - 50
+        finpour
+        pour i allant de 40 à 0 par pas de -1
+            tb[i] <-- (ta[i] % 7) - ta[i] / 4 + n
+            d[i] <-- tb[i] * 2 - ta[41 - i]
+        finpour
+        pour i allant de 0 à 41
+            r[i] <-- i / 3.0 + x * 2
+        finpour
+        pour i allant de 1 à 41 par pas de 3
+            r[i] <-- r[i] + ta[i] * 0.25
+        finpour
+        pour i allant de 0 à 41
+            w[i] <-- r[i] * 0.1 - i
+        finpour
+        v[0] <-- 0.0
+        pour i allant de 1 à 41
+            v[i] <-- r[i] * ta[i] + x
+        finpour
+        pour i allant de 1 à 41
+            h[i] <-- ta[i] * 123456789 + tb[i] * 98765
+        finpour
+        pour i allant de 0 à 30
+            c[i] <-- 'a'
+        finpour
+        pour i allant de 0 à 30 par pas de 2
+            c[i] <-- 'z'
+        finpour
+        pour i allant de 0 à 30
+            f[i] <-- non (c[i] = 'z')
+        finpour
+        pour j allant de 0 à 5
+            pour k allant de 0 à 20
+                m[j, k] <-- j * 100 + k - ta[k + 1]
+            finpour
+        finpour
+        pour k allant de 0 à 20
+            m[3, k] <-- m[3, k] * 2 + m[1, k]
+        finpour
+        pour i allant de 0 à 5
+            e[i] <-- i
+        finpour
+        s <-- 0
+        pour i allant de 0 à n
+            s <-- s + ta[i + 1]
+        finpour
+        j <-- 0
+        pour i allant de 3 à n
+            d[i] <-- d[i] + 1
+        finpour
+        pour i allant de 5 à 3
+            d[i] <-- 0
+        finpour
+        ajoute(ta, n ! d)
+        k <-- dernier(c)
+finalgo
+
+sa ajoute
+pe:
+    u: tableau[1..41] de entier
+    n: entier
+ps:
+    v: tableau[1..41] de entier
+variables:
+    i: entier
+instructions:
+    pour i allant de 1 à n + 1
+        v[i] <-- v[i] + u[i] * n
+    finpour
+finsa
+
+sa dernier
+pe:
+    c: tableau[0..30] de caractère
+ps:
+    k: entier
+variables:
+    i: entier
+instructions:
+    k <-- 0
+    pour i allant de 0 à 30
+        si c[i] = 'z' faire
+            k <-- i
+        finsi
+    finpour
+finsa
+"""
+
+OVERFLOW = """algorithme debordement
+    variables:
+        i, x: entier
+        t: tableau[0..20] de entier
+    instructions:
+        x <-- 3
+        pour i allant de 0 à 20
+            x <-- x * x
+            t[i] <-- x
+        finpour
+finalgo
+"""
+
+
+def run_in_python(source_code: str, **options) -> dict:
+    code, errors = MyCompiler(options=CompilerOptions(**options)).compile_to_python(source_code)
+    assert not errors, "\n".join(str(e) for e in errors)
+    return run_code(code)
+
+def printed_values(source_code: str, values: dict[str, Any]) -> str:
+    # The values of the main algorithm printed like the C programs of the tests do
+    _, compiler = compile_to_c(source_code)
+    result = ""
+    for var_decl in compiler.program.main_algorithm.variable_declarations:
+        var_type = var_decl.type
+        name = var_decl.name.value
+        if isinstance(var_type, BaseType) and var_type.value in PRINT_FORMATS:
+            result += f"{name}={PRINT_FORMATS[var_type.value] % values[name]}\n"
+        elif isinstance(var_type, TableType) and isinstance(var_type.type, BaseType) and var_type.type.value in PRINT_FORMATS:
+            rows = [values[name]]
+            for _ in var_type.ranges[:-1]:
+                rows = [row for table in rows for row in table]
+            for row in rows:
+                result += "".join(f"{name}[{k}]={PRINT_FORMATS[var_type.type.value] % value}\n" for k, value in enumerate(row))
+    return result
+
+
+@pytest.mark.parametrize("numpy_tables", [False, True], ids=["listes", "numpy"])
+@pytest.mark.parametrize("start, access", [
+    ("0", "t[i]"),
+    ("5", "t[i]"),
+    ("-3", "t[i + 2]"),
+    ("1", "m[i, 1]"),
+    ("1", "m[i - 2, 3]"),
+])
+def test_index_out_of_the_range_is_an_error(numpy_tables, start, access):
+    source_code = BELOW_START.replace("DEBUT", start).replace("ACCES", access)
+    with pytest.raises(IndexError, match="hors des bornes"):
+        run_in_python(source_code, numpy_tables=numpy_tables)
+
+@pytest.mark.parametrize("numpy_tables", [False, True], ids=["listes", "numpy"])
+def test_index_in_the_range(numpy_tables):
+    source_code = BELOW_START.replace("DEBUT", "2").replace("ACCES", "t[i + 2] + m[i, 3]")
+    assert run_in_python(source_code, numpy_tables=numpy_tables)["x"] == 47
+
+@requires_gcc
+@pytest.mark.parametrize("numpy_tables", [False, True], ids=["listes", "numpy"])
+@pytest.mark.parametrize("source_code", [NUMBERS, VECTORS, OVERFLOW, CONVERSIONS, LOOPS, REAL_WITH_LITERAL, INVARIANTS, UNROLLING, PARALLEL, TAIL_CALLS, LARGE_TABLES],
+                         ids=["nombres", "vecteurs", "debordement", "conversions", "boucles", "reels", "invariants", "deroulement", "parallele", "terminal", "grands_tableaux"])
+def test_python_gives_the_c_output(run_program, source_code, numpy_tables):
+    # -O2 for the deep recursion, and -fwrapv so that the overflow of the C ints wraps around whatever the optimizations
+    output, status = run_program(source_code, gcc_flags=("-O2", "-fwrapv"))
+    assert status == 0
+    assert printed_values(source_code, run_in_python(source_code, numpy_tables=numpy_tables)) == output
+
+def test_element_wise_loops_are_vectorized():
+    compiler = MyCompiler(options=CompilerOptions(numpy_tables=True))
+    compiler.compile_to_python(VECTORS)
+    assert compiler.report["vectorized_loops"] >= 10
+
+def test_cached_program_keeps_its_report(monkeypatch):
+    monkeypatch.setattr(MyCompiler, "_python_code_cache", OrderedDict())
+    first = MyCompiler(options=CompilerOptions(numpy_tables=True))
+    code, _ = first.compile_to_python(LOOPS)
+    second = MyCompiler(options=CompilerOptions(numpy_tables=True))
+    assert second.compile_to_python(LOOPS)[0] is code
+    assert second.report == first.report and "vectorized_loops" in second.report
+
+def test_cache_drops_the_least_recently_used_program(monkeypatch):
+    monkeypatch.setattr(MyCompiler, "_python_code_cache", OrderedDict())
+    monkeypatch.setattr(MyCompiler, "PYTHON_CODE_CACHE_SIZE", 2)
+    codes = [MyCompiler().compile_to_python(source_code)[0] for source_code in (LOOPS, INVARIANTS)]
+    assert MyCompiler().compile_to_python(LOOPS)[0] is codes[0]
+    MyCompiler().compile_to_python(NUMBERS)
+    assert len(MyCompiler._python_code_cache) == 2
+    assert MyCompiler().compile_to_python(LOOPS)[0] is codes[0]
+    assert MyCompiler().compile_to_python(INVARIANTS)[0] is not codes[1]
@@ -0,0 +1,91 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# Tables of 1 to 3 dimensions with negative and positive lower bounds, read through a pointer, passed to
+# sub-algorithms with an open dimension, as an input and as an output
+LOWER_BOUNDS = """algorithme decalages
+    variables:
+        i, j, k, s: entier
+        u: tableau[5..20] de entier
+        v: tableau[-3..4] de réel
+        m: tableau[2..8, 1..4] de entier
+        c: tableau[1..3, -1..2, 0..2] de entier
+        w: tableau[1..9] de entier
+        p: pointeur sur tableau[5..20] de entier
+    instructions:
+        pour i allant de 5 à 20
+            u[i] <-- i * i
+        finpour
+        pour i allant de -3 à 4
+            v[i] <-- i * 0.5
+        finpour
+        pour i allant de 2 à 8
+            pour j allant de 1 à 4
+                m[i, j] <-- i * 10 + j
+            finpour
+        finpour
+        pour i allant de 1 à 3
+            pour j allant de -1 à 2
+                pour k allant de 0 à 2
+                    c[i, j, k] <-- i * 100 + j * 10 + k
+                finpour
+            finpour
+        finpour
+        w[1] <-- 7
+        w[2] <-- 8
+        w[3] <-- 9
+        w[4] <-- 10
+        p <-- &u
+        (^p)[6] <-- -6
+        somme(u, 3 ! s)
+        copie(m ! w)
+        s <-- s + c[2, -1, 1] + u[19]
+finalgo
+
+sa somme
+pe:
+    t: tableau[5..] de entier
+    n: entier
+ps:
+    s: entier
+variables:
+    i: entier
+instructions:
+    s <-- 0
+    pour i allant de 5 à 5 + n
+        s <-- s + t[i]
+    finpour
+finsa
+
+sa copie
+pe:
+    m: tableau[2..8, 1..4] de entier
+ps:
+    w: tableau[1..9] de entier
+variables:
+    i: entier
+instructions:
+    pour i allant de 5 à 9
+        w[i] <-- m[i - 2, 3]
+    finpour
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [
+    {},
+    {"inline_threshold": 4},
+    {"table_initialization_threshold": 3, "check_bounds": True},
+], ids=["seul", "en_ligne", "initialisation_bornes"])
+def test_rebasing_gives_the_same_output(run_program, options):
+    output, status = run_program(LOWER_BOUNDS, **options)
+    assert status == 0 and "s=620\n" in output
+    assert run_program(LOWER_BOUNDS, rebase_tables=True, **options) == (output, status)
+
+def test_tables_are_indexed_without_offset():
+    code, compiler = compile_to_c(LOWER_BOUNDS, rebase_tables=True)
+    assert compiler.report["rebased_tables"] == ["c", "m", "m", "t", "u", "v", "w", "w"]
+    assert "int (*const m)[4 - 1] = (int (*)[4 - 1])((int *)_m_storage - 7);" in code
+    assert "m[i][j] = i * 10 + j;" in code and "s = somme(15, _u_storage, 3);" in code
@@ -0,0 +1,46 @@
+import pytest
+
+from ast_nodes import ID, SiStatement, walk
+from compiler import MyCompiler
+from errors import IncompatibleAssignmentTypesError, UndeclaredVariableError
+from lexer import MyLexer
+from parser import MyParser
+from semantics import MySemantics
+
+# The statements of the sinon block are verified like the ones of the other blocks
+BRANCHES = """algorithme branches
+    variables:
+        n: entier
+        x: réel
+        ok: booléen
+    instructions:
+        n <-- 3
+        si n > 2 faire
+            x <-- 1.5
+        sinonsi n = 2 faire
+            x <-- 2.5
+        sinon faire
+            SINON
+        finsi
+finalgo
+"""
+
+
+@pytest.mark.parametrize("statement, error_class", [
+    ("ok <-- n + 1", IncompatibleAssignmentTypesError),
+    ("inconnu <-- 1", UndeclaredVariableError),
+])
+def test_error_in_sinon_block(statement, error_class):
+    code, errors = MyCompiler().compile(BRANCHES.replace("SINON", statement))
+    assert code == "" and len(errors) == 1
+    assert isinstance(errors[0], error_class) and str(errors[0]).startswith("Ligne 13,")
+
+def test_sinon_block_is_bound_and_typed():
+    parser = MyParser(MyLexer())
+    program = parser.parse(BRANCHES.replace("SINON", "ok <-- n > 1"))
+    _, errors = MySemantics(parser).verify_program_and_get_variables_or_errors(program)
+    assert errors is None
+    si_statement = next(node for node in walk(program) if isinstance(node, SiStatement))
+    ids = [node for statement in si_statement.default_block for node in walk(statement) if isinstance(node, ID)]
+    assert [node.value for node in ids] == ["ok", "n"]
+    assert all(node.binding is not None and node.expr_type is not None for node in ids)
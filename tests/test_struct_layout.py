@@ -0,0 +1,90 @@
+import subprocess
+
+from conftest import PRINTF_DECLARATION, compile_to_c, requires_gcc
+
+# Fields of every alignment, a nested article, a pointer and a table, all read and written by name
+ARTICLES = """algorithme disposition
+    types:
+        point: article(c: caractère, x: réel, ok: booléen, n: entier)
+        forme: article(nom: caractère, p: point, v: booléen, suivant: pointeur sur point, k: caractère, t: tableau[0..3] de caractère)
+    variables:
+        p: point
+        f: forme
+        c, k: caractère
+        x: réel
+        ok: booléen
+        n: entier
+    instructions:
+        p.c <-- 'q'
+        p.x <-- 2.5
+        p.ok <-- vrai
+        p.n <-- 7
+        f.nom <-- 'f'
+        f.p <-- p
+        f.v <-- faux
+        f.suivant <-- &p
+        f.k <-- 'k'
+        f.t[1] <-- 'z'
+        f.p.n <-- f.p.n + 1
+        (^f.suivant).x <-- 4.5
+        c <-- f.t[1]
+        k <-- f.k
+        x <-- p.x + f.p.x
+        ok <-- f.p.ok
+        n <-- f.p.n * 10 + p.n
+finalgo
+"""
+
+
+def measured_layouts(tmp_path, **options) -> tuple[dict[str, int], dict[str, list[tuple[str, int, int]]], dict]:
+    # The size of each article type and the offset and size of its fields, by declaration order, given by gcc
+    code, compiler = compile_to_c(ARTICLES, **options)
+    code = PRINTF_DECLARATION + code.replace("void main()", "void algorithme()")
+    code += "\nint main() {\n"
+    for custom_type in compiler.program_variables.custom_types:
+        name = custom_type.name.value
+        code += f'  printf("{name} %zu\\n", sizeof({name}));\n'
+        for attribute in custom_type.attributes:
+            field = attribute.name.value
+            code += f'  printf("{name}.{field} %zu %zu\\n", __builtin_offsetof({name}, {field}), sizeof((({name} *)0)->{field}));\n'
+    code += "  return 0;\n}\n"
+
+    c_path = tmp_path / "disposition.c"
+    executable = tmp_path / "disposition"
+    c_path.write_text(code)
+    compilation = subprocess.run(["gcc", "-o", str(executable), str(c_path)], capture_output=True, text=True)
+    assert compilation.returncode == 0, compilation.stderr + "\n" + code
+
+    sizes: dict[str, int] = {}
+    fields: dict[str, list[tuple[str, int, int]]] = {}
+    for line in subprocess.run([str(executable)], capture_output=True, text=True, check=True).stdout.splitlines():
+        name, *values = line.split()
+        if "." in name:
+            type_name, field = name.split(".")
+            fields.setdefault(type_name, []).append((field, int(values[0]), int(values[1])))
+        else:
+            sizes[name] = int(values[0])
+    return sizes, fields, compiler.report
+
+
+@requires_gcc
+def test_reported_sizes_are_the_ones_of_gcc(tmp_path):
+    sizes, _, _ = measured_layouts(tmp_path)
+    reordered_sizes, _, report = measured_layouts(tmp_path, reorder_struct_fields=True)
+    assert report["struct_layout"] == {name: (sizes[name], reordered_sizes[name]) for name in sizes}
+    assert report["struct_layout"] == {"point": (16, 12), "forme": (40, 32)}
+
+@requires_gcc
+def test_reordered_fields_leave_no_padding_between_them(tmp_path):
+    _, fields, _ = measured_layouts(tmp_path, reorder_struct_fields=True)
+    for type_fields in fields.values():
+        in_memory = sorted(type_fields, key=lambda field: field[1])
+        assert in_memory[0][1] == 0
+        for (_, offset, size), (_, next_offset, _) in zip(in_memory, in_memory[1:]):
+            assert next_offset == offset + size
+
+@requires_gcc
+def test_fields_are_accessed_by_name(run_program):
+    output, status = run_program(ARTICLES)
+    assert status == 0 and "c=z\nk=k\nx=7\nok=1\nn=87\n" in output
+    assert run_program(ARTICLES, reorder_struct_fields=True) == (output, status)
@@ -0,0 +1,63 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# pts and the table of somme are only accessed one field at a time, including a field table, autres is copied whole
+TABLES_OF_ARTICLES = """algorithme champs
+    types:
+        point: article(x: réel, n: entier, nom: tableau[0..4] de caractère)
+    variables:
+        i, s, m: entier
+        x: réel
+        c: caractère
+        q: point
+        pts, autres: tableau[0..20] de point
+    instructions:
+        pour i allant de 0 à 20
+            pts[i].x <-- i * 0.5
+            pts[i].n <-- i * i
+            pts[i].nom[1] <-- 'p'
+            autres[i].n <-- 20 - i
+        finpour
+        pts[3].nom[1] <-- 'z'
+        q <-- autres[4]
+        s <-- 0
+        x <-- 0.0
+        pour i allant de 0 à 20
+            s <-- s + pts[i].n * autres[i].n
+            x <-- x + pts[i].x
+        finpour
+        c <-- pts[3].nom[1]
+        somme(7 ! m)
+        s <-- s + q.n
+finalgo
+
+sa somme
+pe:
+    n: entier
+ps:
+    m: entier
+variables:
+    i: entier
+    t: tableau[0..10] de point
+instructions:
+    m <-- 0
+    pour i allant de 0 à n
+        t[i].n <-- i * 3
+        m <-- m + t[i].n
+    finpour
+finsa
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("options", [{}, {"inline_threshold": 4}], ids=["appel", "en_ligne"])
+def test_struct_of_arrays_gives_the_same_output(run_program, options):
+    output, status = run_program(TABLES_OF_ARTICLES, **options)
+    assert status == 0 and "m=63\n" in output and "c=z\n" in output
+    assert run_program(TABLES_OF_ARTICLES, struct_of_arrays=True, **options) == (output, status)
+
+def test_tables_accessed_by_field_are_split():
+    code, compiler = compile_to_c(TABLES_OF_ARTICLES, struct_of_arrays=True)
+    assert compiler.report["struct_of_arrays"] == ["pts", "t"]
+    assert "char pts__nom[20][4];" in code and "point autres[20];" in code
@@ -0,0 +1,87 @@
+import pytest
+
+from conftest import compile_to_c, requires_gcc
+
+# Runs starting at the first element (declaration initializer) or later (copy), of every base type, in a 2D table, in
+# the blocks of a loop, and stores out of order or repeated, which stop a run and stay as they are
+CONSTANT_STORES = """algorithme initialisations
+    variables:
+        i, s: entier
+        t, u: tableau[0..8] de entier
+        r: tableau[1..6] de réel
+        c: tableau[0..5] de caractère
+        f: tableau[0..4] de booléen
+        m: tableau[0..3, 0..3] de entier
+    instructions:
+        t[0] <-- 4
+        t[1] <-- 8
+        t[2] <-- 15
+        t[3] <-- 16
+        t[4] <-- 23
+        t[5] <-- 42
+        u[2] <-- 1
+        u[3] <-- 2
+        u[4] <-- 3
+        u[5] <-- 4
+        u[0] <-- 9
+        u[1] <-- 8
+        u[6] <-- 5
+        u[7] <-- 6
+        u[6] <-- 7
+        u[7] <-- 8
+        r[2] <-- 0.5
+        r[3] <-- -1.25
+        r[4] <-- 2.0
+        r[5] <-- 3.75
+        r[1] <-- 0.1
+        c[0] <-- 'n'
+        c[1] <-- 'f'
+        c[2] <-- '0'
+        c[3] <-- '4'
+        c[4] <-- '\\n'
+        f[1] <-- vrai
+        f[2] <-- faux
+        f[3] <-- vrai
+        f[0] <-- faux
+        m[0, 1] <-- 1
+        m[0, 2] <-- 2
+        m[1, 0] <-- 3
+        m[1, 1] <-- 4
+        m[2, 2] <-- 5
+        m[2, 1] <-- 6
+        m[2, 0] <-- 7
+        m[0, 0] <-- 0
+        m[1, 2] <-- 8
+        s <-- 0
+        pour i allant de 0 à 3
+            t[6] <-- i
+            t[7] <-- i + 1
+            u[8 - 1] <-- 1
+            si i = 2 faire
+                t[0] <-- 1
+                t[1] <-- 1
+                t[2] <-- 1
+            sinon faire
+                t[3] <-- 2
+                t[4] <-- 2
+                t[5] <-- 2
+            finsi
+            s <-- s + t[i] + t[i + 4]
+        finpour
+finalgo
+"""
+
+
+@requires_gcc
+@pytest.mark.parametrize("threshold", [2, 3, 5])
+def test_initializations_give_the_same_output(run_program, threshold):
+    output, status = run_program(CONSTANT_STORES)
+    assert status == 0
+    assert run_program(CONSTANT_STORES, table_initialization_threshold=threshold) == (output, status)
+
+def test_stores_out_of_order_or_repeated_are_kept():
+    code, compiler = compile_to_c(CONSTANT_STORES, table_initialization_threshold=3)
+    assert compiler.report["table_initialization"] == 32
+    assert "int t[8] = {4, 8, 15, 16, 23, 42};" in code and "memcpy(&u[2], _u_init0, sizeof(_u_init0));" in code
+    assert "u[6] = 5;\n  u[7] = 6;\n  u[6] = 7;\n  u[7] = 8;" in code
+    assert "m[2][2] = 5;\n  m[2][1] = 6;\n  m[2][0] = 7;\n  m[0][0] = 0;\n  m[1][2] = 8;" in code
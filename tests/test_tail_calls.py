@@ -0,0 +1,136 @@
+from conftest import compile_to_c, requires_gcc
+
+# somme recurses a million times, which overflows the stack when each call keeps its frame
+PROGRAM = """algorithme terminal
+    types:
+        paire: article(x: entier, y: entier)
+    variables:
+        g, s, f, k, q, r, c: entier
+        t: tableau[0..1000] de entier
+        pp: paire
+    instructions:
+        g <-- pgcd(1071, 462)
+        s <-- somme(1000000, 0)
+        f <-- fact(10)
+        pour k allant de 0 à 1000
+            t[k] <-- 3 * k + 1
+        finpour
+        k <-- cherche(t, 2101, 0, 1000)
+        divise(100, 7, 0 ! q, r)
+        pp.x <-- 5
+        pp.y <-- 0
+        c <-- compte(pp, 10)
+finalgo
+
+sa pgcd
+pe:
+    m, n: entier
+ps:
+    res: entier
+variables:
+instructions:
+    si n = 0 faire
+        res <-- m
+    sinon faire
+        res <-- pgcd(n, m % n)
+    finsi
+finsa
+
+sa somme
+pe:
+    n, acc: entier
+ps:
+    res: entier
+variables:
+instructions:
+    si n = 0 faire
+        res <-- acc
+    sinon faire
+        somme(n - 1, (acc + n % 7) % 1000 ! res)
+    finsi
+finsa
+
+sa fact
+pe:
+    n: entier
+ps:
+    res: entier
+variables:
+instructions:
+    si n <= 1 faire
+        res <-- 1
+    sinon faire
+        res <-- fact(n - 1)
+        res <-- res * n
+    finsi
+finsa
+
+sa cherche
+pe:
+    u: tableau[0..1000] de entier
+    v, lo, hi: entier
+ps:
+    res: entier
+variables:
+    mi: entier
+instructions:
+    si lo >= hi faire
+        res <-- -1
+    sinonsi u[(lo + hi) / 2] = v faire
+        res <-- (lo + hi) / 2
+    sinon faire
+        mi <-- (lo + hi) / 2
+        si u[mi] < v faire
+            res <-- cherche(u, v, mi + 1, hi)
+        sinon faire
+            res <-- cherche(u, v, lo, mi)
+        finsi
+    finsi
+finsa
+
+sa divise
+pe:
+    x, d, acc: entier
+ps:
+    quo, reste: entier
+variables:
+instructions:
+    si x < d faire
+        quo <-- acc
+        reste <-- x
+    sinon faire
+        divise(x - d, d, acc + 1 ! quo, reste)
+    finsi
+finsa
+
+sa compte
+pe:
+    p: paire
+    n: entier
+ps:
+    res: entier
+variables:
+    p2: paire
+instructions:
+    si n = 0 faire
+        res <-- p.x + p.y
+    sinon faire
+        p2.x <-- p.y
+        p2.y <-- p.x + 1
+        res <-- compte(p2, n - 1)
+    finsi
+finsa
+"""
+
+
+@requires_gcc
+def test_deep_tail_recursion_runs_without_stack(run_program):
+    # gcc -O2 turns the tail calls into jumps itself, which gives the reference output
+    output, status = run_program(PROGRAM, gcc_flags=("-O2",))
+    assert status == 0
+    assert "g=21\n" in output and "f=3628800\n" in output and "k=700\n" in output and "q=14\nr=2\n" in output
+    assert run_program(PROGRAM, eliminate_tail_calls=True) == (output, status)
+
+def test_tail_calls_are_found():
+    _, compiler = compile_to_c(PROGRAM, eliminate_tail_calls=True)
+    assert compiler.report["tail_calls"] == {"cherche": 2, "compte": 1, "divise": 1, "pgcd": 1, "somme": 1}
@@ -0,0 +1,240 @@
+from __future__ import annotations
+from typing import Any, cast
+
+from ast_nodes import *
+from constant_folding import INT_MAX, INT_MIN, c_divide
+from data_flow import get_root_symbol
+from program_variables import VARIABLE_KIND, AlgorithmVariables, ProgramVariables, Symbol
+
+Range = tuple[int, int]
+
+COMPACT_TYPES = (("int8_t", -2**7, 2**7 - 1), ("int16_t", -2**15, 2**15 - 1))
+COMPACT_TYPE_SIZES = {"int8_t": 1, "int16_t": 2}
+
+# The value of an expression reading a variable that isn't assigned anything yet
+BOTTOM = "bottom"
+
+# A value that could be anything, as what gives it isn't analyzed
+UNKNOWN = "unknown"
+
+
+def join_ranges(left: Range, right: Range) -> Range:
+    return min(left[0], right[0]), max(left[1], right[1])
+
+def widen_range(previous: Range, new: Range) -> Range:
+    # A bound that still moves goes to the next limit of an integer type, so that there are few steps left
+    thresholds = sorted([INT_MIN, INT_MAX] + [limit for _, min_value, max_value in COMPACT_TYPES for limit in (min_value, max_value)])
+    low = new[0] if new[0] >= previous[0] else max(limit for limit in thresholds if limit <= new[0])
+    high = new[1] if new[1] <= previous[1] else min(limit for limit in thresholds if limit >= new[1])
+    return low, high
+
+def is_entier(variable_type: Any) -> bool:
+    return isinstance(variable_type, BaseType) and variable_type.value == "entier"
+
+
+def find_compact_tables(program: Program, program_variables: ProgramVariables) -> dict[Symbol, str]:
+    # The local tables of entiers whose values all fit in a smaller C integer type, with that type
+    algorithms: list[tuple[list[Statement], AlgorithmVariables]] = [(program.main_algorithm.statements, program_variables.main_algorithm_variables)]
+    for s_algo in program.sub_algorithms_list:
+        algorithms.append((s_algo.statements, program_variables.sub_algorithm_variables[s_algo.name.value]))
+
+    tables: dict[Symbol, str] = {}
+    for statements, algo_variables in algorithms:
+        analysis = ValueRangeAnalysis(statements, algo_variables)
+        analysis.run()
+        for symbol in analysis.tables:
+            table_range = analysis.ranges.get(symbol)
+            if not isinstance(table_range, tuple):
+                continue
+            for type_name, min_value, max_value in COMPACT_TYPES:
+                if min_value <= table_range[0] and table_range[1] <= max_value:
+                    tables[symbol] = type_name
+                    break
+
+    return tables
+
+
+class ValueRangeAnalysis:
+    # Finds an interval containing every value that each entier variable of an algorithm, and each element of its
+    # local tables of entiers, can take. It doesn't follow the order of the statements: the interval of a variable
+    # covers the values of all the assignments to it, so it holds anywhere in the algorithm.
+    # The intervals are computed again until they don't change. The bounds that still move after a few rounds (like
+    # a counter in a tant que loop) jump to the limits of int8_t, int16_t, then int. The results of operations that
+    # could overflow or divide by 0 are unknown, as are the values given by sub-algorithms, pointers, articles and
+    # the parameters of the algorithm.
+    # A table is only analyzed if its elements can't be changed elsewhere than by its assignments: it isn't passed
+    # whole, and no element is pointed to or given as the output of a sub-algorithm.
+
+    NB_ROUNDS_BEFORE_WIDENING = 3
+
+    def __init__(self, statements: list[Statement], algo_variables: AlgorithmVariables) -> None:
+        self.statements = statements
+        self.algo_variables = algo_variables
+
+        self.ranges: dict[Symbol, Range | str] = {}
+        self.tables: set[Symbol] = set()
+
+        # The expressions assigned to each variable (or table element), and the pour loops assigning a variable
+        self.assignments: dict[Symbol, list[Expression]] = {}
+        self.loops: dict[Symbol, list[PourStatement]] = {}
+        self.unknown: set[Symbol] = set()
+
+    def run(self):
+        symbols = self.algo_variables.symbols.values()
+        self.tables = {symbol for symbol in symbols if symbol.kind == VARIABLE_KIND and isinstance(symbol.type, TableType)
+                       and is_entier(symbol.type.type) and all(table_range.end is not None for table_range in symbol.type.ranges)}
+        self.unknown = {symbol for symbol in symbols if symbol.kind != VARIABLE_KIND}
+
+        for statement in self.statements:
+            self.find_assignments(statement)
+        self.tables -= self.unknown
+
+        nb_rounds = 0
+        changed = True
+        while changed:
+            changed = False
+            nb_rounds += 1
+            for symbol in set(self.assignments) | set(self.loops) | self.unknown:
+                if self.ranges.get(symbol) == UNKNOWN:
+                    continue
+                new_range = self.get_assigned_range(symbol)
+                if new_range == BOTTOM or new_range == self.ranges.get(symbol, BOTTOM):
+                    continue
+                previous_range = self.ranges.get(symbol)
+                if nb_rounds > self.NB_ROUNDS_BEFORE_WIDENING and isinstance(previous_range, tuple) and isinstance(new_range, tuple):
+                    new_range = widen_range(previous_range, new_range)
+                self.ranges[symbol] = new_range
+                changed = True
+
+    def find_assignments(self, statement: Statement):
+        # The IDs of the tables whose elements are accessed, which aren't uses of the whole table
+        element_tables: set[int] = set()
+
+        for node in walk(statement):
+            if isinstance(node, AssignmentStatement):
+                left = node.left
+                if isinstance(left, ID) and left.binding is not None:
+                    self.assignments.setdefault(left.binding, []).append(node.right)
+                elif self.is_table_element(left):
+                    self.assignments.setdefault(cast(ID, cast(TableExpression, left).table_expression).binding, []).append(node.right)
+                else:
+                    self.add_unknown(left)
+            elif isinstance(node, PourStatement) and node.variable.binding is not None:
+                self.loops.setdefault(node.variable.binding, []).append(node)
+            elif isinstance(node, TableInitializationStatement) and node.table.binding is not None:
+                self.assignments.setdefault(node.table.binding, []).extend(node.values)
+                element_tables.add(id(node.table))
+            elif isinstance(node, FunctionStatement):
+                for output in node.outputs:
+                    self.add_unknown(output)
+            elif isinstance(node, UnaryPointer):
+                self.add_unknown(node.expression)
+
+            if self.is_table_element(node):
+                element_tables.add(id(cast(TableExpression, node).table_expression))
+            elif isinstance(node, ID) and node.binding in self.tables and id(node) not in element_tables:
+                self.unknown.add(node.binding)
+
+    def add_unknown(self, expression: Expression):
+        symbol = get_root_symbol(expression)
+        if symbol is not None:
+            self.unknown.add(symbol)
+
+    def is_table_element(self, expression: Expression) -> bool:
+        if not isinstance(expression, TableExpression) or not isinstance(expression.table_expression, ID):
+            return False
+        symbol = expression.table_expression.binding
+        return symbol in self.tables and len(expression.indexes) == len(cast(TableType, symbol.type).ranges)
+
+    def get_assigned_range(self, symbol: Symbol) -> Range | str:
+        if symbol in self.unknown or not (is_entier(symbol.type) or symbol in self.tables):
+            return UNKNOWN
+
+        result: Range | str = BOTTOM
+        values = [self.get_range(expression) for expression in self.assignments.get(symbol, [])]
+        for loop in self.loops.get(symbol, []):
+            values.append(self.get_loop_range(loop))
+
+        for value in values:
+            if value == UNKNOWN:
+                return UNKNOWN
+            if value == BOTTOM:
+                continue
+            result = value if result == BOTTOM else join_ranges(cast(Range, result), cast(Range, value))
+
+        return result
+
+    def get_loop_range(self, loop: PourStatement) -> Range | str:
+        # The values of the loop variable go from the start to the end, which the last one can pass by the step - 1
+        start = self.get_range(loop.start)
+        end = self.get_range(loop.end)
+        if UNKNOWN in (start, end):
+            return UNKNOWN
+        if BOTTOM in (start, end):
+            return BOTTOM
+
+        start, end = cast(Range, start), cast(Range, end)
+        step = loop.step.int_value if loop.step is not None else 1
+        if step > 0:
+            return self.checked((min(start[0], end[0]), max(start[1], end[1] + step - 1)))
+        return self.checked((min(start[0], end[0] + step + 1), max(start[1], end[1])))
+
+    @staticmethod
+    def checked(value_range: Range) -> Range | str:
+        # An operation going out of the values of an int overflows, and gives anything
+        if value_range[0] < INT_MIN or value_range[1] > INT_MAX:
+            return UNKNOWN
+        return value_range
+
+    def get_range(self, expression: Expression) -> Range | str:
+        if isinstance(expression, LitInt):
+            return expression.int_value, expression.int_value
+        if isinstance(expression, ID):
+            if expression.binding is None or not is_entier(expression.binding.type):
+                return UNKNOWN
+            return self.ranges.get(expression.binding, BOTTOM)
+        if self.is_table_element(expression):
+            table = cast(ID, cast(TableExpression, expression).table_expression)
+            return self.ranges.get(cast(Symbol, table.binding), BOTTOM)
+        if isinstance(expression, SubExpression):
+            return self.get_range(expression.expression)
+
+        if isinstance(expression, (UnaryPlus, UnaryMinus)):
+            operand = self.get_range(expression.expression)
+            if not isinstance(operand, tuple) or isinstance(expression, UnaryPlus):
+                return operand
+            return self.checked((-operand[1], -operand[0]))
+
+        if isinstance(expression, (BinaryPlus, BinaryMinus, BinaryTimes, BinaryDivide, BinaryModulo)):
+            left = self.get_range(expression.left)
+            right = self.get_range(expression.right)
+            # The remainder of anything is smaller than the divisor
+            if isinstance(expression, BinaryModulo) and left == UNKNOWN and isinstance(right, tuple):
+                left = INT_MIN, INT_MAX
+            if UNKNOWN in (left, right):
+                return UNKNOWN
+            if BOTTOM in (left, right):
+                return BOTTOM
+            return self.get_operation_range(expression, cast(Range, left), cast(Range, right))
+
+        return UNKNOWN
+
+    def get_operation_range(self, expression: BinaryOperation, left: Range, right: Range) -> Range | str:
+        if isinstance(expression, BinaryPlus):
+            return self.checked((left[0] + right[0], left[1] + right[1]))
+        if isinstance(expression, BinaryMinus):
+            return self.checked((left[0] - right[1], left[1] - right[0]))
+        if isinstance(expression, BinaryTimes):
+            products = [a * b for a in left for b in right]
+            return self.checked((min(products), max(products)))
+
+        if right[0] <= 0 <= right[1]:
+            return UNKNOWN
+        if isinstance(expression, BinaryDivide):
+            # The truncated quotient only moves one way with each operand, when the divisor keeps its sign
+            quotients = [c_divide(a, b) for a in left for b in right]
+            return self.checked((min(quotients), max(quotients)))
+
+        # The remainder has the sign of the dividend, and is smaller than the divisor
+        max_remainder = max(abs(right[0]), abs(right[1])) - 1
+        return (max(left[0], -max_remainder) if left[0] < 0 else 0), (min(left[1], max_remainder) if left[1] > 0 else 0)